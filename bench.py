@@ -1,8 +1,17 @@
+import gc
 import inspect
 import itertools
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+import types
 from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from decimal import Decimal
+from pathlib import Path
 from statistics import mean
 from timeit import timeit
 from typing import Annotated, Any, ClassVar, Self
@@ -10,7 +19,8 @@ from typing import Annotated, Any, ClassVar, Self
 from tabulate import tabulate
 from typer import Option, Typer
 
-from injection import inject, injectable
+from injection import Module, inject, injectable, mod, singleton
+from injection._core.module import InjectMetadata, SyncInjectedFunction
 
 
 @dataclass(frozen=True, slots=True)
@@ -84,6 +94,51 @@ class InjectBenchmark:
             instance = Benchmark.compare(reference, injected, number)
             yield BenchmarkResult(title, instance)
 
+            frozen_module = Module()
+            frozen_module.use(mod())
+            injected = frozen_module.inject(callable_)
+            frozen_module.freeze()
+            frozen = Benchmark.compare(reference, injected, number)
+            yield BenchmarkResult(f"{title} (frozen module)", frozen)
+
+    def measure_memory(self, number: int = 1) -> Iterator[tuple[str, str, str]]:
+        for title, callable_ in self.callables.items():
+            copies = tuple(_copy_function(callable_) for _ in range(max(number, 1)))
+            gc.collect()
+            tracemalloc.start()
+
+            try:
+                start = tracemalloc.take_snapshot()
+                injected = tuple(inject(function) for function in copies)
+                decorated = _bytes_since(start) / len(copies)
+
+                for function in injected:
+                    function()
+
+                called = _bytes_since(start) / len(copies)
+            finally:
+                tracemalloc.stop()
+
+            yield title, f"{decorated:.0f}B", f"{called:.0f}B"
+
+        yield "Injected function wrapper", f"{self._measure_wrapper(number):.0f}B", ""
+
+    @staticmethod
+    def _measure_wrapper(number: int = 1) -> float:
+        metadata = tuple(
+            InjectMetadata(_copy_function(function_with_0_dependency), False)
+            for _ in range(max(number, 1))
+        )
+        gc.collect()
+        tracemalloc.start()
+
+        try:
+            start = tracemalloc.take_snapshot()
+            wrappers = tuple(SyncInjectedFunction(m) for m in metadata)
+            return _bytes_since(start) / len(wrappers)
+        finally:
+            tracemalloc.stop()
+
     @classmethod
     def register(cls, wrapped: Callable[..., Any] = None, /, *, title: str):
         def decorator(wp):
@@ -93,6 +148,84 @@ class InjectBenchmark:
         return decorator(wrapped) if wrapped else decorator
 
 
+@dataclass(frozen=True, slots=True)
+class ImportTimeBenchmark:
+    package: ClassVar[str] = "bench_import_package"
+
+    def run(self, number: int = 1) -> Iterator[tuple[str, str, str]]:
+        for title, deferred in (("Eager", False), ("Deferred", True)):
+            with tempfile.TemporaryDirectory() as directory:
+                path = Path(directory)
+                self._write_package(path, number, deferred)
+                import_time, lookup_time = self._measure(path)
+
+            yield title, f"{import_time:.2f}ms", f"{lookup_time:.2f}ms"
+
+    def _measure(self, path: Path) -> tuple[Decimal, Decimal]:
+        code = (
+            "from time import perf_counter\n"
+            f"import {self.package} as package\n"
+            "start = perf_counter()\n"
+            "package.Class0 in package.module\n"
+            "print(perf_counter() - start)\n"
+        )
+        env = os.environ | {
+            "PYTHONPATH": os.pathsep.join((str(path), *sys.path)),
+        }
+        process = subprocess.run(
+            (sys.executable, "-X", "importtime", "-c", code),
+            capture_output=True,
+            check=True,
+            env=env,
+            text=True,
+        )
+        pattern = rf"^import time:\s*\d+ \|\s*(\d+) \| {self.package}$"
+        match = re.search(pattern, process.stderr, re.MULTILINE)
+        assert match is not None
+        import_time = Decimal(match.group(1)) / 1000
+        lookup_time = Decimal(process.stdout.strip()) * 1000
+        return import_time, lookup_time
+
+    @classmethod
+    def _write_package(cls, path: Path, number: int, deferred: bool) -> None:
+        lines = ["from injection import Module", "", "module = Module()"]
+
+        if deferred:
+            lines.append("module.defer_registration()")
+
+        lines.extend(("", "", "@module.injectable", "class Class0: ..."))
+
+        for i in range(1, number):
+            lines.extend(
+                (
+                    "",
+                    "",
+                    "@module.injectable",
+                    f"class Class{i}:",
+                    f"    def __init__(self, dependency: Class{i - 1}): ...",
+                )
+            )
+
+        (path / f"{cls.package}.py").write_text("\n".join(lines) + "\n")
+
+
+def _copy_function(function: Callable[..., Any]) -> Callable[..., Any]:
+    copy = types.FunctionType(
+        function.__code__,
+        function.__globals__,
+        function.__name__,
+        function.__defaults__,
+        function.__closure__,
+    )
+    copy.__annotations__ = function.__annotations__
+    return copy
+
+
+def _bytes_since(snapshot: tracemalloc.Snapshot) -> int:
+    statistics = tracemalloc.take_snapshot().compare_to(snapshot, "filename")
+    return sum(statistic.size_diff for statistic in statistics)
+
+
 @injectable
 class A: ...
 
@@ -113,6 +246,26 @@ class D: ...
 class E: ...
 
 
+@singleton
+class SingletonA: ...
+
+
+@singleton
+class SingletonB: ...
+
+
+@singleton
+class SingletonC: ...
+
+
+@singleton
+class SingletonD: ...
+
+
+@singleton
+class SingletonE: ...
+
+
 @InjectBenchmark.register(title="0 dependency")
 def function_with_0_dependency(): ...
 
@@ -137,12 +290,39 @@ def function_with_4_dependencies(__a: A, __b: B, __c: C, __d: D): ...
 def function_with_5_dependencies(__a: A, __b: B, __c: C, __d: D, __e: E): ...
 
 
+@InjectBenchmark.register(title="5 singleton dependencies")
+def function_with_5_singleton_dependencies(
+    __a: SingletonA,
+    __b: SingletonB,
+    __c: SingletonC,
+    __d: SingletonD,
+    __e: SingletonE,
+): ...
+
+
 cli = Typer()
 
 
 @cli.command()
-def main(number: Annotated[int, Option("--number", "-n", min=0)] = 1000):
+def main(
+    number: Annotated[int, Option("--number", "-n", min=0)] = 1000,
+    memory: Annotated[bool, Option("--memory", "-m")] = False,
+    import_time: Annotated[bool, Option("--import-time", "-i")] = False,
+):
+    if import_time:
+        data = ImportTimeBenchmark().run(number)
+        headers = ("", "Import Time (ms)", "First Lookup Time (ms)")
+        print(tabulate(data, headers=headers))
+        return
+
     benchmark = InjectBenchmark()
+
+    if memory:
+        data = benchmark.measure_memory(number)
+        headers = ("", "Decorated (bytes/function)", "Called (bytes/function)")
+        print(tabulate(data, headers=headers))
+        return
+
     results = benchmark.run(number)
     headers = ("", "Reference Time (μs)", "@inject Time (μs)", "Difference Rate (×)")
     data = (result.row for result in itertools.chain(results))
@@ -1,14 +1,31 @@
+from ._core.common.pool import PoolMetrics, ResourcePool
+from ._core.common.proxy import Lazy
 from ._core.descriptors import LazyInstance
-from ._core.injectables import Injectable
+from ._core.injectables import (
+    Injectable,
+    Key,
+    KeyedInjectable,
+    PooledInjectable,
+    PooledScopedInjectable,
+    TTLInjectable,
+)
 from ._core.module import Mode, Module, Priority, mod
 from ._core.scope import adefine_scope, define_scope
 
 __all__ = (
     "Injectable",
+    "Key",
+    "KeyedInjectable",
+    "Lazy",
     "LazyInstance",
     "Mode",
     "Module",
+    "PoolMetrics",
+    "PooledInjectable",
+    "PooledScopedInjectable",
     "Priority",
+    "ResourcePool",
+    "TTLInjectable",
     "adefine_scope",
     "afind_instance",
     "aget_instance",
@@ -21,6 +38,7 @@ __all__ = (
     "inject",
     "injectable",
     "mod",
+    "per_resolution",
     "scoped",
     "set_constant",
     "should_be_injectable",
@@ -36,6 +54,7 @@ get_instance = mod().get_instance
 get_lazy_instance = mod().get_lazy_instance
 inject = mod().inject
 injectable = mod().injectable
+per_resolution = mod().per_resolution
 scoped = mod().scoped
 set_constant = mod().set_constant
 should_be_injectable = mod().should_be_injectable
@@ -1,15 +1,38 @@
 from abc import abstractmethod
-from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Hashable,
+    Iterator,
+    Mapping,
+)
 from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
 from enum import Enum
 from logging import Logger
-from typing import Any, Final, Protocol, Self, final, overload, runtime_checkable
+from typing import (
+    Any,
+    Final,
+    NamedTuple,
+    NoReturn,
+    Protocol,
+    Self,
+    final,
+    overload,
+    runtime_checkable,
+)
 
 from ._core.common.invertible import Invertible as _Invertible
+from ._core.common.memory import FreezeReport as _FreezeReport
 from ._core.common.type import InputType as _InputType
 from ._core.common.type import TypeInfo as _TypeInfo
+from ._core.graph import DependencyGraph as _DependencyGraph
 from ._core.module import InjectableFactory as _InjectableFactory
 from ._core.module import ModeStr, PriorityStr
+from ._core.module import Record as _Record
+from ._core.warmup import WarmupReport as _WarmupReport
 
 __MODULE: Final[Module] = ...
 
@@ -22,6 +45,7 @@ get_instance = __MODULE.get_instance
 get_lazy_instance = __MODULE.get_lazy_instance
 inject = __MODULE.inject
 injectable = __MODULE.injectable
+per_resolution = __MODULE.per_resolution
 scoped = __MODULE.scoped
 set_constant = __MODULE.set_constant
 should_be_injectable = __MODULE.should_be_injectable
@@ -35,6 +59,9 @@ def mod(name: str = ..., /) -> Module:
     """
     Short syntax for `Module.from_name`.
     """
+
+type Lazy[T] = T
+
 @runtime_checkable
 class Injectable[T](Protocol):
     @property
@@ -45,6 +72,196 @@ class Injectable[T](Protocol):
     @abstractmethod
     def get_instance(self) -> T: ...
 
+class PoolMetrics(NamedTuple):
+    max_size: int
+    size: int
+    idle: int
+    hits: int
+    misses: int
+    waits: int
+    wait_time: float
+    discarded: int
+    evicted: int
+
+    @property
+    def in_use(self) -> int: ...
+
+class ResourcePool[T]:
+    """
+    Bounded pool of resources, created on demand by the factory passed to `acquire`.
+    When all resources are in use, `acquire` blocks and `aacquire` waits without
+    blocking the event loop, then both raise a `PoolTimeoutError` after `timeout`
+    seconds. On release, `reset` is called on the resource; if it raises, the
+    resource is discarded. Resources idle for more than `idle_timeout` seconds are
+    evicted. `close` is called on each evicted or discarded resource.
+
+    Example: ResourcePool(max_size=10, idle_timeout=300, close=Connection.close)
+    """
+
+    max_size: int
+    timeout: float | None
+    idle_timeout: float | None
+    reset: Callable[[T], Any] | None
+    close: Callable[[T], Any] | None
+
+    def __init__(
+        self,
+        *,
+        max_size: int = ...,
+        timeout: float | None = ...,
+        idle_timeout: float | None = ...,
+        reset: Callable[[T], Any] | None = ...,
+        close: Callable[[T], Any] | None = ...,
+    ) -> None: ...
+    @property
+    def metrics(self) -> PoolMetrics: ...
+    def acquire(self, factory: Callable[[], T]) -> T: ...
+    async def aacquire(self, factory: Callable[[], Awaitable[T]]) -> T: ...
+    def release(self, resource: T) -> None: ...
+    @contextmanager
+    def releasing(self, resource: T) -> Iterator[T]:
+        """
+        Context manager releasing the resource on exit.
+        """
+
+    def detach(self) -> None:
+        """
+        Free the slot of an acquired resource that won't be released, without closing
+        it.
+        """
+
+    def clear(self) -> None:
+        """
+        Close and remove the idle resources, counted as evicted.
+        """
+
+class PooledInjectable[T](Injectable[T]):
+    """
+    Injectable handing out instances from a bounded pool. An instance is borrowed for
+    the duration of the outermost injected call (or of the scope named `scope_name`),
+    then `reset` is called on it and it goes back to the pool. When the pool is
+    exhausted, the resolution waits up to `timeout` seconds, then raises a
+    `PoolTimeoutError`. Instances injected into a cached instance, like a singleton,
+    are removed from the pool.
+
+    Example: @injectable(cls=partial(PooledInjectable, max_size=4, reset=Parser.reset))
+    """
+
+    max_size: int
+    reset: Callable[[T], Any] | None
+    scope_name: str | None
+    timeout: float | None
+
+    def __init__(
+        self,
+        factory: Any,
+        *,
+        max_size: int = ...,
+        reset: Callable[[T], Any] | None = ...,
+        scope_name: str | None = ...,
+        timeout: float | None = ...,
+    ) -> None: ...
+    @property
+    def metrics(self) -> PoolMetrics: ...
+    async def aget_instance(self) -> T: ...
+    def get_instance(self) -> T: ...
+
+class PooledScopedInjectable[T](Injectable[T]):
+    """
+    Scoped injectable leasing a resource from `pool` at its first use in the scope
+    named `scope_name`. The resource is shared in the scope and returned to the pool
+    when the scope is closed.
+
+    Example: @injectable(
+        cls=partial(PooledScopedInjectable, scope_name="request", pool=ResourcePool())
+    )
+    """
+
+    scope_name: str
+    pool: ResourcePool[T]
+
+    def __init__(
+        self,
+        factory: Any,
+        scope_name: str,
+        *,
+        pool: ResourcePool[T] = ...,
+    ) -> None: ...
+    @property
+    def metrics(self) -> PoolMetrics: ...
+    async def aget_instance(self) -> T: ...
+    def get_instance(self) -> T: ...
+
+class TTLInjectable[T](Injectable[T]):
+    """
+    Singleton rebuilt once its instance is older than `ttl` seconds. With
+    `refresh_ahead`, the instance is rebuilt in the background (in a thread, or in an
+    asyncio task with `aget_instance`) when it expires in less than `refresh_ahead`
+    seconds. Until the new instance is ready, the current one is still injected. A
+    failed refresh is logged and retried after `backoff` seconds, doubled after each
+    consecutive failure.
+
+    Example: @injectable(cls=partial(TTLInjectable, ttl=300, refresh_ahead=30))
+    """
+
+    ttl: float
+    refresh_ahead: float | None
+    backoff: float
+
+    def __init__(
+        self,
+        factory: Any,
+        *,
+        ttl: float,
+        refresh_ahead: float | None = ...,
+        backoff: float = ...,
+    ) -> None: ...
+    async def aget_instance(self) -> T: ...
+    def get_instance(self) -> T: ...
+
+@dataclass(frozen=True, slots=True)
+class Key:
+    """
+    Annotation metadata used to resolve a keyed injectable with a key.
+
+    Example: def function(client: Annotated[Client, Key("eu-west")]): ...
+    """
+
+    value: Hashable
+
+class KeyedInjectable[T](Injectable[T]):
+    """
+    Injectable building one instance per key, the key being passed as first argument
+    of the factory. The `max_size` most recently used instances are kept, `on_evict`
+    is called with the instances evicted (or removed by `unlock`). It's resolved with
+    `Annotated[T, Key(...)]` or the `key` parameter of `get_instance`.
+
+    Example: @injectable(cls=partial(KeyedInjectable, max_size=8, on_evict=close))
+    """
+
+    max_size: int
+    on_evict: Callable[[T], Any] | None
+
+    def __init__(
+        self,
+        factory: Any,
+        *,
+        max_size: int = ...,
+        on_evict: Callable[[T], Any] | None = ...,
+    ) -> None: ...
+    async def aget_instance(self) -> NoReturn:
+        """
+        Raise an `InjectionError`, a keyed injectable must be resolved with a key.
+        """
+
+    def get_instance(self) -> NoReturn:
+        """
+        Raise an `InjectionError`, a keyed injectable must be resolved with a key.
+        """
+
+    async def aget_keyed_instance(self, key: Hashable) -> T: ...
+    def get_keyed_instance(self, key: Hashable) -> T: ...
+
 class LazyInstance[T]:
     def __init__(
         self,
@@ -52,11 +269,26 @@ class LazyInstance[T]:
         /,
         default: T = ...,
         module: Module = ...,
-    ) -> None: ...
+        *,
+        cache: bool = ...,
+        slot: str | None = ...,
+    ) -> None:
+        """
+        Descriptor resolving the dependency each time it's accessed from an instance.
+        With `cache=True`, the dependency is resolved once per instance and stored in
+        its `__dict__`. For classes with `__slots__`, pass the name of the slot used to
+        store it with `slot`.
+        """
+
     @overload
     def __get__(self, instance: object, owner: type | None = ...) -> T: ...
     @overload
     def __get__(self, instance: None = ..., owner: type | None = ...) -> Self: ...
+    def reset(self, instance: object) -> None:
+        """
+        Remove the dependency cached on the instance, it will be resolved again on the
+        next access.
+        """
 
 @final
 class Module:
@@ -73,7 +305,16 @@ class Module:
     def __init__(self, name: str = ...) -> None: ...
     def __contains__(self, cls: _InputType[Any], /) -> bool: ...
     @property
+    def is_frozen(self) -> bool: ...
+    @property
     def is_locked(self) -> bool: ...
+    @property
+    def records(self) -> Mapping[_InputType[Any], _Record[Any]]:
+        """
+        Read-only view of the injectables registered for each type, including those
+        of the used modules.
+        """
+
     def inject[**P, T](
         self,
         wrapped: Callable[P, T] = ...,
@@ -106,6 +347,32 @@ class Module:
         """
 
     def singleton[**P, T](
+        self,
+        wrapped: Callable[P, T]
+        | Callable[P, Awaitable[T]]
+        | Callable[P, Iterator[T]]
+        | Callable[P, AsyncIterator[T]] = ...,
+        /,
+        *,
+        fork_safe: bool = ...,
+        inject: bool = ...,
+        on: _TypeInfo[T] = ...,
+        mode: Mode | ModeStr = ...,
+    ) -> Any:
+        """
+        Decorator applicable to a class or function or generator function. It is used
+        to indicate how the singleton will be constructed. At injection time, the
+        injected instance will always be the same.
+
+        With a generator function, the singleton lives in the application scope (see
+        `lifespan`): the code after `yield` runs when the scope is closed.
+
+        With `fork_safe=False`, the singleton is rebuilt in the child process after
+        `os.fork()` instead of being shared with the parent process. A generator
+        singleton can't be marked, it's closed with the application scope.
+        """
+
+    def per_resolution[**P, T](
         self,
         wrapped: Callable[P, T] | Callable[P, Awaitable[T]] = ...,
         /,
@@ -116,8 +383,9 @@ class Module:
     ) -> Any:
         """
         Decorator applicable to a class or function. It is used to indicate how the
-        singleton will be constructed. At injection time, the injected instance will
-        always be the same.
+        injectable will be constructed. The instance is built at most once per
+        resolution: the factories called to resolve the dependencies of a same
+        injected call share it.
         """
 
     def scoped[**P, T](
@@ -176,11 +444,17 @@ class Module:
         /,
         threadsafe: bool = ...,
     ) -> Callable[P, T]: ...
-    async def afind_instance[T](self, cls: _InputType[T]) -> T: ...
-    def find_instance[T](self, cls: _InputType[T]) -> T:
+    async def afind_instance[T](
+        self,
+        cls: _InputType[T],
+        *,
+        key: Hashable = ...,
+    ) -> T: ...
+    def find_instance[T](self, cls: _InputType[T], *, key: Hashable = ...) -> T:
         """
         Function used to retrieve an instance associated with the type passed in
-        parameter or an exception will be raised.
+        parameter or an exception will be raised. `key` is required for the classes
+        registered with a `KeyedInjectable`.
         """
 
     @overload
@@ -188,18 +462,24 @@ class Module:
         self,
         cls: _InputType[T],
         default: Default,
+        *,
+        key: Hashable = ...,
     ) -> T | Default: ...
     @overload
     async def aget_instance[T](
         self,
         cls: _InputType[T],
         default: None = ...,
+        *,
+        key: Hashable = ...,
     ) -> T | None: ...
     @overload
     def get_instance[T, Default](
         self,
         cls: _InputType[T],
         default: Default,
+        *,
+        key: Hashable = ...,
     ) -> T | Default:
         """
         Function used to retrieve an instance associated with the type passed in
@@ -211,6 +491,8 @@ class Module:
         self,
         cls: _InputType[T],
         default: None = ...,
+        *,
+        key: Hashable = ...,
     ) -> T | None: ...
     @overload
     def aget_lazy_instance[T, Default](
@@ -307,6 +589,93 @@ class Module:
     @contextmanager
     def load_profile(self, *names: str) -> Iterator[Self]: ...
     async def all_ready(self) -> None: ...
+    def prefork(self, *classes: _InputType[Any]) -> _FreezeReport:
+        """
+        Function to call in the parent process just before forking. It builds the
+        singletons and constants (all the fork-safe synchronous ones if no class is
+        passed), then calls `gc.freeze()` to maximize copy-on-write memory sharing with
+        the child processes. Return the number of objects and bytes frozen.
+        """
+
+    def defer_registration(self, enabled: bool = ...) -> Self:
+        """
+        Function to defer the registration of injectables. Decorators only record
+        the factory, and type hints are evaluated on the first lookup in the module
+        or when `compile` is called. Disabling it registers the pending injectables.
+        """
+
+    def set_manifest(self, manifest: Mapping[str, Collection[str]]) -> Self:
+        """
+        Function to set a manifest mapping the qualified name of types to the Python
+        modules registering them. When a type can't be found, its modules are imported
+        and the lookup is retried. Once the module is locked, they're no longer imported
+        and the type is considered missing. Use `injection.utils.make_manifest` to
+        generate it.
+        """
+
+    def freeze(self) -> Self:
+        """
+        Function to take an immutable snapshot of the module once it's fully
+        populated. Injected functions stop listening to the module, and bind their
+        dependencies directly on each call. Any later update raises a
+        `ModuleLockError`.
+        """
+
+    def compile(self, *, strict: bool = ...) -> Self:
+        """
+        Function to resolve the dependencies of all injected functions in advance,
+        instead of on their first call. Unresolved parameters are logged as warnings.
+        With `strict=True`, an `UnresolvedDependencyError` is raised instead.
+        """
+
+    def get_pool_metrics(self, cls: _InputType[Any]) -> PoolMetrics:
+        """
+        Function to get the metrics of the pool of a class registered with a
+        `PooledInjectable` or a `PooledScopedInjectable`.
+        """
+
+    def get_dependency_graph(self) -> _DependencyGraph:
+        """
+        Function to build the dependency graph of the registered injectables, from
+        the dependencies of their factories. The graph can detect dependency cycles,
+        give a topological order and estimate the critical path.
+        """
+
+    def warmup(self, *, max_workers: int | None = ...) -> _WarmupReport:
+        """
+        Function to build the singletons and constants that aren't built yet.
+        Synchronous factories are called in a thread pool, while respecting the
+        construction order between dependencies. Those with an async factory (and
+        those depending on them) are ignored. Return the build duration of each
+        instance.
+        """
+
+    async def awarmup(self, *, max_workers: int | None = ...) -> _WarmupReport:
+        """
+        Asynchronous version of `warmup`. Async factories are awaited concurrently and
+        synchronous factories are called in a thread pool.
+        """
+
+    @contextmanager
+    def lifespan(self, *, max_workers: int | None = ...) -> Iterator[_WarmupReport]:
+        """
+        Context manager defining the application scope, in which the singletons built
+        from generator functions live. On enter, the singletons are built like with
+        `warmup`. On exit, the generator singletons are closed in the reverse order of
+        their construction (dependents before their dependencies), then unlocked with
+        the singletons depending on them.
+        """
+
+    @asynccontextmanager
+    def alifespan(
+        self,
+        *,
+        max_workers: int | None = ...,
+    ) -> AsyncIterator[_WarmupReport]:
+        """
+        Asynchronous version of `lifespan`, supporting async generator singletons.
+        """
+
     def add_logger(self, logger: Logger) -> Self: ...
     @classmethod
     def from_name(cls, name: str) -> Module:
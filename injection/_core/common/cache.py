@@ -0,0 +1,60 @@
+from collections.abc import Callable
+from threading import Lock
+from typing import NamedTuple
+from weakref import WeakKeyDictionary
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+
+
+class WeakKeyCache[K, V]:
+    # Keys are weakly referenced, those that can't be are computed without caching.
+    # A value referencing its key (through annotations for example) keeps it alive
+    # until `cache_clear`.
+    __slots__ = ("__cache", "__function", "__hits", "__lock", "__misses", "__weakref__")
+
+    __cache: WeakKeyDictionary[K, V]
+    __function: Callable[[K], V]
+    __hits: int
+    __lock: Lock
+    __misses: int
+
+    def __init__(self, function: Callable[[K], V], /) -> None:
+        self.__cache = WeakKeyDictionary()
+        self.__function = function
+        self.__hits = 0
+        self.__lock = Lock()
+        self.__misses = 0
+
+    def __call__(self, key: K, /) -> V:
+        cache = self.__cache
+
+        try:
+            with self.__lock:
+                value = cache[key]
+                self.__hits += 1
+                return value
+
+        except KeyError:
+            ...
+
+        except TypeError:
+            return self.__function(key)
+
+        value = self.__function(key)
+
+        with self.__lock:
+            self.__misses += 1
+            return cache.setdefault(key, value)
+
+    def cache_info(self) -> CacheInfo:
+        with self.__lock:
+            return CacheInfo(self.__hits, self.__misses, len(self.__cache))
+
+    def cache_clear(self) -> None:
+        with self.__lock:
+            self.__cache.clear()
+            self.__hits = self.__misses = 0
@@ -31,7 +31,7 @@ def alazy[T](factory: Callable[..., Awaitable[T]]) -> Awaitable[T]:
     return SimpleAwaitable(getter)
 
 
-class Lazy[T](Invertible[T]):
+class LazyInvertible[T](Invertible[T]):
     __slots__ = ("__invertible", "__is_set")
 
     __invertible: Invertible[T]
@@ -0,0 +1,18 @@
+import gc
+import sys
+from typing import NamedTuple
+
+
+class FreezeReport(NamedTuple):
+    objects: int
+    bytes: int
+
+
+def freeze_heap() -> FreezeReport:
+    tracked_objects = gc.get_objects()
+    size = sum(sys.getsizeof(obj, 0) for obj in tracked_objects)
+    del tracked_objects
+
+    count = gc.get_freeze_count()
+    gc.freeze()
+    return FreezeReport(gc.get_freeze_count() - count, size)
@@ -0,0 +1,291 @@
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import Condition
+from time import monotonic, perf_counter
+from typing import Any, Final, NamedTuple
+
+from injection.exceptions import PoolTimeoutError
+
+_EMPTY: Final[Any] = object()
+_NEW: Final[Any] = object()
+
+
+class PoolMetrics(NamedTuple):
+    max_size: int
+    size: int
+    idle: int
+    hits: int
+    misses: int
+    waits: int
+    wait_time: float
+    discarded: int
+    evicted: int
+
+    @property
+    def in_use(self) -> int:
+        return self.size - self.idle
+
+
+@dataclass(repr=False, eq=False, slots=True)
+class _PoolCounters:
+    size: int = 0
+    hits: int = 0
+    misses: int = 0
+    waits: int = 0
+    wait_time: float = 0.0
+    discarded: int = 0
+    evicted: int = 0
+
+
+type _AsyncWaiter = tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]
+
+
+@dataclass(repr=False, eq=False, frozen=True, slots=True)
+class ResourcePool[T]:
+    max_size: int = field(default=8, kw_only=True)
+    timeout: float | None = field(default=None, kw_only=True)
+    idle_timeout: float | None = field(default=None, kw_only=True)
+    reset: Callable[[T], Any] | None = field(default=None, kw_only=True)
+    close: Callable[[T], Any] | None = field(default=None, kw_only=True)
+    __async_waiters: deque[_AsyncWaiter] = field(default_factory=deque, init=False)
+    __condition: Condition = field(default_factory=Condition, init=False)
+    __counters: _PoolCounters = field(default_factory=_PoolCounters, init=False)
+    __idle: deque[tuple[T, float]] = field(default_factory=deque, init=False)
+
+    def __post_init__(self) -> None:
+        if self.max_size < 1:
+            raise ValueError("Pool size must be at least 1.")
+
+    @property
+    def metrics(self) -> PoolMetrics:
+        counters = self.__counters
+
+        with self.__condition:
+            return PoolMetrics(
+                max_size=self.max_size,
+                size=counters.size,
+                idle=len(self.__idle),
+                hits=counters.hits,
+                misses=counters.misses,
+                waits=counters.waits,
+                wait_time=counters.wait_time,
+                discarded=counters.discarded,
+                evicted=counters.evicted,
+            )
+
+    def acquire(self, factory: Callable[[], T]) -> T:
+        resource = self.__try_acquire()
+
+        if resource is _EMPTY:
+            resource = self.__wait()
+
+        if resource is _NEW:
+            resource = self.__create(factory)
+
+        return resource
+
+    async def aacquire(self, factory: Callable[[], Awaitable[T]]) -> T:
+        loop = asyncio.get_running_loop()
+        waiter: _AsyncWaiter = (loop, loop.create_future())
+        resource = self.__try_acquire(waiter)
+
+        if resource is _EMPTY:
+            resource = await self.__await(waiter)
+
+        if resource is _NEW:
+            try:
+                resource = await factory()
+            except BaseException:
+                self.__discard()
+                raise
+
+        return resource
+
+    def release(self, resource: T) -> None:
+        if (reset := self.reset) is not None:
+            try:
+                reset(resource)
+            except Exception:
+                with self.__condition:
+                    self.__counters.discarded += 1
+
+                self.__discard(resource)
+                return
+
+        with self.__condition:
+            evicted = self.__evict()
+            self.__idle.append((resource, monotonic()))
+            self.__notify()
+
+        self.__close(evicted)
+
+    @contextmanager
+    def releasing(self, resource: T) -> Iterator[T]:
+        try:
+            yield resource
+        finally:
+            self.release(resource)
+
+    def detach(self) -> None:
+        self.__discard()
+
+    def clear(self) -> None:
+        with self.__condition:
+            idle = self.__idle
+            evicted = [resource for resource, _ in idle]
+            self.__counters.size -= len(evicted)
+            self.__counters.evicted += len(evicted)
+            idle.clear()
+            self.__notify(len(evicted))
+
+        self.__close(evicted)
+
+    def __close(self, resources: Iterable[T]) -> None:
+        if (close := self.close) is None:
+            return
+
+        for resource in resources:
+            close(resource)
+
+    def __create(self, factory: Callable[[], T]) -> T:
+        try:
+            return factory()
+        except BaseException:
+            self.__discard()
+            raise
+
+    def __discard(self, resource: T = _EMPTY) -> None:
+        with self.__condition:
+            self.__counters.size -= 1
+            self.__notify()
+
+        if resource is not _EMPTY:
+            self.__close((resource,))
+
+    def __evict(self) -> list[T]:
+        if (idle_timeout := self.idle_timeout) is None:
+            return []
+
+        idle = self.__idle
+        limit = monotonic() - idle_timeout
+        evicted = []
+
+        while idle and idle[0][1] < limit:
+            resource, _ = idle.popleft()
+            evicted.append(resource)
+
+        self.__counters.size -= len(evicted)
+        self.__counters.evicted += len(evicted)
+        return evicted
+
+    def __is_available(self) -> bool:
+        return bool(self.__idle) or self.__counters.size < self.max_size
+
+    def __notify(self, n: int = 1) -> None:
+        # Must be called with the condition acquired.
+        self.__condition.notify(n)
+        waiters = self.__async_waiters
+
+        for _ in range(min(n, len(waiters))):
+            loop, future = waiters.popleft()
+            loop.call_soon_threadsafe(_wake_up, future)
+
+    def __take(self) -> Any:
+        # Must be called with the condition acquired.
+        counters = self.__counters
+
+        if idle := self.__idle:
+            counters.hits += 1
+            resource, _ = idle.pop()
+            return resource
+
+        if counters.size < self.max_size:
+            counters.size += 1
+            counters.misses += 1
+            return _NEW
+
+        return _EMPTY
+
+    def __try_acquire(self, waiter: _AsyncWaiter | None = None) -> Any:
+        with self.__condition:
+            evicted = self.__evict()
+            resource = self.__take()
+
+            if resource is _EMPTY and waiter is not None:
+                self.__counters.waits += 1
+                self.__async_waiters.append(waiter)
+
+        self.__close(evicted)
+        return resource
+
+    def __wait(self) -> Any:
+        counters = self.__counters
+        condition = self.__condition
+        start = perf_counter()
+
+        with condition:
+            counters.waits += 1
+            is_ready = condition.wait_for(self.__is_available, self.timeout)
+            counters.wait_time += perf_counter() - start
+
+            if not is_ready:
+                raise self.__timeout_error()
+
+            return self.__take()
+
+    async def __await(self, waiter: _AsyncWaiter) -> Any:
+        loop, future = waiter
+        start = perf_counter()
+        deadline = None if self.timeout is None else start + self.timeout
+
+        while True:
+            remaining = None if deadline is None else deadline - perf_counter()
+
+            try:
+                await asyncio.wait_for(future, remaining)
+            except TimeoutError:
+                self.__cancel(waiter)
+                self.__add_wait_time(start)
+                raise self.__timeout_error() from None
+            except BaseException:
+                self.__cancel(waiter)
+                self.__add_wait_time(start)
+                raise
+
+            with self.__condition:
+                resource = self.__take()
+
+                if resource is _EMPTY:
+                    # Another caller took the resource, the turn is kept.
+                    waiter = (loop, loop.create_future())
+                    future = waiter[1]
+                    self.__async_waiters.appendleft(waiter)
+
+            if resource is not _EMPTY:
+                self.__add_wait_time(start)
+                return resource
+
+    def __add_wait_time(self, start: float) -> None:
+        with self.__condition:
+            self.__counters.wait_time += perf_counter() - start
+
+    def __cancel(self, waiter: _AsyncWaiter) -> None:
+        with self.__condition:
+            try:
+                self.__async_waiters.remove(waiter)
+            except ValueError:
+                # Already woken up, pass the turn to another waiter.
+                self.__notify()
+
+    def __timeout_error(self) -> PoolTimeoutError:
+        return PoolTimeoutError(
+            f"No resource available in the pool after {self.timeout}s."
+        )
+
+
+def _wake_up(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
@@ -0,0 +1,236 @@
+import operator
+from collections.abc import Callable, Iterator
+from typing import Annotated, Any, get_origin
+
+_MISSING: Any = object()
+
+
+class Lazy:
+    __slots__ = ()
+
+    def __class_getitem__(cls, item: Any) -> Any:
+        return Annotated[item, cls]
+
+
+def is_lazy(annotation: Any) -> bool:
+    if get_origin(annotation) is not Annotated:
+        return False
+
+    return any(metadata is Lazy for metadata in annotation.__metadata__)
+
+
+def get_lazy_type(annotation: Any) -> type | None:
+    origin = getattr(annotation, "__origin__", None)
+    return origin if isinstance(origin, type) else None
+
+
+class LazyProxy[T]:
+    __slots__ = ("__cls", "__factory", "__instance")
+
+    __cls: type[T] | None
+    __factory: Callable[..., T]
+    __instance: T
+
+    def __init__(
+        self,
+        factory: Callable[..., T],
+        cls: type[T] | None = None,
+    ) -> None:
+        object.__setattr__(self, "_LazyProxy__cls", cls)
+        object.__setattr__(self, "_LazyProxy__factory", factory)
+        object.__setattr__(self, "_LazyProxy__instance", _MISSING)
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[T]:  # type: ignore[override]
+        # The expected type is used until the instance is built, so `isinstance`
+        # doesn't build it.
+        if (instance := self.__instance) is not _MISSING:
+            return type(instance)
+
+        return self.__cls or LazyProxy  # type: ignore[return-value]
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.__get(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.__get(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self.__get(), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.__get()(*args, **kwargs)  # type: ignore[operator]
+
+    def __repr__(self) -> str:
+        return repr(self.__get())
+
+    def __str__(self) -> str:
+        return str(self.__get())
+
+    def __bool__(self) -> bool:
+        return bool(self.__get())
+
+    def __eq__(self, other: object) -> bool:
+        return self.__get() == other
+
+    def __ne__(self, other: object) -> bool:
+        return self.__get() != other
+
+    def __hash__(self) -> int:
+        return hash(self.__get())
+
+    def __lt__(self, other: Any) -> Any:
+        return self.__get() < other
+
+    def __le__(self, other: Any) -> Any:
+        return self.__get() <= other
+
+    def __gt__(self, other: Any) -> Any:
+        return self.__get() > other
+
+    def __ge__(self, other: Any) -> Any:
+        return self.__get() >= other
+
+    def __add__(self, other: Any) -> Any:
+        return self.__get() + other
+
+    def __radd__(self, other: Any) -> Any:
+        return other + self.__get()
+
+    def __sub__(self, other: Any) -> Any:
+        return self.__get() - other
+
+    def __rsub__(self, other: Any) -> Any:
+        return other - self.__get()
+
+    def __mul__(self, other: Any) -> Any:
+        return self.__get() * other
+
+    def __rmul__(self, other: Any) -> Any:
+        return other * self.__get()
+
+    def __matmul__(self, other: Any) -> Any:
+        return self.__get() @ other
+
+    def __rmatmul__(self, other: Any) -> Any:
+        return other @ self.__get()
+
+    def __truediv__(self, other: Any) -> Any:
+        return self.__get() / other
+
+    def __rtruediv__(self, other: Any) -> Any:
+        return other / self.__get()
+
+    def __floordiv__(self, other: Any) -> Any:
+        return self.__get() // other
+
+    def __rfloordiv__(self, other: Any) -> Any:
+        return other // self.__get()
+
+    def __mod__(self, other: Any) -> Any:
+        return self.__get() % other
+
+    def __rmod__(self, other: Any) -> Any:
+        return other % self.__get()
+
+    def __pow__(self, other: Any) -> Any:
+        return self.__get() ** other
+
+    def __rpow__(self, other: Any) -> Any:
+        return other ** self.__get()
+
+    def __lshift__(self, other: Any) -> Any:
+        return self.__get() << other
+
+    def __rlshift__(self, other: Any) -> Any:
+        return other << self.__get()
+
+    def __rshift__(self, other: Any) -> Any:
+        return self.__get() >> other
+
+    def __rrshift__(self, other: Any) -> Any:
+        return other >> self.__get()
+
+    def __and__(self, other: Any) -> Any:
+        return self.__get() & other
+
+    def __rand__(self, other: Any) -> Any:
+        return other & self.__get()
+
+    def __xor__(self, other: Any) -> Any:
+        return self.__get() ^ other
+
+    def __rxor__(self, other: Any) -> Any:
+        return other ^ self.__get()
+
+    def __or__(self, other: Any) -> Any:
+        return self.__get() | other
+
+    def __ror__(self, other: Any) -> Any:
+        return other | self.__get()
+
+    def __divmod__(self, other: Any) -> Any:
+        return divmod(self.__get(), other)
+
+    def __rdivmod__(self, other: Any) -> Any:
+        return divmod(other, self.__get())
+
+    def __neg__(self) -> Any:
+        return -self.__get()  # type: ignore[operator]
+
+    def __pos__(self) -> Any:
+        return +self.__get()  # type: ignore[operator]
+
+    def __invert__(self) -> Any:
+        return ~self.__get()  # type: ignore[operator]
+
+    def __abs__(self) -> Any:
+        return abs(self.__get())  # type: ignore[arg-type]
+
+    def __int__(self) -> int:
+        return int(self.__get())  # type: ignore[call-overload]
+
+    def __float__(self) -> float:
+        return float(self.__get())  # type: ignore[arg-type]
+
+    def __index__(self) -> int:
+        return operator.index(self.__get())  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        return len(self.__get())  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.__get())  # type: ignore[call-overload]
+
+    def __contains__(self, item: object) -> bool:
+        return item in self.__get()  # type: ignore[operator]
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.__get()[key]  # type: ignore[index]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.__get()[key] = value  # type: ignore[index]
+
+    def __delitem__(self, key: Any) -> None:
+        del self.__get()[key]  # type: ignore[attr-defined]
+
+    def __enter__(self) -> Any:
+        return self.__get().__enter__()  # type: ignore[attr-defined]
+
+    def __exit__(self, *args: Any) -> Any:
+        return self.__get().__exit__(*args)  # type: ignore[attr-defined]
+
+    async def __aenter__(self) -> Any:
+        return await self.__get().__aenter__()  # type: ignore[attr-defined]
+
+    async def __aexit__(self, *args: Any) -> Any:
+        return await self.__get().__aexit__(*args)  # type: ignore[attr-defined]
+
+    def __get(self) -> T:
+        instance = self.__instance
+
+        if instance is _MISSING:
+            instance = self.__factory()
+            object.__setattr__(self, "_LazyProxy__instance", instance)
+
+        return instance
@@ -0,0 +1,103 @@
+import json
+import os
+from collections.abc import Collection, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from tempfile import NamedTemporaryFile
+from typing import Any, NamedTuple, Self
+
+type StrPath = str | os.PathLike[str]
+
+
+class FileStamp(NamedTuple):
+    mtime: int
+    size: int
+
+    @classmethod
+    def of(cls, path: StrPath) -> Self:
+        stat = os.stat(path)
+        return cls(stat.st_mtime_ns, stat.st_size)
+
+
+@dataclass(repr=False, frozen=True, slots=True)
+class KeywordScanner:
+    keywords: Collection[str]
+    cache_file: StrPath | None = field(default=None, kw_only=True)
+    max_workers: int | None = field(default=None, kw_only=True)
+    chunk_size: int = field(default=1 << 16, kw_only=True)
+
+    def scan(self, paths: Iterable[str]) -> frozenset[str]:
+        entries = self.__load_cache()
+        stamps = {path: FileStamp.of(path) for path in paths}
+        uncached = tuple(
+            path
+            for path, stamp in stamps.items()
+            if (entry := entries.get(path)) is None or FileStamp(*entry[:2]) != stamp
+        )
+
+        if uncached:
+            with ThreadPoolExecutor(
+                self.max_workers,
+                thread_name_prefix="injection-scan",
+            ) as executor:
+                results = executor.map(self.contains_keyword, uncached)
+
+                for path, result in zip(uncached, results):
+                    entries[path] = (*stamps[path], result)
+
+            self.__dump_cache(entries)
+
+        return frozenset(path for path in stamps if entries[path][2])
+
+    def contains_keyword(self, path: StrPath) -> bool:
+        patterns = tuple(keyword.encode() for keyword in self.keywords)
+
+        if not patterns:
+            return False
+
+        overlap = max(map(len, patterns)) - 1
+        tail = b""
+
+        with open(path, "rb") as file:
+            while chunk := file.read(self.chunk_size):
+                buffer = tail + chunk
+
+                if any(pattern in buffer for pattern in patterns):
+                    return True
+
+                tail = buffer[max(len(buffer) - overlap, 0) :]
+
+        return False
+
+    def __load_cache(self) -> dict[str, Any]:
+        if self.cache_file is None:
+            return {}
+
+        try:
+            with open(self.cache_file, "r") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("keywords") != list(self.keywords):
+            return {}
+
+        return data.get("files", {})
+
+    def __dump_cache(self, entries: dict[str, Any]) -> None:
+        if self.cache_file is None:
+            return
+
+        data = {"keywords": list(self.keywords), "files": entries}
+        directory = os.path.dirname(os.path.abspath(self.cache_file))
+
+        with NamedTemporaryFile(
+            "w",
+            dir=directory,
+            prefix=".injection-",
+            suffix=".tmp",
+            delete=False,
+        ) as file:
+            json.dump(data, file)
+
+        os.replace(file.name, self.cache_file)
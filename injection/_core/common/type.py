@@ -7,7 +7,7 @@ from collections.abc import (
     Iterable,
     Iterator,
 )
-from inspect import isfunction
+from inspect import Signature, isfunction, signature
 from types import GenericAlias, UnionType
 from typing import (
     Annotated,
@@ -19,6 +19,8 @@ from typing import (
     get_type_hints,
 )
 
+from injection._core.common.cache import WeakKeyCache
+
 type TypeDef[T] = type[T] | TypeAliasType | GenericAlias
 type InputType[T] = TypeDef[T] | UnionType
 type TypeInfo[T] = InputType[T] | Callable[..., T] | Iterable[TypeInfo[T]]
@@ -41,10 +43,16 @@ def get_return_types(*args: TypeInfo[Any]) -> Iterator[InputType[Any]]:
         yield from get_return_types(*inner_args)
 
 
-def get_return_hint[T](function: Callable[..., T]) -> InputType[T] | None:
+@WeakKeyCache
+def get_return_hint(function: Callable[..., Any]) -> InputType[Any] | None:
     return get_type_hints(function).get("return")
 
 
+@WeakKeyCache
+def get_signature(function: Callable[..., Any]) -> Signature:
+    return signature(function, eval_str=True)
+
+
 def get_yield_hint[T](
     function: Callable[..., Iterator[T]] | Callable[..., AsyncIterator[T]],
 ) -> InputType[T] | None:
@@ -64,6 +72,16 @@ def get_yield_hint[T](
     return next(iter(args), None)
 
 
+def get_qualified_name(tp: InputType[Any]) -> str:
+    if isinstance(tp, type):
+        return f"{tp.__module__}.{tp.__qualname__}"
+
+    if isinstance(tp, TypeAliasType):
+        return f"{tp.__module__}.{tp.__name__}"
+
+    return repr(tp)
+
+
 def standardize_types(
     *types: InputType[Any],
     with_origin: bool = False,
@@ -1,4 +1,5 @@
-from typing import Self
+from contextlib import suppress
+from typing import Any, Self
 
 from injection._core.common.invertible import Invertible
 from injection._core.common.type import InputType
@@ -6,8 +7,11 @@ from injection._core.module import Module, mod
 
 
 class LazyInstance[T]:
-    __slots__ = ("__value",)
+    __slots__ = ("__cache", "__name", "__slot", "__value")
 
+    __cache: bool
+    __name: str | None
+    __slot: str | None
     __value: Invertible[T]
 
     def __init__(
@@ -16,8 +20,14 @@ class LazyInstance[T]:
         /,
         default: T = NotImplemented,
         module: Module | None = None,
+        *,
+        cache: bool = False,
+        slot: str | None = None,
     ) -> None:
         module = module or mod()
+        self.__cache = cache or slot is not None
+        self.__name = None
+        self.__slot = slot
         self.__value = module.get_lazy_instance(cls, default)
 
     def __get__(
@@ -28,4 +38,44 @@ class LazyInstance[T]:
         if instance is None:
             return self
 
-        return ~self.__value
+        if not self.__cache:
+            return ~self.__value
+
+        if (slot := self.__slot) is not None:
+            try:
+                return getattr(instance, slot)
+            except AttributeError:
+                value = ~self.__value
+                setattr(instance, slot, value)
+                return value
+
+        value = ~self.__value
+        self.__get_instance_dict(instance)[self.__get_name()] = value
+        return value
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.__name = name
+
+    def reset(self, instance: object) -> None:
+        if (slot := self.__slot) is not None:
+            with suppress(AttributeError):
+                delattr(instance, slot)
+
+        elif self.__cache:
+            self.__get_instance_dict(instance).pop(self.__get_name(), None)
+
+    def __get_name(self) -> str:
+        if (name := self.__name) is None:
+            raise TypeError("LazyInstance with `cache=True` must be a class attribute.")
+
+        return name
+
+    @staticmethod
+    def __get_instance_dict(instance: object) -> dict[str, Any]:
+        try:
+            return instance.__dict__
+        except AttributeError as exc:
+            raise TypeError(
+                f"`{type(instance)}` has no `__dict__`, "
+                "use the `slot` parameter to cache the instance."
+            ) from exc
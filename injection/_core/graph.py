@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from enum import StrEnum
+from graphlib import CycleError, TopologicalSorter
+from typing import Any, NamedTuple, Self
+
+from injection._core.common.type import InputType
+from injection._core.injectables import (
+    AsyncCMSingletonInjectable,
+    CMSingletonInjectable,
+    ConstantInjectable,
+    Injectable,
+    KeyedInjectable,
+    PerResolutionInjectable,
+    PooledInjectable,
+    PooledScopedInjectable,
+    ScopedInjectable,
+    SimpleInjectable,
+    SingletonInjectable,
+    TTLInjectable,
+)
+from injection.exceptions import DependencyCycleError
+
+
+class Lifetime(StrEnum):
+    APPLICATION = "application"
+    CONSTANT = "constant"
+    KEYED = "keyed"
+    PER_RESOLUTION = "per_resolution"
+    POOLED = "pooled"
+    SCOPED = "scoped"
+    SINGLETON = "singleton"
+    TRANSIENT = "transient"
+    TTL = "ttl"
+    UNKNOWN = "unknown"
+
+    @classmethod
+    def of(cls, injectable: Injectable[Any]) -> Lifetime:
+        if isinstance(injectable, ConstantInjectable):
+            return cls.CONSTANT
+
+        if isinstance(injectable, AsyncCMSingletonInjectable | CMSingletonInjectable):
+            return cls.APPLICATION
+
+        if isinstance(injectable, SingletonInjectable):
+            return cls.SINGLETON
+
+        if isinstance(injectable, PooledInjectable | PooledScopedInjectable):
+            return cls.POOLED
+
+        if isinstance(injectable, ScopedInjectable):
+            return cls.SCOPED
+
+        if isinstance(injectable, PerResolutionInjectable):
+            return cls.PER_RESOLUTION
+
+        if isinstance(injectable, TTLInjectable):
+            return cls.TTL
+
+        if isinstance(injectable, KeyedInjectable):
+            return cls.KEYED
+
+        if isinstance(injectable, SimpleInjectable):
+            return cls.TRANSIENT
+
+        return cls.UNKNOWN
+
+
+@dataclass(repr=False, eq=False, frozen=True, slots=True)
+class Node:
+    injectable: Injectable[Any]
+    classes: tuple[InputType[Any], ...]
+    lifetime: Lifetime
+    dependencies: tuple[Injectable[Any], ...]
+    # Lazy dependencies are built after the node, so they can't form a cycle.
+    lazy_dependencies: tuple[Injectable[Any], ...] = ()
+
+    def __repr__(self) -> str:
+        classes = ", ".join(f"`{cls}`" for cls in self.classes)
+        return f"<{self.lifetime} {classes or repr(self.injectable)}>"
+
+    @property
+    def is_locked(self) -> bool:
+        return self.injectable.is_locked
+
+
+class CriticalPath(NamedTuple):
+    nodes: tuple[Node, ...]
+    cost: float
+
+
+@dataclass(repr=False, eq=False, frozen=True, slots=True)
+class DependencyGraph:
+    nodes: Mapping[Injectable[Any], Node]
+
+    def __iter__(self) -> Iterator[Node]:
+        return iter(self.nodes.values())
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def get_dependencies(self, node: Node) -> tuple[Node, ...]:
+        return tuple(self.nodes[dependency] for dependency in node.dependencies)
+
+    def find_dependents(self, predicate: Callable[[Node], bool]) -> tuple[Node, ...]:
+        # Nodes depending on a node matching the predicate, directly, lazily or
+        # through other nodes.
+        dependents: defaultdict[Injectable[Any], list[Injectable[Any]]]
+        dependents = defaultdict(list)
+
+        for injectable, node in self.nodes.items():
+            for dependency in (*node.dependencies, *node.lazy_dependencies):
+                dependents[dependency].append(injectable)
+
+        queue = [node.injectable for node in self if predicate(node)]
+        found: dict[Injectable[Any], Node] = {}
+
+        while queue:
+            for dependent in dependents[queue.pop()]:
+                if dependent not in found:
+                    found[dependent] = self.nodes[dependent]
+                    queue.append(dependent)
+
+        return tuple(found.values())
+
+    def find_cycles(self) -> tuple[tuple[Node, ...], ...]:
+        # Iterative version of Tarjan's strongly connected components algorithm.
+        index: dict[Injectable[Any], int] = {}
+        lowlink: dict[Injectable[Any], int] = {}
+        stack: list[Injectable[Any]] = []
+        on_stack: set[Injectable[Any]] = set()
+        cycles: list[tuple[Node, ...]] = []
+
+        def visit(injectable: Injectable[Any]) -> Iterator[Injectable[Any]]:
+            index[injectable] = lowlink[injectable] = len(index)
+            stack.append(injectable)
+            on_stack.add(injectable)
+            return iter(self.nodes[injectable].dependencies)
+
+        for root in self.nodes:
+            if root in index:
+                continue
+
+            work = [(root, visit(root))]
+
+            while work:
+                injectable, dependencies = work[-1]
+
+                for dependency in dependencies:
+                    if dependency not in index:
+                        work.append((dependency, visit(dependency)))
+                        break
+
+                    if dependency in on_stack:
+                        lowlink[injectable] = min(
+                            lowlink[injectable],
+                            index[dependency],
+                        )
+
+                else:
+                    work.pop()
+
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[injectable])
+
+                    if lowlink[injectable] != index[injectable]:
+                        continue
+
+                    component: list[Injectable[Any]] = []
+
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+
+                        if member is injectable:
+                            break
+
+                    node = self.nodes[injectable]
+
+                    if len(component) > 1 or injectable in node.dependencies:
+                        cycles.append(
+                            tuple(self.nodes[member] for member in reversed(component))
+                        )
+
+        return tuple(cycles)
+
+    def check(self) -> Self:
+        if cycles := self.find_cycles():
+            raise DependencyCycleError(cycles)
+
+        return self
+
+    def static_order(self) -> tuple[Node, ...]:
+        sorter = TopologicalSorter(
+            {injectable: node.dependencies for injectable, node in self.nodes.items()}
+        )
+
+        try:
+            return tuple(self.nodes[injectable] for injectable in sorter.static_order())
+        except CycleError:
+            self.check()
+            raise
+
+    def project(
+        self,
+        predicate: Callable[[Node], bool],
+    ) -> dict[Injectable[Any], frozenset[Injectable[Any]]]:
+        # Dependencies are reached through the nodes that don't match the predicate.
+        return {
+            injectable: frozenset(self.__iter_projected_dependencies(node, predicate))
+            for injectable, node in self.nodes.items()
+            if predicate(node)
+        }
+
+    def critical_path(
+        self,
+        cost: Callable[[Node], float] = lambda node: 1.0,
+    ) -> CriticalPath:
+        best: dict[Injectable[Any], CriticalPath] = {}
+
+        for node in self.static_order():
+            previous = max(
+                (best[dependency] for dependency in node.dependencies),
+                key=lambda path: path.cost,
+                default=CriticalPath((), 0.0),
+            )
+            best[node.injectable] = CriticalPath(
+                previous.nodes + (node,),
+                previous.cost + cost(node),
+            )
+
+        return max(
+            best.values(),
+            key=lambda path: path.cost,
+            default=CriticalPath((), 0.0),
+        )
+
+    def __iter_projected_dependencies(
+        self,
+        node: Node,
+        predicate: Callable[[Node], bool],
+    ) -> Iterator[Injectable[Any]]:
+        visited: set[Injectable[Any]] = set()
+        queue = list(node.dependencies)
+
+        while queue:
+            injectable = queue.pop()
+
+            if injectable in visited:
+                continue
+
+            visited.add(injectable)
+            dependency = self.nodes[injectable]
+
+            if predicate(dependency):
+                yield injectable
+            else:
+                queue.extend(dependency.dependencies)
+
+    @classmethod
+    def build(
+        cls,
+        roots: Mapping[Injectable[Any], Iterable[InputType[Any]]],
+        get_dependencies: Callable[
+            [Injectable[Any]],
+            Iterable[tuple[Injectable[Any], bool]],
+        ],
+    ) -> Self:
+        nodes: dict[Injectable[Any], Node] = {}
+        queue = list(roots)
+
+        while queue:
+            injectable = queue.pop()
+
+            if injectable in nodes:
+                continue
+
+            dependencies: list[Injectable[Any]] = []
+            lazy_dependencies: list[Injectable[Any]] = []
+
+            for dependency, is_lazy in get_dependencies(injectable):
+                (lazy_dependencies if is_lazy else dependencies).append(dependency)
+
+            nodes[injectable] = Node(
+                injectable=injectable,
+                classes=tuple(roots.get(injectable, ())),
+                lifetime=Lifetime.of(injectable),
+                dependencies=tuple(dependencies),
+                lazy_dependencies=tuple(lazy_dependencies),
+            )
+            queue.extend(dependencies)
+            queue.extend(lazy_dependencies)
+
+        return cls(nodes)
@@ -1,19 +1,39 @@
+import asyncio
+import os
 from abc import ABC, abstractmethod
-from collections.abc import MutableMapping
-from contextlib import suppress
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Iterator, MutableMapping
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
+from functools import partial
+from logging import getLogger
+from threading import Lock, Thread
+from time import monotonic
 from typing import (
+    Annotated,
     Any,
     AsyncContextManager,
     ClassVar,
     ContextManager,
+    Final,
+    NamedTuple,
     NoReturn,
     Protocol,
+    get_origin,
     runtime_checkable,
 )
+from weakref import WeakSet
 
 from injection._core.common.asynchronous import Caller
-from injection._core.scope import Scope, get_active_scopes, get_scope
+from injection._core.common.pool import PoolMetrics, ResourcePool
+from injection._core.common.proxy import LazyProxy
+from injection._core.resolution import enable_resolution, get_resolution, handover
+from injection._core.scope import (
+    Scope,
+    get_active_scopes,
+    get_application_scope,
+    get_scope,
+)
 from injection.exceptions import InjectionError
 
 
@@ -37,7 +57,7 @@ class Injectable[T](Protocol):
         raise NotImplementedError
 
 
-@dataclass(repr=False, frozen=True, slots=True)
+@dataclass(repr=False, frozen=True, slots=True, weakref_slot=True)
 class BaseInjectable[T](Injectable[T], ABC):
     factory: Caller[..., T]
 
@@ -57,6 +77,9 @@ class SingletonInjectable[T](BaseInjectable[T]):
 
     __key: ClassVar[str] = "$instance"
 
+    # Incremented on each unlock, to invalidate the instances inlined elsewhere.
+    generation: ClassVar[int] = 0
+
     @property
     def is_locked(self) -> bool:
         return self.__key in self.__cache
@@ -71,7 +94,9 @@ class SingletonInjectable[T](BaseInjectable[T]):
         with suppress(KeyError):
             return cache[self.__key]
 
-        instance = await self.factory.acall()
+        with handover():
+            instance = await self.abuild()
+
         cache[self.__key] = instance
         return instance
 
@@ -81,15 +106,608 @@ class SingletonInjectable[T](BaseInjectable[T]):
         with suppress(KeyError):
             return cache[self.__key]
 
-        instance = self.factory.call()
+        with handover():
+            instance = self.build()
+
         cache[self.__key] = instance
         return instance
 
     def unlock(self) -> None:
-        self.__cache.pop(self.__key, None)
+        with suppress(KeyError):
+            del self.__cache[self.__key]
+            SingletonInjectable.generation += 1
+
+    async def abuild(self) -> T:
+        return await self.factory.acall()
+
+    def build(self) -> T:
+        return self.factory.call()
+
+
+class AsyncCMSingletonInjectable[T](SingletonInjectable[T]):
+    __slots__ = ()
+
+    def unlock(self) -> None:
+        if self.is_locked:
+            raise RuntimeError("To unlock, close the application scope.")
+
+    async def abuild(self) -> T:
+        scope = get_application_scope()
+        cm: AsyncContextManager[T] = await self.factory.acall()  # type: ignore[assignment]
+        instance = await scope.aenter(cm)
+        scope.enter(_unlock_on_exit(self))
+        return instance
+
+    def build(self) -> NoReturn:
+        raise RuntimeError("Can't use async context manager synchronously.")
+
+
+class CMSingletonInjectable[T](SingletonInjectable[T]):
+    __slots__ = ()
+
+    def unlock(self) -> None:
+        if self.is_locked:
+            raise RuntimeError("To unlock, close the application scope.")
+
+    async def abuild(self) -> T:
+        cm: ContextManager[T] = await self.factory.acall()  # type: ignore[assignment]
+        return self.__enter(cm)
+
+    def build(self) -> T:
+        cm: ContextManager[T] = self.factory.call()  # type: ignore[assignment]
+        return self.__enter(cm)
+
+    def __enter(self, cm: ContextManager[T]) -> T:
+        scope = get_application_scope()
+        instance = scope.enter(cm)
+        scope.enter(_unlock_on_exit(self))
+        return instance
+
+
+@contextmanager
+def _unlock_on_exit(injectable: SingletonInjectable[Any]) -> Iterator[None]:
+    # Entered after the instance, so it's unlocked before being exited.
+    try:
+        yield
+    finally:
+        SingletonInjectable.unlock(injectable)
+
+
+class PerResolutionInjectable[T](BaseInjectable[T]):
+    __slots__ = ()
+
+    def __init__(self, factory: Caller[..., T]) -> None:
+        super().__init__(factory)
+        enable_resolution()
+
+    async def aget_instance(self) -> T:
+        resolution = get_resolution()
+
+        if resolution is None:
+            return await self.factory.acall()
+
+        instances = resolution.instances
+
+        try:
+            return instances[self]
+        except KeyError:
+            ...
+
+        instance = await self.factory.acall()
+        return instances.setdefault(self, instance)
+
+    def get_instance(self) -> T:
+        resolution = get_resolution()
+
+        if resolution is None:
+            return self.factory.call()
+
+        instances = resolution.instances
+
+        try:
+            return instances[self]
+        except KeyError:
+            ...
+
+        instance = self.factory.call()
+        return instances.setdefault(self, instance)
+
+
+class ConstantInjectable[T](BaseInjectable[T]):
+    __slots__ = ("__dict__",)
+
+    __key: ClassVar[str] = "$instance"
+
+    # Unlike a singleton, a built constant doesn't lock the module.
+    @property
+    def is_built(self) -> bool:
+        return self.__key in self.__dict__
+
+    async def aget_instance(self) -> T:
+        cache = self.__dict__
+
+        try:
+            return cache[self.__key]
+        except KeyError:
+            ...
+
+        with handover():
+            instance = await self.factory.acall()
+
+        return cache.setdefault(self.__key, instance)
+
+    def get_instance(self) -> T:
+        cache = self.__dict__
+
+        try:
+            return cache[self.__key]
+        except KeyError:
+            ...
+
+        with handover():
+            instance = self.factory.call()
+
+        return cache.setdefault(self.__key, instance)
+
+
+@dataclass(repr=False, eq=False, frozen=True, slots=True)
+class PooledInjectable[T](BaseInjectable[T]):
+    max_size: int = field(default=8, kw_only=True)
+    reset: Callable[[T], Any] | None = field(default=None, kw_only=True)
+    scope_name: str | None = field(default=None, kw_only=True)
+    timeout: float | None = field(default=None, kw_only=True)
+    __pool: ResourcePool[T] = field(init=False)
+
+    def __post_init__(self) -> None:
+        pool = ResourcePool(
+            max_size=self.max_size,
+            timeout=self.timeout,
+            reset=self.reset,
+        )
+        object.__setattr__(self, "_PooledInjectable__pool", pool)
+        enable_resolution()
+
+    @property
+    def metrics(self) -> PoolMetrics:
+        return self.__pool.metrics
+
+    async def aget_instance(self) -> T:
+        instance = await self.__pool.aacquire(self.factory.acall)
+        return self.__lend(instance)
+
+    def get_instance(self) -> T:
+        instance = self.__pool.acquire(self.factory.call)
+        return self.__lend(instance)
+
+    def unlock(self) -> None:
+        self.__pool.clear()
+
+    def __lend(self, instance: T) -> T:
+        pool = self.__pool
+        resolution = get_resolution()
+
+        if resolution is not None and resolution.is_handover:
+            # Kept by the instance being built, like a singleton.
+            pool.detach()
+
+        elif (scope_name := self.scope_name) is not None:
+            get_scope(scope_name).enter(pool.releasing(instance))
+
+        elif resolution is not None:
+            resolution.callbacks.append(partial(pool.release, instance))
+
+        else:
+            # Nothing to return it to the pool, the instance is handed over.
+            pool.detach()
+
+        return instance
+
+
+class _TTLEntry[T](NamedTuple):
+    instance: T
+    expires_at: float
+
+
+@dataclass(repr=False, eq=False, slots=True)
+class _TTLState[T]:
+    entry: _TTLEntry[T] | None = None
+    failures: int = 0
+    future: asyncio.Future[T] | None = None
+    # Incremented by `unlock`, so the refreshes started before are ignored.
+    generation: int = 0
+    is_refreshing: bool = False
+    retry_at: float = 0.0
+    task: asyncio.Task[None] | None = None
+
+
+@dataclass(repr=False, eq=False, frozen=True, slots=True)
+class TTLInjectable[T](BaseInjectable[T]):
+    ttl: float = field(kw_only=True)
+    refresh_ahead: float | None = field(default=None, kw_only=True)
+    backoff: float = field(default=1.0, kw_only=True)
+    __lock: Lock = field(default_factory=Lock, init=False)
+    __state: _TTLState[T] = field(default_factory=_TTLState, init=False)
+
+    def __post_init__(self) -> None:
+        if self.ttl <= 0:
+            raise ValueError("TTL must be positive.")
+
+        refresh_ahead = self.refresh_ahead
+
+        if refresh_ahead is not None and not 0 < refresh_ahead < self.ttl:
+            raise ValueError("Refresh-ahead must be positive and lower than the TTL.")
+
+        if self.backoff < 0:
+            raise ValueError("Backoff can't be negative.")
+
+    async def aget_instance(self) -> T:
+        state = self.__state
+        entry = state.entry
+        now = monotonic()
+
+        if entry is None or now >= entry.expires_at:
+            return await self.__aload()
+
+        if (generation := self.__start_refresh(entry, now)) is not None:
+            state.task = asyncio.create_task(self.__arefresh(generation))
+
+        return entry.instance
+
+    def get_instance(self) -> T:
+        state = self.__state
+        entry = state.entry
+        now = monotonic()
+
+        if entry is None or now >= entry.expires_at:
+            with self.__lock:
+                entry = state.entry
+
+                if entry is None or monotonic() >= entry.expires_at:
+                    load_generation = state.generation
+
+                    with handover():
+                        instance = self.factory.call()
+
+                    entry = self.__set_entry(instance, load_generation)
+
+            return entry.instance
+
+        if (generation := self.__start_refresh(entry, now)) is not None:
+            Thread(
+                target=self.__refresh,
+                args=(generation,),
+                daemon=True,
+                name="injection-refresh",
+            ).start()
+
+        return entry.instance
+
+    def unlock(self) -> None:
+        state = self.__state
+
+        with self.__lock:
+            state.entry = None
+            state.failures = 0
+            state.future = None
+            state.generation += 1
+            state.is_refreshing = False
+            state.retry_at = 0.0
+            state.task = None
+
+    async def __aload(self) -> T:
+        # Only one task builds the expired instance, the others wait for it.
+        state = self.__state
+        loop = asyncio.get_running_loop()
+
+        while (future := state.future) is not None and future.get_loop() is loop:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+
+                if not future.cancelled() or (task and task.cancelling()):
+                    raise
+
+        entry = state.entry
+
+        if entry is not None and monotonic() < entry.expires_at:
+            return entry.instance
+
+        future = state.future = loop.create_future()
+        generation = state.generation
+
+        try:
+            with handover():
+                instance = await self.factory.acall()
+
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Retrieved, so no warning is logged if nobody is waiting.
+            future.exception()
+            raise
+
+        else:
+            self.__set_entry(instance, generation)
+            future.set_result(instance)
+            return instance
+
+        finally:
+            if state.future is future:
+                state.future = None
+
+    def __set_entry(self, instance: T, generation: int) -> _TTLEntry[T]:
+        # A stale result is returned to its caller, but not stored.
+        entry = _TTLEntry(instance, monotonic() + self.ttl)
+        state = self.__state
+
+        if state.generation == generation:
+            state.entry = entry
+
+        return entry
+
+    def __start_refresh(self, entry: _TTLEntry[T], now: float) -> int | None:
+        # Returns the generation of the refresh to start, if any.
+        refresh_ahead = self.refresh_ahead
+
+        if refresh_ahead is None or now < entry.expires_at - refresh_ahead:
+            return None
+
+        state = self.__state
+
+        with self.__lock:
+            if state.is_refreshing or now < state.retry_at:
+                return None
+
+            state.is_refreshing = True
+            return state.generation
+
+    def __end_refresh(
+        self,
+        generation: int,
+        entry: _TTLEntry[T] | None = None,
+        exc: Exception | None = None,
+    ) -> None:
+        state = self.__state
+
+        with self.__lock:
+            if state.generation != generation:
+                return
+
+            state.is_refreshing = False
+            state.task = None
+
+            if exc is None:
+                state.entry = entry
+                state.failures = 0
+                return
+
+            # The current instance is kept, it will be rebuilt once expired.
+            state.failures += 1
+            delay = self.backoff * 2 ** (state.failures - 1)
+            state.retry_at = monotonic() + delay
+
+        getLogger("python-injection").error(
+            "Failed to refresh `%s`, retrying in %.2fs.",
+            self.factory,
+            delay,
+            exc_info=exc,
+        )
+
+    async def __arefresh(self, generation: int) -> None:
+        try:
+            with handover():
+                instance = await self.factory.acall()
+
+        except Exception as exc:
+            self.__end_refresh(generation, exc=exc)
+
+        else:
+            entry = _TTLEntry(instance, monotonic() + self.ttl)
+            self.__end_refresh(generation, entry)
+
+    def __refresh(self, generation: int) -> None:
+        try:
+            with handover():
+                instance = self.factory.call()
+
+        except Exception as exc:
+            self.__end_refresh(generation, exc=exc)
+
+        else:
+            entry = _TTLEntry(instance, monotonic() + self.ttl)
+            self.__end_refresh(generation, entry)
+
+
+@dataclass(frozen=True, slots=True)
+class Key:
+    value: Hashable
+
+
+def get_key(annotation: Any) -> Key | None:
+    if get_origin(annotation) is not Annotated:
+        return None
+
+    for metadata in annotation.__metadata__:
+        if isinstance(metadata, Key):
+            return metadata
+
+    return None
 
 
 @dataclass(repr=False, eq=False, frozen=True, slots=True)
+class KeyedInjectable[T](BaseInjectable[T]):
+    max_size: int = field(default=128, kw_only=True)
+    on_evict: Callable[[T], Any] | None = field(default=None, kw_only=True)
+    __cache: OrderedDict[Hashable, T] = field(default_factory=OrderedDict, init=False)
+    __futures: dict[Hashable, asyncio.Future[T]] = field(
+        default_factory=dict,
+        init=False,
+    )
+    __key_locks: dict[Hashable, Lock] = field(default_factory=dict, init=False)
+    __lock: Lock = field(default_factory=Lock, init=False)
+
+    def __post_init__(self) -> None:
+        if self.max_size < 1:
+            raise ValueError("Cache size must be at least 1.")
+
+    async def aget_instance(self) -> NoReturn:
+        raise self.__missing_key()
+
+    def get_instance(self) -> NoReturn:
+        raise self.__missing_key()
+
+    async def aget_keyed_instance(self, key: Hashable) -> T:
+        # Only one task builds the instance of a key, the others wait for it.
+        futures = self.__futures
+        loop = asyncio.get_running_loop()
+
+        while (future := futures.get(key)) is not None and future.get_loop() is loop:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+
+                if not future.cancelled() or (task and task.cancelling()):
+                    raise
+
+        try:
+            return self.__hit(key)
+        except KeyError:
+            ...
+
+        future = futures[key] = loop.create_future()
+
+        try:
+            with handover():
+                instance = await self.factory.acall(key)
+
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Retrieved, so no warning is logged if nobody is waiting.
+            future.exception()
+            raise
+
+        else:
+            instance = self.__store(key, instance)
+            future.set_result(instance)
+            return instance
+
+        finally:
+            if futures.get(key) is future:
+                del futures[key]
+
+    def get_keyed_instance(self, key: Hashable) -> T:
+        try:
+            return self.__hit(key)
+        except KeyError:
+            ...
+
+        key_locks = self.__key_locks
+
+        with self.__lock:
+            key_lock = key_locks.setdefault(key, Lock())
+
+        # The factory is called under the lock of its key, so the other keys can be
+        # built at the same time.
+        with key_lock:
+            try:
+                return self.__hit(key)
+            except KeyError:
+                ...
+
+            try:
+                with handover():
+                    instance = self.factory.call(key)
+
+                return self.__store(key, instance)
+
+            finally:
+                with self.__lock:
+                    if key_locks.get(key) is key_lock:
+                        del key_locks[key]
+
+    def unlock(self) -> None:
+        with self.__lock:
+            evicted = list(self.__cache.values())
+            self.__cache.clear()
+
+        self.__close(evicted)
+
+    def __close(self, evicted: Iterable[T]) -> None:
+        if (on_evict := self.on_evict) is None:
+            return
+
+        for instance in evicted:
+            on_evict(instance)
+
+    def __store(self, key: Hashable, instance: T) -> T:
+        with self.__lock:
+            stored = self.__cache.setdefault(key, instance)
+            evicted = self.__evict()
+
+        # The instance built by a synchronous and an asynchronous resolution at the
+        # same time is closed like an evicted one.
+        if stored is not instance:
+            evicted.append(instance)
+
+        self.__close(evicted)
+        return stored
+
+    def __evict(self) -> list[T]:
+        cache = self.__cache
+        return [cache.popitem(last=False)[1] for _ in range(len(cache) - self.max_size)]
+
+    def __hit(self, key: Hashable) -> T:
+        cache = self.__cache
+        instance = cache[key]
+
+        with suppress(KeyError):
+            cache.move_to_end(key)
+
+        return instance
+
+    def __missing_key(self) -> InjectionError:
+        return InjectionError(
+            "A keyed injectable must be resolved with a key, use "
+            "`Annotated[T, Key(...)]` or the `key` parameter."
+        )
+
+
+@dataclass(repr=False, frozen=True, slots=True)
+class KeyedReference[T](Injectable[T]):
+    injectable: KeyedInjectable[T]
+    key: Hashable
+
+    @property
+    def is_locked(self) -> bool:
+        return self.injectable.is_locked
+
+    def unlock(self) -> None:
+        self.injectable.unlock()
+
+    async def aget_instance(self) -> T:
+        return await self.injectable.aget_keyed_instance(self.key)
+
+    def get_instance(self) -> T:
+        return self.injectable.get_keyed_instance(self.key)
+
+
+def bind_key[T](injectable: Injectable[T], key: Hashable) -> KeyedReference[T]:
+    if not isinstance(injectable, KeyedInjectable):
+        raise TypeError(f"`{injectable}` isn't a keyed injectable.")
+
+    return KeyedReference(injectable, key)
+
+
+@dataclass(repr=False, eq=False, frozen=True, slots=True, weakref_slot=True)
 class ScopedInjectable[R, T](Injectable[T], ABC):
     factory: Caller[..., R]
     scope_name: str
@@ -168,6 +786,46 @@ class SimpleScopedInjectable[T](ScopedInjectable[T, T]):
             scope.cache.pop(self, None)
 
 
+@dataclass(repr=False, eq=False, frozen=True, slots=True)
+class PooledScopedInjectable[T](ScopedInjectable[T, T]):
+    pool: ResourcePool[T] = field(default_factory=ResourcePool, kw_only=True)
+
+    @property
+    def metrics(self) -> PoolMetrics:
+        return self.pool.metrics
+
+    async def abuild(self, scope: Scope) -> T:
+        resource = await self.pool.aacquire(self.factory.acall)
+        return scope.enter(self.pool.releasing(resource))
+
+    def build(self, scope: Scope) -> T:
+        resource = self.pool.acquire(self.factory.call)
+        return scope.enter(self.pool.releasing(resource))
+
+    def unlock(self) -> None:
+        ScopedInjectable.unlock(self)
+        self.pool.clear()
+
+
+@dataclass(repr=False, frozen=True, slots=True)
+class LazyProxyInjectable[T](Injectable[T]):
+    injectable: Injectable[T]
+    cls: type[T] | None = None
+
+    @property
+    def is_locked(self) -> bool:
+        return self.injectable.is_locked
+
+    def unlock(self) -> None:
+        self.injectable.unlock()
+
+    async def aget_instance(self) -> T:
+        return self.get_instance()
+
+    def get_instance(self) -> T:
+        return LazyProxy(self.injectable.get_instance, self.cls)  # type: ignore[return-value]
+
+
 @dataclass(repr=False, frozen=True, slots=True)
 class ShouldBeInjectable[T](Injectable[T]):
     cls: type[T]
@@ -177,3 +835,35 @@ class ShouldBeInjectable[T](Injectable[T]):
 
     def get_instance(self) -> NoReturn:
         raise InjectionError(f"`{self.cls}` should be an injectable.")
+
+
+def unwrap_injectable(injectable: Injectable[Any]) -> Injectable[Any]:
+    while isinstance(injectable, KeyedReference | LazyProxyInjectable):
+        injectable = injectable.injectable
+
+    return injectable
+
+
+def is_inlinable(injectable: Injectable[Any]) -> bool:
+    return isinstance(injectable, ConstantInjectable | SingletonInjectable)
+
+
+_FORK_UNSAFE_INJECTABLES: Final[WeakSet[Injectable[Any]]] = WeakSet()
+
+
+def is_fork_safe(injectable: Injectable[Any]) -> bool:
+    return injectable not in _FORK_UNSAFE_INJECTABLES
+
+
+def mark_as_fork_unsafe[T](injectable: Injectable[T]) -> Injectable[T]:
+    _FORK_UNSAFE_INJECTABLES.add(injectable)
+    return injectable
+
+
+def _unlock_fork_unsafe_injectables() -> None:
+    for injectable in tuple(_FORK_UNSAFE_INJECTABLES):
+        injectable.unlock()
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=_unlock_fork_unsafe_injectables)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
-from collections import OrderedDict, deque
+from collections import ChainMap, OrderedDict, defaultdict, deque
 from collections.abc import (
     AsyncIterator,
     Awaitable,
     Callable,
     Collection,
+    Hashable,
     Iterable,
     Iterator,
     Mapping,
@@ -14,24 +16,30 @@ from collections.abc import (
 from contextlib import asynccontextmanager, contextmanager, nullcontext, suppress
 from dataclasses import dataclass, field
 from enum import StrEnum
-from functools import partialmethod, singledispatchmethod, update_wrapper
+from functools import partial, partialmethod, singledispatchmethod
+from importlib import import_module
 from inspect import (
+    Parameter,
     Signature,
+    isasyncgen,
     isasyncgenfunction,
+    isawaitable,
     isclass,
     iscoroutinefunction,
+    isgenerator,
     isgeneratorfunction,
     markcoroutinefunction,
 )
-from inspect import signature as inspect_signature
 from logging import Logger, getLogger
-from threading import Lock
-from types import MethodType
+from threading import Lock, RLock
+from time import perf_counter
+from types import MappingProxyType, MethodType
 from typing import (
     Any,
     AsyncContextManager,
     ClassVar,
     ContextManager,
+    Final,
     Literal,
     NamedTuple,
     Protocol,
@@ -39,6 +47,7 @@ from typing import (
     overload,
     runtime_checkable,
 )
+from weakref import WeakSet
 
 from injection._core.common.asynchronous import (
     AsyncCaller,
@@ -47,30 +56,61 @@ from injection._core.common.asynchronous import (
     SyncCaller,
 )
 from injection._core.common.event import Event, EventChannel, EventListener
-from injection._core.common.invertible import Invertible, SimpleInvertible
+from injection._core.common.invertible import Invertible
 from injection._core.common.key import new_short_key
-from injection._core.common.lazy import Lazy, alazy, lazy
+from injection._core.common.lazy import alazy, lazy
+from injection._core.common.memory import FreezeReport, freeze_heap
+from injection._core.common.pool import PoolMetrics
+from injection._core.common.proxy import get_lazy_type, is_lazy
 from injection._core.common.type import (
     InputType,
     TypeInfo,
+    get_qualified_name,
     get_return_types,
+    get_signature,
     get_yield_hint,
+    standardize_types,
 )
+from injection._core.graph import DependencyGraph, Lifetime
 from injection._core.hook import Hook, apply_hooks
 from injection._core.injectables import (
     AsyncCMScopedInjectable,
+    AsyncCMSingletonInjectable,
     CMScopedInjectable,
+    CMSingletonInjectable,
+    ConstantInjectable,
     Injectable,
+    LazyProxyInjectable,
+    PerResolutionInjectable,
+    PooledInjectable,
+    PooledScopedInjectable,
     ShouldBeInjectable,
     SimpleInjectable,
     SimpleScopedInjectable,
     SingletonInjectable,
+    bind_key,
+    get_key,
+    is_fork_safe,
+    is_inlinable,
+    mark_as_fork_unsafe,
+    unwrap_injectable,
+)
+from injection._core.resolution import Resolution, open_resolution
+from injection._core.scope import APPLICATION_SCOPE_NAME, adefine_scope, define_scope
+from injection._core.warmup import (
+    WarmupReport,
+    abuild_concurrently,
+    build_concurrently,
+    exclude_async,
+    is_buildable_in_advance,
+    make_warmup_report,
 )
 from injection.exceptions import (
     ModuleError,
     ModuleLockError,
     ModuleNotUsedError,
     NoInjectable,
+    UnresolvedDependencyError,
 )
 
 """
@@ -172,6 +212,11 @@ class Broker(Protocol):
     def is_locked(self) -> bool:
         raise NotImplementedError
 
+    @property
+    @abstractmethod
+    def records(self) -> Mapping[InputType[Any], Record[Any]]:
+        raise NotImplementedError
+
     @abstractmethod
     def unlock(self) -> Self:
         raise NotImplementedError
@@ -200,6 +245,8 @@ class Mode(StrEnum):
         return cls.NORMAL
 
 
+NO_KEY: Final[Any] = object()
+
 type ModeStr = Literal["fallback", "normal", "override"]
 
 type InjectableFactory[T] = Callable[[Caller[..., T]], Injectable[T]]
@@ -246,11 +293,21 @@ class Locator(Broker):
         default_factory=EventChannel,
         init=False,
     )
+    __deferred_updaters: deque[Updater[Any]] = field(
+        default_factory=deque,
+        init=False,
+    )
+    __flush_lock: RLock = field(
+        default_factory=RLock,
+        init=False,
+    )
 
     static_hooks: ClassVar[LocatorHooks[Any]] = LocatorHooks()
 
     def __getitem__[T](self, cls: InputType[T], /) -> Injectable[T]:
-        for input_class in self.__standardize_inputs((cls,)):
+        self.flush()
+
+        for input_class in self.standardize_inputs((cls,)):
             try:
                 record = self.__records[input_class]
             except KeyError:
@@ -261,14 +318,20 @@ class Locator(Broker):
         raise NoInjectable(cls)
 
     def __contains__(self, cls: InputType[Any], /) -> bool:
+        self.flush()
         return any(
             input_class in self.__records
-            for input_class in self.__standardize_inputs((cls,))
+            for input_class in self.standardize_inputs((cls,))
         )
 
     @property
     def is_locked(self) -> bool:
-        return any(injectable.is_locked for injectable in self.__injectables)
+        return any(record.injectable.is_locked for record in self.__records.values())
+
+    @property
+    def records(self) -> Mapping[InputType[Any], Record[Any]]:
+        self.flush()
+        return MappingProxyType(self.__records)
 
     @property
     def __injectables(self) -> frozenset[Injectable[Any]]:
@@ -287,6 +350,22 @@ class Locator(Broker):
 
         return self
 
+    def defer[T](self, updater: Updater[T]) -> Self:
+        self.__deferred_updaters.append(updater)
+        return self
+
+    def flush(self) -> Self:
+        if not self.__deferred_updaters:
+            return self
+
+        with self.__flush_lock:
+            updaters = self.__deferred_updaters
+
+            while updaters:
+                self.update(updaters.popleft())
+
+        return self
+
     def unlock(self) -> Self:
         for injectable in self.__injectables:
             injectable.unlock()
@@ -334,11 +413,12 @@ class Locator(Broker):
             self.static_hooks.on_conflict,
         )(new, existing, cls)
 
-    def __standardize_inputs[T](
-        self,
+    @classmethod
+    def standardize_inputs[T](
+        cls,
         classes: Iterable[InputType[T]],
     ) -> Iterable[InputType[T]]:
-        return apply_hooks(lambda c: c, self.static_hooks.on_input)(classes)
+        return apply_hooks(lambda c: c, cls.static_hooks.on_input)(classes)
 
     def __update_preprocessing[T](self, updater: Updater[T]) -> Updater[T]:
         return apply_hooks(lambda u: u, self.static_hooks.on_update)(updater)
@@ -361,6 +441,13 @@ class Priority(StrEnum):
 type PriorityStr = Literal["low", "high"]
 
 
+@dataclass(repr=False, eq=False, slots=True)
+class ModuleState:
+    defer_registration: bool = False
+    manifest: Mapping[str, Collection[str]] = field(default_factory=dict)
+    snapshot: Mapping[InputType[Any], Injectable[Any]] | None = None
+
+
 @dataclass(eq=False, frozen=True, slots=True)
 class Module(Broker, EventListener):
     name: str = field(default_factory=lambda: f"anonymous@{new_short_key()}")
@@ -384,6 +471,16 @@ class Module(Broker, EventListener):
         init=False,
         repr=False,
     )
+    __metadata_set: WeakSet[InjectMetadata[..., Any]] = field(
+        default_factory=WeakSet,
+        init=False,
+        repr=False,
+    )
+    __state: ModuleState = field(
+        default_factory=ModuleState,
+        init=False,
+        repr=False,
+    )
 
     __instances: ClassVar[dict[str, Module]] = {}
 
@@ -391,24 +488,64 @@ class Module(Broker, EventListener):
         self.__locator.add_listener(self)
 
     def __getitem__[T](self, cls: InputType[T], /) -> Injectable[T]:
+        if (snapshot := self.__state.snapshot) is not None:
+            with suppress(KeyError):
+                return snapshot[cls]
+
+            for input_class in Locator.standardize_inputs((cls,)):
+                with suppress(KeyError):
+                    return snapshot[input_class]
+
         for broker in self.__brokers:
             with suppress(KeyError):
                 return broker[cls]
 
+        try:
+            is_imported = self.__import_providers(cls)
+        except ModuleLockError as exc:
+            raise NoInjectable(cls) from exc
+
+        if is_imported:
+            return self[cls]
+
         raise NoInjectable(cls)
 
     def __contains__(self, cls: InputType[Any], /) -> bool:
-        return any(cls in broker for broker in self.__brokers)
+        if any(cls in broker for broker in self.__brokers):
+            return True
+
+        with suppress(ModuleLockError):
+            return self.__import_providers(cls) and cls in self
+
+        return False
+
+    @property
+    def is_frozen(self) -> bool:
+        return self.__state.snapshot is not None
 
     @property
     def is_locked(self) -> bool:
         return any(broker.is_locked for broker in self.__brokers)
 
+    @property
+    def inject_metadata(self) -> tuple[InjectMetadata[..., Any], ...]:
+        return tuple(self.__metadata_set)
+
+    @property
+    def records(self) -> Mapping[InputType[Any], Record[Any]]:
+        # The records of the brokers are read-only, so is the chain.
+        records = (broker.records for broker in self.__brokers)
+        return ChainMap(*records)  # type: ignore[arg-type]
+
     @property
     def __brokers(self) -> Iterator[Broker]:
         yield from self.__modules
         yield self.__locator
 
+    @property
+    def __injectables(self) -> frozenset[Injectable[Any]]:
+        return frozenset(record.injectable for record in self.records.values())
+
     def injectable[**P, T](
         self,
         wrapped: Callable[P, T] | Callable[P, Awaitable[T]] | None = None,
@@ -425,9 +562,16 @@ class Module(Broker, EventListener):
         ) -> Callable[P, T] | Callable[P, Awaitable[T]]:
             factory = extract_caller(self.make_injected_function(wp) if inject else wp)
             hints = on if ignore_type_hint else (wp, on)
+            injectable = cls(factory)  # type: ignore[arg-type]
+
+            if is_inlinable(injectable) and (
+                metadata := get_inject_metadata(injectable)
+            ):
+                metadata.release_after_call(self)
+
             updater = Updater(
                 classes=get_return_types(hints),
-                injectable=cls(factory),  # type: ignore[arg-type]
+                injectable=injectable,
                 mode=Mode(mode),
             )
             self.update(updater)
@@ -435,7 +579,81 @@ class Module(Broker, EventListener):
 
         return decorator(wrapped) if wrapped else decorator
 
-    singleton = partialmethod(injectable, cls=SingletonInjectable)
+    def singleton[**P, T](
+        self,
+        wrapped: Callable[P, T]
+        | Callable[P, Awaitable[T]]
+        | Callable[P, Iterator[T]]
+        | Callable[P, AsyncIterator[T]]
+        | None = None,
+        /,
+        *,
+        fork_safe: bool = True,
+        ignore_type_hint: bool = False,
+        inject: bool = True,
+        on: TypeInfo[T] = (),
+        mode: Mode | ModeStr = Mode.get_default(),
+    ) -> Any:
+        def decorator(
+            wp: Callable[P, T]
+            | Callable[P, Awaitable[T]]
+            | Callable[P, Iterator[T]]
+            | Callable[P, AsyncIterator[T]],
+        ) -> (
+            Callable[P, T]
+            | Callable[P, Awaitable[T]]
+            | Callable[P, Iterator[T]]
+            | Callable[P, AsyncIterator[T]]
+        ):
+            injectable_class: InjectableFactory[T]
+            wrapper: (
+                Callable[P, T]
+                | Callable[P, Awaitable[T]]
+                | Callable[P, ContextManager[T]]
+                | Callable[P, AsyncContextManager[T]]
+            )
+            hints: TypeInfo[Any]
+
+            if isasyncgenfunction(wp):
+                injectable_class = AsyncCMSingletonInjectable
+                wrapper = asynccontextmanager(wp)
+                hints = on if ignore_type_hint else (iter_yield_hint(wp), on)
+
+            elif isgeneratorfunction(wp):
+                injectable_class = CMSingletonInjectable
+                wrapper = contextmanager(wp)
+                hints = on if ignore_type_hint else (iter_yield_hint(wp), on)
+
+            else:
+                injectable_class = SingletonInjectable
+                wrapper = wp  # type: ignore[assignment]
+                hints = on if ignore_type_hint else (wp, on)
+
+            if not fork_safe:
+                if injectable_class is not SingletonInjectable:
+                    raise ValueError(
+                        "A generator singleton can't be marked with "
+                        "`fork_safe=False`, it's closed with the application scope."
+                    )
+
+                cls = injectable_class
+
+                def injectable_class(factory: Caller[..., T]) -> Injectable[T]:
+                    return mark_as_fork_unsafe(cls(factory))
+
+            self.injectable(
+                wrapper,
+                cls=injectable_class,
+                ignore_type_hint=True,
+                inject=inject,
+                on=hints,
+                mode=mode,
+            )
+            return wp
+
+        return decorator(wrapped) if wrapped else decorator
+
+    per_resolution = partialmethod(injectable, cls=PerResolutionInjectable)
 
     def scoped[**P, T](
         self,
@@ -464,22 +682,23 @@ class Module(Broker, EventListener):
                 | Callable[P, ContextManager[T]]
                 | Callable[P, AsyncContextManager[T]]
             )
+            hints: TypeInfo[Any]
 
             if isasyncgenfunction(wrapped):
-                hint = get_yield_hint(wrapped)
                 injectable_class = AsyncCMScopedInjectable
                 wrapper = asynccontextmanager(wrapped)
+                hints = (iter_yield_hint(wrapped), on)
 
             elif isgeneratorfunction(wrapped):
-                hint = get_yield_hint(wrapped)
                 injectable_class = CMScopedInjectable
                 wrapper = contextmanager(wrapped)
+                hints = (iter_yield_hint(wrapped), on)
 
             else:
                 injectable_class = SimpleScopedInjectable
-                hint = wrapper = wrapped  # type: ignore[assignment]
+                wrapper = wrapped  # type: ignore[assignment]
+                hints = (wrapped, on)
 
-            hints = on if hint is None else (hint, on)
             self.injectable(
                 wrapper,
                 cls=lambda factory: injectable_class(factory, scope_name),
@@ -513,9 +732,9 @@ class Module(Broker, EventListener):
         mode: Mode | ModeStr = Mode.get_default(),
     ) -> Any:
         def decorator(wp: type[T]) -> type[T]:
-            lazy_instance = lazy(wp)
             self.injectable(
-                lambda: ~lazy_instance,
+                wp,
+                cls=ConstantInjectable,
                 ignore_type_hint=True,
                 inject=False,
                 on=(wp, on),
@@ -536,6 +755,7 @@ class Module(Broker, EventListener):
         hints = on if alias else (type(instance), on)
         self.injectable(
             lambda: instance,
+            cls=ConstantInjectable,
             ignore_type_hint=True,
             inject=False,
             on=hints,
@@ -577,23 +797,39 @@ class Module(Broker, EventListener):
 
     def make_injected_function(self, wrapped, /, threadsafe=False):  # type: ignore[no-untyped-def]
         metadata = InjectMetadata(wrapped, threadsafe)
+        self.__metadata_set.add(metadata)
 
         @metadata.task
         def listen() -> None:
             metadata.update(self)
-            self.add_listener(metadata)
+
+            if not self.is_frozen:
+                self.add_listener(metadata)
 
         if iscoroutinefunction(wrapped):
             return AsyncInjectedFunction(metadata)
 
         return SyncInjectedFunction(metadata)
 
-    async def afind_instance[T](self, cls: InputType[T]) -> T:
+    async def afind_instance[T](
+        self,
+        cls: InputType[T],
+        *,
+        key: Hashable = NO_KEY,
+    ) -> T:
         injectable = self[cls]
+
+        if key is not NO_KEY:
+            injectable = bind_key(injectable, key)
+
         return await injectable.aget_instance()
 
-    def find_instance[T](self, cls: InputType[T]) -> T:
+    def find_instance[T](self, cls: InputType[T], *, key: Hashable = NO_KEY) -> T:
         injectable = self[cls]
+
+        if key is not NO_KEY:
+            injectable = bind_key(injectable, key)
+
         return injectable.get_instance()
 
     @overload
@@ -601,6 +837,8 @@ class Module(Broker, EventListener):
         self,
         cls: InputType[T],
         default: Default,
+        *,
+        key: Hashable = ...,
     ) -> T | Default: ...
 
     @overload
@@ -608,11 +846,13 @@ class Module(Broker, EventListener):
         self,
         cls: InputType[T],
         default: None = ...,
+        *,
+        key: Hashable = ...,
     ) -> T | None: ...
 
-    async def aget_instance(self, cls, default=None):  # type: ignore[no-untyped-def]
+    async def aget_instance(self, cls, default=None, *, key=NO_KEY):  # type: ignore[no-untyped-def]
         try:
-            return await self.afind_instance(cls)
+            return await self.afind_instance(cls, key=key)
         except KeyError:
             return default
 
@@ -621,6 +861,8 @@ class Module(Broker, EventListener):
         self,
         cls: InputType[T],
         default: Default,
+        *,
+        key: Hashable = ...,
     ) -> T | Default: ...
 
     @overload
@@ -628,11 +870,13 @@ class Module(Broker, EventListener):
         self,
         cls: InputType[T],
         default: None = ...,
+        *,
+        key: Hashable = ...,
     ) -> T | None: ...
 
-    def get_instance(self, cls, default=None):  # type: ignore[no-untyped-def]
+    def get_instance(self, cls, default=None, *, key=NO_KEY):  # type: ignore[no-untyped-def]
         try:
-            return self.find_instance(cls)
+            return self.find_instance(cls, key=key)
         except KeyError:
             return default
 
@@ -658,9 +902,8 @@ class Module(Broker, EventListener):
         if cache:
             return alazy(lambda: self.aget_instance(cls, default))
 
-        function = self.make_injected_function(lambda instance=default: instance)
-        metadata = function.__inject_metadata__.set_owner(cls)
-        return SimpleAwaitable(metadata.acall)
+        handle: LazyInstanceHandle[Any] = LazyInstanceHandle(cls, default, self)
+        return SimpleAwaitable(handle.aget_instance)
 
     @overload
     def get_lazy_instance[T, Default](
@@ -684,12 +927,31 @@ class Module(Broker, EventListener):
         if cache:
             return lazy(lambda: self.get_instance(cls, default))
 
-        function = self.make_injected_function(lambda instance=default: instance)
-        metadata = function.__inject_metadata__.set_owner(cls)
-        return SimpleInvertible(metadata.call)
+        return LazyInstanceHandle(cls, default, self)
 
     def update[T](self, updater: Updater[T]) -> Self:
-        self.__locator.update(updater)
+        self.__check_freezing()
+        locator = self.__locator
+
+        if self.__state.defer_registration:
+            # Locking is checked now, the first lookup is too late to fail.
+            self.__check_locking()
+            locator.defer(updater)
+        else:
+            locator.update(updater)
+
+        return self
+
+    def defer_registration(self, enabled: bool = True) -> Self:
+        self.__state.defer_registration = enabled
+
+        if not enabled:
+            self.__locator.flush()
+
+        return self
+
+    def set_manifest(self, manifest: Mapping[str, Collection[str]]) -> Self:
+        self.__state.manifest = manifest
         return self
 
     def init_modules(self, *modules: Module) -> Self:
@@ -783,6 +1045,125 @@ class Module(Broker, EventListener):
         for broker in self.__brokers:
             await broker.all_ready()
 
+    def prefork(self, *classes: InputType[Any]) -> FreezeReport:
+        injectables: Iterable[Injectable[Any]]
+
+        if classes:
+            injectables = (self[cls] for cls in classes)
+        else:
+            injectables = (
+                injectable
+                for injectable in self.__injectables
+                if isinstance(injectable, ConstantInjectable | SingletonInjectable)
+                and not isinstance(
+                    injectable, AsyncCMSingletonInjectable | CMSingletonInjectable
+                )
+                and not isinstance(injectable.factory, AsyncCaller)
+                and is_fork_safe(injectable)
+            )
+
+        for injectable in injectables:
+            injectable.get_instance()
+
+        return freeze_heap()
+
+    def freeze(self) -> Self:
+        if self.is_frozen:
+            return self
+
+        self.__locator.flush()
+        snapshot = {cls: record.injectable for cls, record in self.records.items()}
+        self.__state.snapshot = MappingProxyType(snapshot)
+
+        for metadata in tuple(self.__metadata_set):
+            metadata.freeze()
+            self.remove_listener(metadata)
+
+        return self
+
+    def compile(self, *, strict: bool = False) -> Self:
+        self.__locator.flush()
+
+        for module in self.__modules:
+            module.compile(strict=strict)
+
+        compiled: set[InjectMetadata[..., Any]] = set()
+        messages = []
+
+        # Resolving dependencies can import providers that inject new functions.
+        while metadata_list := [
+            metadata
+            for metadata in tuple(self.__metadata_set)
+            if metadata not in compiled
+        ]:
+            compiled.update(metadata_list)
+
+            for metadata in metadata_list:
+                if parameters := metadata.unresolved_parameters:
+                    formatted_parameters = ", ".join(f"`{p}`" for p in parameters)
+                    messages.append(
+                        f"`{metadata.wrapped}` has unresolved parameters: "
+                        f"{formatted_parameters}."
+                    )
+
+        if strict and messages:
+            raise UnresolvedDependencyError("\n".join(messages))
+
+        for message in messages:
+            self.__warning(message)
+
+        return self
+
+    def get_pool_metrics(self, cls: InputType[Any]) -> PoolMetrics:
+        injectable = self[cls]
+
+        if not isinstance(injectable, PooledInjectable | PooledScopedInjectable):
+            raise TypeError(f"`{cls}` isn't registered with a pooled injectable.")
+
+        return injectable.metrics
+
+    def get_dependency_graph(self) -> DependencyGraph:
+        roots: defaultdict[Injectable[Any], list[InputType[Any]]] = defaultdict(list)
+
+        for cls, record in self.records.items():
+            roots[record.injectable].append(cls)
+
+        return DependencyGraph.build(roots, partial(get_dependencies, module=self))
+
+    def warmup(self, *, max_workers: int | None = None) -> WarmupReport:
+        start = perf_counter()
+        graph = self.get_dependency_graph()
+        dependencies = exclude_async(graph, graph.project(is_buildable_in_advance))
+        durations = build_concurrently(dependencies, max_workers)
+        return make_warmup_report(graph, durations, perf_counter() - start)
+
+    async def awarmup(self, *, max_workers: int | None = None) -> WarmupReport:
+        start = perf_counter()
+        graph = self.get_dependency_graph()
+        dependencies = graph.project(is_buildable_in_advance)
+        durations = await abuild_concurrently(dependencies, max_workers)
+        return make_warmup_report(graph, durations, perf_counter() - start)
+
+    @contextmanager
+    def lifespan(self, *, max_workers: int | None = None) -> Iterator[WarmupReport]:
+        try:
+            with define_scope(APPLICATION_SCOPE_NAME, shared=True):
+                yield self.warmup(max_workers=max_workers)
+        finally:
+            self.__unlock_application_dependents()
+
+    @asynccontextmanager
+    async def alifespan(
+        self,
+        *,
+        max_workers: int | None = None,
+    ) -> AsyncIterator[WarmupReport]:
+        try:
+            async with adefine_scope(APPLICATION_SCOPE_NAME, shared=True):
+                yield await self.awarmup(max_workers=max_workers)
+        finally:
+            self.__unlock_application_dependents()
+
     def add_logger(self, logger: Logger) -> Self:
         self.__loggers.append(logger)
         return self
@@ -814,10 +1195,60 @@ class Module(Broker, EventListener):
         for logger in self.__loggers:
             logger.debug(message)
 
+    def __warning(self, message: object) -> None:
+        for logger in self.__loggers:
+            logger.warning(message)
+
+    def __check_freezing(self) -> None:
+        if self.is_frozen:
+            raise ModuleLockError(f"`{self}` is frozen.")
+
     def __check_locking(self) -> None:
+        self.__check_freezing()
+
         if self.is_locked:
             raise ModuleLockError(f"`{self}` is locked.")
 
+    def __unlock_application_dependents(self) -> None:
+        # The cached instances built with a closed application singleton are rebuilt
+        # in the next lifespan.
+        graph = self.get_dependency_graph()
+        dependents = graph.find_dependents(
+            lambda node: node.lifetime == Lifetime.APPLICATION
+        )
+
+        for node in dependents:
+            if node.lifetime in {
+                Lifetime.KEYED,
+                Lifetime.POOLED,
+                Lifetime.SINGLETON,
+                Lifetime.TTL,
+            }:
+                node.injectable.unlock()
+
+    def __import_providers(self, cls: InputType[Any]) -> bool:
+        if not (manifest := self.__state.manifest):
+            return False
+
+        module_names = tuple(
+            module_name
+            for tp in standardize_types(cls)
+            for module_name in manifest.get(get_qualified_name(tp), ())
+            if module_name not in sys.modules
+        )
+
+        if module_names and (self.is_frozen or self.is_locked):
+            formatted_names = ", ".join(f"`{name}`" for name in module_names)
+            raise ModuleLockError(
+                f"`{self}` is locked, the providers of `{cls}` can't be imported: "
+                f"{formatted_names}. Call `compile` before any singleton is built."
+            )
+
+        for module_name in module_names:
+            import_module(module_name)
+
+        return bool(module_names)
+
     def __move_module(self, module: Module, priority: Priority) -> None:
         last = priority != Priority.HIGH
 
@@ -854,42 +1285,124 @@ InjectedFunction
 """
 
 
-@dataclass(repr=False, frozen=True, slots=True)
 class Dependencies:
-    lazy_mapping: Lazy[Mapping[str, Injectable[Any]]]
+    __slots__ = (
+        "__factories",
+        "__generation",
+        "__instances",
+        "__is_complete",
+        "__iterable",
+        "__mapping",
+    )
+
+    __factories: Mapping[str, Callable[[], Any]] | None
+    __generation: int
+    __instances: dict[str, Any]
+    __is_complete: bool
+    __iterable: Iterable[tuple[str, Injectable[Any]]]
+    __mapping: Mapping[str, Injectable[Any]] | None
+
+    def __init__(self, iterable: Iterable[tuple[str, Injectable[Any]]]) -> None:
+        self.__factories = None
+        self.__generation = -1
+        self.__is_complete = False
+        self.__iterable = iterable
+        self.__mapping = None
 
     def __iter__(self) -> Iterator[tuple[str, Any]]:
-        for name, injectable in self.mapping.items():
-            instance = injectable.get_instance()
+        instances = self.__get_inlined_instances()
+
+        if self.__is_complete:
+            yield from instances.items()
+            return
+
+        mapping = self.mapping
+        factories = self.__get_factories()
+
+        for name, injectable in mapping.items():
+            try:
+                instance = instances[name]
+            except KeyError:
+                instance = factories[name]()
+
+                if is_inlinable(injectable):
+                    instances[name] = instance
+
             yield name, instance
 
+        self.__is_complete = len(instances) == len(mapping)
+
     async def __aiter__(self) -> AsyncIterator[tuple[str, Any]]:
-        for name, injectable in self.mapping.items():
-            instance = await injectable.aget_instance()
+        instances = self.__get_inlined_instances()
+
+        if self.__is_complete:
+            for item in instances.items():
+                yield item
+
+            return
+
+        mapping = self.mapping
+
+        for name, injectable in mapping.items():
+            try:
+                instance = instances[name]
+            except KeyError:
+                instance = await injectable.aget_instance()
+
+                if is_inlinable(injectable):
+                    instances[name] = instance
+
             yield name, instance
 
+        self.__is_complete = len(instances) == len(mapping)
+
     @property
     def are_resolved(self) -> bool:
-        return self.lazy_mapping.is_set
+        return self.__mapping is not None
 
     @property
     def mapping(self) -> Mapping[str, Injectable[Any]]:
-        return ~self.lazy_mapping
+        if (mapping := self.__mapping) is None:
+            mapping = self.__mapping = dict(self.__iterable)
+            self.__iterable = ()
+
+        return mapping
 
     async def aget_arguments(self) -> dict[str, Any]:
         return {key: value async for key, value in self}
 
     def get_arguments(self) -> dict[str, Any]:
+        if self.__is_complete and self.__generation == SingletonInjectable.generation:
+            return self.__instances.copy()
+
         return dict(self)
 
+    def __get_factories(self) -> Mapping[str, Callable[[], Any]]:
+        if (factories := self.__factories) is None:
+            factories = self.__factories = {
+                name: ConstructionPlan.compile(injectable)
+                for name, injectable in self.mapping.items()
+            }
+
+        return factories
+
+    def __get_inlined_instances(self) -> dict[str, Any]:
+        generation = SingletonInjectable.generation
+
+        if self.__generation != generation:
+            self.__generation = generation
+            self.__instances = {}
+            self.__is_complete = False
+
+        return self.__instances
+
     @classmethod
     def from_iterable(cls, iterable: Iterable[tuple[str, Injectable[Any]]]) -> Self:
-        lazy_mapping = Lazy(lambda: dict(iterable))
-        return cls(lazy_mapping)
+        return cls(iterable)
 
     @classmethod
     def empty(cls) -> Self:
-        return cls.from_iterable(())
+        return cls(())
 
     @classmethod
     def resolve(
@@ -914,6 +1427,12 @@ class Dependencies:
             except KeyError:
                 continue
 
+            if key := get_key(annotation):
+                injectable = bind_key(injectable, key.value)
+
+            if is_lazy(annotation):
+                injectable = LazyProxyInjectable(injectable, get_lazy_type(annotation))
+
             yield name, injectable
 
     @staticmethod
@@ -936,28 +1455,94 @@ class Arguments(NamedTuple):
     kwargs: Mapping[str, Any]
 
 
+type Step = tuple[Callable[..., Any], tuple[tuple[str, int], ...]]
+
+
+@dataclass(repr=False, eq=False, frozen=True, slots=True)
+class ConstructionPlan:
+    steps: tuple[Step, ...]
+
+    max_steps: ClassVar[int] = 256
+
+    def build(self) -> Any:
+        instances: list[Any] = []
+
+        for function, arguments in self.steps:
+            kwargs = {name: instances[index] for name, index in arguments}
+            instances.append(function(**kwargs))
+
+        return instances[-1]
+
+    @classmethod
+    def compile(cls, injectable: Injectable[Any]) -> Callable[[], Any]:
+        if get_flat_dependencies(injectable) is None:
+            return injectable.get_instance
+
+        steps: list[Step] = []
+        cls.__add_step(injectable, steps, set())
+        return cls(tuple(steps)).build
+
+    @classmethod
+    def __add_step(
+        cls,
+        injectable: Injectable[Any],
+        steps: list[Step],
+        path: set[Injectable[Any]],
+    ) -> int:
+        dependencies = None
+
+        if injectable not in path and len(steps) < cls.max_steps:
+            dependencies = get_flat_dependencies(injectable)
+
+        if dependencies is None:
+            steps.append((injectable.get_instance, ()))
+            return len(steps) - 1
+
+        path.add(injectable)
+        arguments = tuple(
+            (name, cls.__add_step(dependency, steps, path))
+            for name, dependency in dependencies.items()
+        )
+        path.remove(injectable)
+        metadata = injectable.factory  # type: ignore[attr-defined]
+        steps.append((metadata.wrapped, arguments))
+        return len(steps) - 1
+
+
+_NULL_CONTEXT = nullcontext()
+
+
 class InjectMetadata[**P, T](Caller[P, T], EventListener):
     __slots__ = (
         "__dependencies",
+        "__is_released",
         "__lock",
         "__owner",
+        "__positions",
+        "__releaser",
         "__signature",
         "__tasks",
         "__wrapped",
     )
 
     __dependencies: Dependencies
+    __is_released: bool
     __lock: ContextManager[Any]
     __owner: type | None
+    __positions: Mapping[str, int] | None
+    __releaser: Module | None
     __signature: Signature
-    __tasks: deque[Callable[..., Any]]
+    __tasks: list[Callable[..., Any]]
     __wrapped: Callable[P, T]
 
     def __init__(self, wrapped: Callable[P, T], /, threadsafe: bool) -> None:
         self.__dependencies = Dependencies.empty()
-        self.__lock = Lock() if threadsafe else nullcontext()
+        self.__is_released = False
+        self.__lock = Lock() if threadsafe else _NULL_CONTEXT
         self.__owner = None
-        self.__tasks = deque()
+        self.__positions = None
+        self.__releaser = None
+        self.__tasks = []
         self.__wrapped = wrapped
 
     @property
@@ -965,10 +1550,38 @@ class InjectMetadata[**P, T](Caller[P, T], EventListener):
         with suppress(AttributeError):
             return self.__signature
 
-        signature = inspect_signature(self.wrapped, eval_str=True)
+        signature = get_signature(self.wrapped)
         self.__signature = signature
         return signature
 
+    @property
+    def dependencies(self) -> Dependencies:
+        with self.__lock:
+            self.__run_tasks()
+
+            # Resolved without being stored, the module isn't listened to.
+            if self.__is_released and (module := self.__releaser) is not None:
+                return self.__resolve(module)
+
+        return self.__dependencies
+
+    @property
+    def unresolved_parameters(self) -> tuple[Parameter, ...]:
+        mapping = self.dependencies.mapping
+        parameters = iter(self.signature.parameters.values())
+
+        if self.__owner:
+            next(parameters, None)
+
+        return tuple(
+            parameter
+            for parameter in parameters
+            if parameter.name not in mapping
+            and parameter.default is Parameter.empty
+            and parameter.annotation is not Parameter.empty
+            and parameter.kind not in {Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD}
+        )
+
     @property
     def wrapped(self) -> Callable[P, T]:
         return self.__wrapped
@@ -990,18 +1603,107 @@ class InjectMetadata[**P, T](Caller[P, T], EventListener):
         return self.__bind(args, kwargs, additional_arguments)
 
     async def acall(self, /, *args: P.args, **kwargs: P.kwargs) -> T:
+        if (positions := self.__positions) is not None:
+            with self.__lock, open_resolution() as resolution:
+                additional_arguments = await self.__dependencies.aget_arguments()
+
+            return self.__close_after(
+                resolution,
+                self.__direct_call,
+                positions,
+                args,
+                kwargs,
+                additional_arguments,
+            )
+
         with self.__lock:
             self.__run_tasks()
-            arguments = await self.abind(args, kwargs)
+            self.__restore()
+
+            with open_resolution() as resolution:
+                arguments = await self.abind(args, kwargs)
 
-        return self.wrapped(*arguments.args, **arguments.kwargs)
+            if (module := self.__releaser) is not None:
+                self.__release(module)
+
+        return self.__close_after(
+            resolution,
+            self.wrapped,
+            *arguments.args,
+            **arguments.kwargs,
+        )
 
     def call(self, /, *args: P.args, **kwargs: P.kwargs) -> T:
+        if (positions := self.__positions) is not None:
+            with self.__lock, open_resolution() as resolution:
+                additional_arguments = self.__dependencies.get_arguments()
+
+            return self.__close_after(
+                resolution,
+                self.__direct_call,
+                positions,
+                args,
+                kwargs,
+                additional_arguments,
+            )
+
+        with self.__lock:
+            self.__run_tasks()
+            self.__restore()
+
+            with open_resolution() as resolution:
+                arguments = self.bind(args, kwargs)
+
+            if (module := self.__releaser) is not None:
+                self.__release(module)
+
+        return self.__close_after(
+            resolution,
+            self.wrapped,
+            *arguments.args,
+            **arguments.kwargs,
+        )
+
+    def freeze(self) -> Self:
+        with self.__lock:
+            self.__run_tasks()
+            self.__restore()
+
+        mapping = self.__dependencies.mapping
+        positions = {}
+
+        for position, (name, parameter) in enumerate(self.signature.parameters.items()):
+            if name not in mapping:
+                continue
+
+            if parameter.kind == Parameter.POSITIONAL_ONLY:
+                return self
+
+            if parameter.kind != Parameter.POSITIONAL_OR_KEYWORD:
+                position = sys.maxsize
+
+            positions[name] = position
+
+        self.__positions = positions
+        return self
+
+    def flatten(self) -> Mapping[str, Injectable[Any]] | None:
+        if self.__owner:
+            return None
+
         with self.__lock:
             self.__run_tasks()
-            arguments = self.bind(args, kwargs)
 
-        return self.wrapped(*arguments.args, **arguments.kwargs)
+        mapping = self.dependencies.mapping
+
+        for name, parameter in self.signature.parameters.items():
+            if name in mapping and parameter.kind not in {
+                Parameter.KEYWORD_ONLY,
+                Parameter.POSITIONAL_OR_KEYWORD,
+            }:
+                return None
+
+        return mapping
 
     def set_owner(self, owner: type) -> Self:
         if self.__dependencies.are_resolved:
@@ -1015,8 +1717,20 @@ class InjectMetadata[**P, T](Caller[P, T], EventListener):
         self.__owner = owner
         return self
 
+    def get_dependency_mapping(self, module: Module) -> Mapping[str, Injectable[Any]]:
+        # Doesn't run the pending tasks, the module isn't listened to.
+        if self.__tasks or self.__is_released:
+            return self.__resolve(module).mapping
+
+        return self.__dependencies.mapping
+
+    def release_after_call(self, module: Module) -> Self:
+        # For factories called once until `unlock`, like those of singletons.
+        self.__releaser = module
+        return self
+
     def update(self, module: Module) -> Self:
-        self.__dependencies = Dependencies.resolve(self.signature, module, self.__owner)
+        self.__dependencies = self.__resolve(module)
         return self
 
     def task[**_P, _T](self, wrapped: Callable[_P, _T] | None = None, /) -> Any:
@@ -1052,20 +1766,167 @@ class InjectMetadata[**P, T](Caller[P, T], EventListener):
         bound.arguments = bound.arguments | additional_arguments | bound.arguments
         return Arguments(bound.args, bound.kwargs)
 
+    @staticmethod
+    def __close_after[**_P, _T](
+        resolution: Resolution | None,
+        function: Callable[_P, _T],
+        /,
+        *args: _P.args,
+        **kwargs: _P.kwargs,
+    ) -> _T:
+        if resolution is None:
+            return function(*args, **kwargs)
+
+        try:
+            result = function(*args, **kwargs)
+        except BaseException:
+            resolution.close()
+            raise
+
+        # The resolution is closed once the result is consumed, the dependencies
+        # are still in use until then.
+        if isawaitable(result):
+            return resolution.close_after(result)  # type: ignore[return-value]
+
+        if isgenerator(result):
+            return resolution.close_after_iteration(result)  # type: ignore[return-value]
+
+        if isasyncgen(result):
+            return resolution.aclose_after_iteration(result)  # type: ignore[return-value]
+
+        resolution.close()
+        return result
+
+    def __direct_call(
+        self,
+        positions: Mapping[str, int],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        additional_arguments: dict[str, Any],
+    ) -> T:
+        if args or kwargs:
+            length = len(args)
+            additional_arguments = {
+                name: value
+                for name, value in additional_arguments.items()
+                if positions[name] >= length and name not in kwargs
+            }
+
+        return self.wrapped(*args, **additional_arguments, **kwargs)
+
+    def __release(self, module: Module) -> None:
+        # The dependencies are resolved again on the next call, which happens after
+        # `unlock`. Listening to the module until then would keep them up to date
+        # for nothing.
+        module.remove_listener(self)
+        self.__dependencies = Dependencies.empty()
+        self.__is_released = True
+
+    def __resolve(self, module: Module) -> Dependencies:
+        return Dependencies.resolve(self.signature, module, self.__owner)
+
+    def __restore(self) -> None:
+        if self.__is_released and (module := self.__releaser) is not None:
+            self.update(module)
+            self.__is_released = False
+
     def __run_tasks(self) -> None:
         while tasks := self.__tasks:
-            task = tasks.popleft()
+            task = tasks.pop(0)
             task()
 
 
+class LazyInstanceHandle[T](Invertible[T], EventListener):
+    __slots__ = ("__cls", "__default", "__injectable", "__module")
+
+    __cls: InputType[T]
+    __default: Any
+    __injectable: Injectable[T] | None
+    __module: Module
+
+    def __init__(self, cls: InputType[T], default: Any, module: Module) -> None:
+        self.__cls = cls
+        self.__default = default
+        self.__injectable = None
+        self.__module = module
+
+        if not module.is_frozen:
+            module.add_listener(self)
+
+    def __invert__(self) -> T:
+        if (injectable := self.__get_injectable()) is None:
+            return self.__default
+
+        return injectable.get_instance()
+
+    async def aget_instance(self) -> T:
+        if (injectable := self.__get_injectable()) is None:
+            return self.__default
+
+        return await injectable.aget_instance()
+
+    @singledispatchmethod
+    def on_event(self, event: Event, /) -> ContextManager[None] | None:  # type: ignore[override]
+        return None
+
+    @on_event.register
+    @contextmanager
+    def _(self, event: ModuleEvent, /) -> Iterator[None]:
+        yield
+        self.__injectable = None
+
+    def __get_injectable(self) -> Injectable[T] | None:
+        if (injectable := self.__injectable) is None:
+            try:
+                injectable = self.__injectable = self.__module[self.__cls]
+            except KeyError:
+                return None
+
+        return injectable
+
+
+class _WrappedAttribute:
+    __slots__ = ("__default", "__name")
+
+    __default: Any
+    __name: str
+
+    def __init__(self, name: str, default: Any) -> None:
+        self.__default = default
+        self.__name = name
+
+    def __get__(self, instance: object | None, owner: type | None = None) -> Any:
+        if instance is None:
+            return self.__default
+
+        return getattr(getattr(instance, "__wrapped__"), self.__name)
+
+
 class InjectedFunction[**P, T](ABC):
-    __slots__ = ("__dict__", "__inject_metadata__")
+    # The attributes of the wrapped function are forwarded instead of being copied
+    # by `functools.update_wrapper`. The `__dict__` is only created when an attribute
+    # is set on the injected function (by a decorator for example).
+    __slots__ = ("__dict__", "__inject_metadata__", "__wrapped__")
 
     __inject_metadata__: InjectMetadata[P, T]
+    __wrapped__: Callable[P, T]
 
     def __init__(self, metadata: InjectMetadata[P, T]) -> None:
-        update_wrapper(self, metadata.wrapped)
         self.__inject_metadata__ = metadata
+        self.__wrapped__ = metadata.wrapped
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # Defined on each class, they must be replaced to be forwarded.
+        for name in ("__annotations__", "__doc__", "__module__"):
+            setattr(cls, name, _WrappedAttribute(name, cls.__dict__.get(name)))
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "__wrapped__":
+            raise AttributeError(name)
+
+        return getattr(self.__wrapped__, name)
 
     def __repr__(self) -> str:  # pragma: no cover
         return repr(self.__inject_metadata__.wrapped)
@@ -1092,7 +1953,7 @@ class InjectedFunction[**P, T](ABC):
 
 
 class AsyncInjectedFunction[**P, T](InjectedFunction[P, Awaitable[T]]):
-    __slots__ = ()
+    __slots__ = ("_is_coroutine_marker",)
 
     def __init__(self, metadata: InjectMetadata[P, Awaitable[T]]) -> None:
         super().__init__(metadata)
@@ -1119,3 +1980,51 @@ def extract_caller[**P, T](
         return function.__inject_metadata__
 
     return SyncCaller(function)  # type: ignore[arg-type]
+
+
+def get_inject_metadata(injectable: Injectable[Any]) -> InjectMetadata[..., Any] | None:
+    factory = getattr(injectable, "factory", None)
+
+    if isinstance(factory, AsyncCaller):
+        factory = getattr(factory.callable, "__inject_metadata__", None)
+
+    if isinstance(factory, InjectMetadata):
+        return factory
+
+    return None
+
+
+def get_flat_dependencies(
+    injectable: Injectable[Any],
+) -> Mapping[str, Injectable[Any]] | None:
+    if type(injectable) is not SimpleInjectable:
+        return None
+
+    factory = injectable.factory
+
+    if not isinstance(factory, InjectMetadata):
+        return None
+
+    return factory.flatten()
+
+
+def get_dependencies(
+    injectable: Injectable[Any],
+    module: Module,
+) -> Iterator[tuple[Injectable[Any], bool]]:
+    # Yields each dependency with whether it's lazy.
+    metadata = get_inject_metadata(injectable)
+
+    if metadata is None:
+        return
+
+    for dependency in metadata.get_dependency_mapping(module).values():
+        is_lazy_dependency = isinstance(dependency, LazyProxyInjectable)
+        yield unwrap_injectable(dependency), is_lazy_dependency
+
+
+def iter_yield_hint[T](
+    function: Callable[..., Iterator[T]] | Callable[..., AsyncIterator[T]],
+) -> Iterator[InputType[T]]:
+    if (hint := get_yield_hint(function)) is not None:
+        yield hint
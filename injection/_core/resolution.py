@@ -0,0 +1,144 @@
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Iterator
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Any, ContextManager, Final
+
+
+@dataclass(repr=False, eq=False, frozen=True, slots=True)
+class Resolution:
+    instances: dict[Any, Any] = field(default_factory=dict, init=False)
+    callbacks: list[Callable[[], Any]] = field(default_factory=list, init=False)
+    # Set while building an instance that is kept, like a singleton.
+    is_handover: bool = field(default=False, kw_only=True)
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    async def close_after[T](self, awaitable: Awaitable[T]) -> T:
+        with self:
+            return await awaitable
+
+    def close_after_iteration[Y, S, R](
+        self,
+        generator: Generator[Y, S, R],
+    ) -> Generator[Y, S, R]:
+        with self:
+            return (yield from generator)
+
+    async def aclose_after_iteration[Y, S](
+        self,
+        generator: AsyncGenerator[Y, S],
+    ) -> AsyncGenerator[Y, S]:
+        # There's no `yield from` for asynchronous generators.
+        with self:
+            try:
+                value = await anext(generator)
+            except StopAsyncIteration:
+                return
+
+            while True:
+                try:
+                    sent = yield value
+                except GeneratorExit:
+                    await generator.aclose()
+                    raise
+                except BaseException as exc:
+                    try:
+                        value = await generator.athrow(exc)
+                    except StopAsyncIteration:
+                        return
+                else:
+                    try:
+                        value = await generator.asend(sent)
+                    except StopAsyncIteration:
+                        return
+
+    def close(self) -> None:
+        callbacks = self.callbacks
+
+        while callbacks:
+            callback = callbacks.pop()
+            callback()
+
+
+@dataclass(repr=False, slots=True)
+class _ResolutionState:
+    # Shouldn't be instantiated outside `__STATE`.
+
+    is_enabled: bool = field(default=False, init=False)
+    __context_var: ContextVar[Resolution | None] = field(
+        default_factory=lambda: ContextVar("resolution", default=None),
+        init=False,
+    )
+
+    @property
+    def resolution(self) -> Resolution | None:
+        return self.__context_var.get()
+
+    @contextmanager
+    def handover(self) -> Iterator[None]:
+        token = self.__context_var.set(Resolution(is_handover=True))
+
+        try:
+            yield
+        finally:
+            self.__context_var.reset(token)
+
+    @contextmanager
+    def open(self) -> Iterator[Resolution | None]:
+        if self.__context_var.get() is not None:
+            yield None
+            return
+
+        resolution = Resolution()
+        token = self.__context_var.set(resolution)
+
+        try:
+            yield resolution
+        except BaseException:
+            resolution.close()
+            raise
+        finally:
+            self.__context_var.reset(token)
+
+
+__STATE: Final[_ResolutionState] = _ResolutionState()
+__NULL_CONTEXT: Final[ContextManager[None]] = nullcontext()
+
+
+def enable_resolution() -> None:
+    __STATE.is_enabled = True
+
+
+def get_resolution() -> Resolution | None:
+    return __STATE.resolution
+
+
+def handover() -> ContextManager[None]:
+    # Instances lent while it's open are kept by the built instance.
+    state = __STATE
+
+    if not state.is_enabled:
+        return __NULL_CONTEXT
+
+    return state.handover()
+
+
+def open_resolution() -> ContextManager[Resolution | None]:
+    # Costs nothing until an injectable needing a resolution has been created.
+    state = __STATE
+
+    if not state.is_enabled:
+        return __NULL_CONTEXT
+
+    return state.open()
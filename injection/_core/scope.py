@@ -82,6 +82,8 @@ class _ScopeState:
 
 __SCOPES: Final[defaultdict[str, _ScopeState]] = defaultdict(_ScopeState)
 
+APPLICATION_SCOPE_NAME: Final[str] = "__application__"
+
 
 @asynccontextmanager
 async def adefine_scope(name: str, *, shared: bool = False) -> AsyncIterator[None]:
@@ -112,6 +114,17 @@ def get_scope(name: str) -> Scope:
     return scope
 
 
+def get_application_scope() -> Scope:
+    scope = __SCOPES[APPLICATION_SCOPE_NAME].get_scope()
+
+    if scope is None:
+        raise ScopeUndefinedError(
+            "Application scope isn't defined, open it with `lifespan` or `alifespan`."
+        )
+
+    return scope
+
+
 @contextmanager
 def _bind_scope(name: str, scope: Scope, shared: bool) -> Iterator[None]:
     state = __SCOPES[name]
@@ -0,0 +1,162 @@
+from asyncio import FIRST_COMPLETED as ASYNC_FIRST_COMPLETED
+from asyncio import Task, create_task, get_running_loop
+from asyncio import wait as async_wait
+from collections.abc import Collection, Mapping
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor
+from concurrent.futures import wait as sync_wait
+from contextvars import copy_context
+from graphlib import TopologicalSorter
+from time import perf_counter
+from typing import Any, NamedTuple
+
+from injection._core.common.asynchronous import AsyncCaller
+from injection._core.common.type import InputType
+from injection._core.graph import DependencyGraph, Lifetime, Node
+from injection._core.injectables import (
+    AsyncCMSingletonInjectable,
+    ConstantInjectable,
+    Injectable,
+)
+from injection._core.scope import APPLICATION_SCOPE_NAME, get_active_scopes
+
+type DependencyMapping = Mapping[Injectable[Any], Collection[Injectable[Any]]]
+
+
+class WarmupEntry(NamedTuple):
+    classes: tuple[InputType[Any], ...]
+    duration: float
+
+
+class WarmupReport(NamedTuple):
+    entries: tuple[WarmupEntry, ...]
+    duration: float
+
+
+def is_buildable_in_advance(node: Node) -> bool:
+    if node.is_locked:
+        return False
+
+    if isinstance(injectable := node.injectable, ConstantInjectable):
+        return not injectable.is_built
+
+    if node.lifetime == Lifetime.APPLICATION:
+        return bool(get_active_scopes(APPLICATION_SCOPE_NAME))
+
+    return node.lifetime == Lifetime.SINGLETON
+
+
+def is_async(injectable: Injectable[Any]) -> bool:
+    if isinstance(injectable, AsyncCMSingletonInjectable):
+        return True
+
+    factory = getattr(injectable, "factory", None)
+    return isinstance(factory, AsyncCaller)
+
+
+def exclude_async(
+    graph: DependencyGraph,
+    dependencies: DependencyMapping,
+) -> DependencyMapping:
+    excluded: set[Injectable[Any]] = set()
+
+    for node in graph.static_order():
+        if node.is_locked:
+            continue
+
+        if is_async(node.injectable) or not excluded.isdisjoint(node.dependencies):
+            excluded.add(node.injectable)
+
+    return {
+        injectable: deps
+        for injectable, deps in dependencies.items()
+        if injectable not in excluded
+    }
+
+
+def build_concurrently(
+    dependencies: DependencyMapping,
+    max_workers: int | None = None,
+) -> dict[Injectable[Any], float]:
+    durations: dict[Injectable[Any], float] = {}
+    sorter = TopologicalSorter(dependencies)
+    sorter.prepare()
+
+    with _new_executor(max_workers) as executor:
+        futures: dict[Future[float], Injectable[Any]] = {}
+
+        while sorter.is_active():
+            for injectable in sorter.get_ready():
+                future = executor.submit(copy_context().run, _build, injectable)
+                futures[future] = injectable
+
+            done, _ = sync_wait(futures, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                injectable = futures.pop(future)
+                durations[injectable] = future.result()
+                sorter.done(injectable)
+
+    return durations
+
+
+async def abuild_concurrently(
+    dependencies: DependencyMapping,
+    max_workers: int | None = None,
+) -> dict[Injectable[Any], float]:
+    durations: dict[Injectable[Any], float] = {}
+    sorter = TopologicalSorter(dependencies)
+    sorter.prepare()
+
+    with _new_executor(max_workers) as executor:
+        tasks: dict[Task[float], Injectable[Any]] = {}
+
+        try:
+            while sorter.is_active():
+                for injectable in sorter.get_ready():
+                    tasks[create_task(_abuild(injectable, executor))] = injectable
+
+                done, _ = await async_wait(tasks, return_when=ASYNC_FIRST_COMPLETED)
+
+                for task in done:
+                    injectable = tasks.pop(task)
+                    durations[injectable] = task.result()
+                    sorter.done(injectable)
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    return durations
+
+
+def make_warmup_report(
+    graph: DependencyGraph,
+    durations: Mapping[Injectable[Any], float],
+    duration: float,
+) -> WarmupReport:
+    entries = tuple(
+        WarmupEntry(graph.nodes[injectable].classes, injectable_duration)
+        for injectable, injectable_duration in durations.items()
+    )
+    return WarmupReport(entries, duration)
+
+
+def _build(injectable: Injectable[Any]) -> float:
+    start = perf_counter()
+    injectable.get_instance()
+    return perf_counter() - start
+
+
+async def _abuild(injectable: Injectable[Any], executor: Executor) -> float:
+    if not is_async(injectable):
+        loop = get_running_loop()
+        context = copy_context()
+        return await loop.run_in_executor(executor, context.run, _build, injectable)
+
+    start = perf_counter()
+    await injectable.aget_instance()
+    return perf_counter() - start
+
+
+def _new_executor(max_workers: int | None) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers, thread_name_prefix="injection-warmup")
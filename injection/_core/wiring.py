@@ -0,0 +1,278 @@
+import sys
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from inspect import Parameter
+from typing import Any, NamedTuple, Self, TypeAliasType
+
+from injection._core.common.asynchronous import AsyncCaller, SyncCaller
+from injection._core.common.type import get_qualified_name
+from injection._core.graph import Lifetime, Node
+from injection._core.injectables import Injectable
+from injection._core.module import InjectMetadata, Module, get_inject_metadata
+
+HEADER = '''"""
+Wiring generated by `injection.utils.generate_wiring`, don't edit it manually.
+"""
+
+from collections.abc import Callable
+from functools import cache
+from typing import Any
+'''
+
+
+class Reference(NamedTuple):
+    module: str
+    qualname: str
+
+    @classmethod
+    def of(cls, obj: Any) -> Self | None:
+        reference = cls.__from_names(obj)
+
+        if reference is None or reference.resolve() is not obj:
+            return None
+
+        return reference
+
+    @classmethod
+    def of_injected_function(cls, metadata: InjectMetadata[..., Any]) -> Self | None:
+        # The injected function replaces the wrapped one in its module.
+        reference = cls.__from_names(metadata.wrapped)
+
+        if reference is None or (
+            getattr(reference.resolve(), "__inject_metadata__", None) is not metadata
+        ):
+            return None
+
+        return reference
+
+    def resolve(self) -> Any:
+        target = sys.modules.get(self.module)
+
+        for name in self.qualname.split("."):
+            target = getattr(target, name, None)
+
+        return target
+
+    @classmethod
+    def __from_names(cls, obj: Any) -> Self | None:
+        module_name = getattr(obj, "__module__", None)
+        qualname = getattr(obj, "__qualname__", None) or getattr(obj, "__name__", None)
+
+        if not module_name or not qualname or "<" in qualname:
+            return None
+
+        return cls(module_name, qualname)
+
+
+@dataclass(repr=False, eq=False, frozen=True, slots=True)
+class WiringBuilder:
+    __imports: dict[str, str] = field(default_factory=dict, init=False)
+    __providers: dict[Injectable[Any], str] = field(default_factory=dict, init=False)
+    __functions: list[str] = field(default_factory=list, init=False)
+    __bindings: list[str] = field(default_factory=list, init=False)
+    __injected_bindings: list[str] = field(default_factory=list, init=False)
+    __skipped: list[str] = field(default_factory=list, init=False)
+
+    def add(self, node: Node) -> Self:
+        if (call := self.__make_call(node)) is None:
+            self.__skipped.append(describe(node))
+            return self
+
+        name = f"_provide_{len(self.__providers)}"
+        self.__providers[node.injectable] = name
+        lines = [describe(node)]
+
+        if node.lifetime in {Lifetime.CONSTANT, Lifetime.SINGLETON}:
+            lines.append("@cache")
+
+        lines.append(f"def {name}() -> Any:\n    return {call}")
+        self.__functions.append("\n".join(lines))
+
+        for cls in node.classes:
+            if isinstance(cls, type | TypeAliasType) and (
+                reference := Reference.of(cls)
+            ):
+                self.__bindings.append(f"    {self.__use(reference)}: {name},")
+
+        return self
+
+    def add_injected_function(self, metadata: InjectMetadata[..., Any]) -> Self:
+        reference = Reference.of_injected_function(metadata)
+        name = f"_inject_{len(self.__injected_bindings)}"
+
+        try:
+            if reference is None:
+                raise LookupError(metadata.wrapped)
+
+            body = "".join(self.__iter_injected_statements(metadata))
+        except LookupError:
+            self.__skipped.append(describe_injected_function(metadata))
+            return self
+
+        function = self.__use(reference)
+        self.__functions.append(
+            f"{describe_injected_function(metadata)}\n"
+            f"def {name}(*args: Any, **kwargs: Any) -> Any:\n"
+            f"{body}"
+            f"    return {function}.__wrapped__(*args, **kwargs)"
+        )
+        self.__injected_bindings.append(f"    {function}: {name},")
+        return self
+
+    def build(self) -> str:
+        imports = "".join(
+            f"import {module_name} as {alias}\n"
+            for module_name, alias in self.__imports.items()
+        )
+        sections = [(HEADER + (f"\n{imports}" if imports else "")).rstrip()]
+        sections.extend(self.__functions)
+        bindings = "".join(f"{binding}\n" for binding in self.__bindings)
+        sections.append(
+            f"PROVIDERS: dict[Any, Callable[[], Any]] = {{\n{bindings}}}\n\n\n"
+            "def get_instance(cls: Any) -> Any:\n"
+            "    return PROVIDERS[cls]()"
+        )
+        bindings = "".join(f"{binding}\n" for binding in self.__injected_bindings)
+        sections.append(
+            f"FUNCTIONS: dict[Any, Callable[..., Any]] = {{\n{bindings}}}\n\n\n"
+            "def get_function(function: Any) -> Callable[..., Any]:\n"
+            "    return FUNCTIONS[function]"
+        )
+
+        if skipped := self.__skipped:
+            sections.append("\n".join(["# Not wired:", *skipped]))
+
+        return "\n\n\n".join(sections) + "\n"
+
+    def __make_call(self, node: Node) -> str | None:
+        # Their instances are shared or reused in a way a provider can't reproduce.
+        if node.lifetime in {
+            Lifetime.APPLICATION,
+            Lifetime.KEYED,
+            Lifetime.PER_RESOLUTION,
+            Lifetime.POOLED,
+            Lifetime.SCOPED,
+            Lifetime.TTL,
+        }:
+            return None
+
+        factory = getattr(node.injectable, "factory", None)
+
+        if isinstance(factory, InjectMetadata):
+            function = factory.wrapped
+            arguments = self.__iter_arguments(factory)
+
+        elif isinstance(factory, SyncCaller):
+            function = factory.callable
+            arguments = iter(())
+
+        else:
+            return None
+
+        if (reference := Reference.of(function)) is None:
+            return None
+
+        try:
+            formatted_arguments = ", ".join(arguments)
+        except LookupError:
+            return None
+
+        return f"{self.__use(reference)}({formatted_arguments})"
+
+    def __iter_arguments(self, metadata: InjectMetadata[..., Any]) -> Iterator[str]:
+        dependencies = metadata.dependencies.mapping
+        keyword_only = False
+
+        for name, parameter in metadata.signature.parameters.items():
+            if name not in dependencies:
+                keyword_only = True
+                continue
+
+            provider = f"{self.__providers[dependencies[name]]}()"
+
+            if parameter.kind == Parameter.POSITIONAL_ONLY:
+                if keyword_only:
+                    raise LookupError(name)
+
+                yield provider
+
+            else:
+                keyword_only = True
+                yield f"{name}={provider}"
+
+    def __iter_injected_statements(
+        self,
+        metadata: InjectMetadata[..., Any],
+    ) -> Iterator[str]:
+        if (dependencies := metadata.flatten()) is None:
+            raise LookupError(metadata.wrapped)
+
+        for position, (name, parameter) in enumerate(
+            metadata.signature.parameters.items()
+        ):
+            if name not in dependencies:
+                continue
+
+            provider = f"{self.__providers[dependencies[name]]}()"
+            condition = f'"{name}" not in kwargs'
+
+            if parameter.kind == Parameter.POSITIONAL_OR_KEYWORD:
+                condition = f"len(args) <= {position} and {condition}"
+
+            yield f'    if {condition}:\n        kwargs["{name}"] = {provider}\n'
+
+    def __use(self, reference: Reference) -> str:
+        module_name = reference.module
+        imports = self.__imports
+
+        if (alias := imports.get(module_name)) is None:
+            alias = imports[module_name] = f"_m{len(imports)}"
+
+        return f"{alias}.{reference.qualname}"
+
+
+def describe(node: Node) -> str:
+    classes = ", ".join(get_qualified_name(cls) for cls in node.classes)
+    return f"# {node.lifetime}: {classes or get_factory_name(node.injectable)}"
+
+
+def describe_injected_function(metadata: InjectMetadata[..., Any]) -> str:
+    return f"# inject: {get_function_name(metadata.wrapped)}"
+
+
+def get_factory_name(injectable: Injectable[Any]) -> str:
+    # The representation of an injectable contains its memory address, so it
+    # can't be used in a generated file.
+    factory = getattr(injectable, "factory", None)
+
+    if isinstance(factory, InjectMetadata):
+        return get_function_name(factory.wrapped)
+
+    if isinstance(factory, AsyncCaller | SyncCaller):
+        return get_function_name(factory.callable)
+
+    return type(injectable).__name__
+
+
+def get_function_name(function: Any) -> str:
+    module_name = getattr(function, "__module__", None)
+    qualname = getattr(function, "__qualname__", None) or type(function).__qualname__
+    return f"{module_name}.{qualname}" if module_name else qualname
+
+
+def generate_wiring(module: Module) -> str:
+    builder = WiringBuilder()
+
+    factories = set()
+
+    for node in module.get_dependency_graph().static_order():
+        builder.add(node)
+        factories.add(get_inject_metadata(node.injectable))
+
+    for metadata in sorted(
+        (metadata for metadata in module.inject_metadata if metadata not in factories),
+        key=lambda metadata: get_function_name(metadata.wrapped),
+    ):
+        builder.add_injected_function(metadata)
+
+    return builder.build()
@@ -1,15 +1,18 @@
 from typing import Any
 
 __all__ = (
+    "DependencyCycleError",
     "HookError",
     "InjectionError",
     "ModuleError",
     "ModuleLockError",
     "ModuleNotUsedError",
     "NoInjectable",
+    "PoolTimeoutError",
     "ScopeAlreadyDefinedError",
     "ScopeError",
     "ScopeUndefinedError",
+    "UnresolvedDependencyError",
 )
 
 
@@ -39,6 +42,12 @@ class ModuleLockError(ModuleError): ...
 class ModuleNotUsedError(KeyError, ModuleError): ...
 
 
+class UnresolvedDependencyError(ModuleError): ...
+
+
+class PoolTimeoutError(TimeoutError, InjectionError): ...
+
+
 class ScopeError(InjectionError): ...
 
 
@@ -49,3 +58,20 @@ class ScopeAlreadyDefinedError(ScopeError): ...
 
 
 class HookError(InjectionError): ...
+
+
+class DependencyCycleError(InjectionError):
+    __slots__ = ("__cycles",)
+
+    __cycles: tuple[tuple[Any, ...], ...]
+
+    def __init__(self, cycles: tuple[tuple[Any, ...], ...]) -> None:
+        formatted_cycles = "; ".join(
+            " -> ".join(map(repr, cycle + cycle[:1])) for cycle in cycles
+        )
+        super().__init__(f"Dependency cycle detected: {formatted_cycles}.")
+        self.__cycles = cycles
+
+    @property
+    def cycles(self) -> tuple[tuple[Any, ...], ...]:
+        return self.__cycles
@@ -1,14 +1,26 @@
+from collections import defaultdict
 from collections.abc import Callable, Collection, Iterator
 from importlib import import_module
 from importlib.util import find_spec
+from os import PathLike
 from pkgutil import walk_packages
 from types import ModuleType as PythonModule
 from typing import ContextManager
 
 from injection import Module, mod
 from injection import __name__ as injection_package_name
+from injection._core.common.scan import KeywordScanner
+from injection._core.common.type import get_qualified_name
+from injection._core.wiring import generate_wiring as _generate_wiring
 
-__all__ = ("load_modules_with_keywords", "load_packages", "load_profile")
+__all__ = (
+    "check_wiring",
+    "generate_wiring",
+    "load_modules_with_keywords",
+    "load_packages",
+    "load_profile",
+    "make_manifest",
+)
 
 
 def load_profile(*names: str) -> ContextManager[Module]:
@@ -23,6 +35,8 @@ def load_profile(*names: str) -> ContextManager[Module]:
 def load_modules_with_keywords(
     *packages: PythonModule | str,
     keywords: Collection[str] | None = None,
+    cache_file: str | PathLike[str] | None = None,
+    max_workers: int | None = None,
 ) -> dict[str, PythonModule]:
     """
     Function to import modules from a Python package if one of the keywords is contained in the Python script.
@@ -30,6 +44,8 @@ def load_modules_with_keywords(
         - `from injection `
         - `from injection.`
         - `import injection`
+    Python scripts are scanned in parallel. Pass the `cache_file` parameter to save the scan results on disk, only
+    the modified Python scripts will be scanned again.
     """
 
     if keywords is None:
@@ -39,20 +55,18 @@ def load_modules_with_keywords(
             f"import {injection_package_name}",
         )
 
-    def predicate(module_name: str) -> bool:
-        spec = find_spec(module_name)
-
-        if spec and (module_path := spec.origin):
-            with open(module_path, "r") as file:
-                python_script = file.read()
-
-            return bool(python_script) and any(
-                keyword in python_script for keyword in keywords
-            )
-
-        return False
-
-    return load_packages(*packages, predicate=predicate)
+    module_paths = {
+        module_name: module_path
+        for module_name in __iter_module_names(*packages)
+        if (spec := find_spec(module_name)) and (module_path := spec.origin)
+    }
+    scanner = KeywordScanner(keywords, cache_file=cache_file, max_workers=max_workers)
+    matches = scanner.scan(module_paths.values())
+    return {
+        module_name: import_module(module_name)
+        for module_name, module_path in module_paths.items()
+        if module_path in matches
+    }
 
 
 def load_packages(
@@ -64,32 +78,77 @@ def load_packages(
     Pass the `predicate` parameter if you want to filter the modules to be imported.
     """
 
-    loaded: dict[str, PythonModule] = {}
+    return {
+        module_name: import_module(module_name)
+        for module_name in __iter_module_names(*packages)
+        if predicate(module_name)
+    }
 
-    for package in packages:
-        if isinstance(package, str):
-            package = import_module(package)
 
-        loaded |= __iter_modules_from(package, predicate)
+def make_manifest(
+    *packages: PythonModule | str,
+    module: Module | None = None,
+) -> dict[str, list[str]]:
+    """
+    Function to import all modules in a Python package and map the qualified name of each registered type to the
+    modules that register it. Pass the manifest to `Module.set_manifest` to import modules only when their types are
+    requested.
+    """
+
+    if module is None:
+        module = mod()
 
-    return loaded
+    manifest: defaultdict[str, list[str]] = defaultdict(list)
 
+    for module_name in __iter_module_names(*packages):
+        records = dict(module.records)
+        import_module(module_name)
 
-def __iter_modules_from(
-    package: PythonModule,
-    predicate: Callable[[str], bool],
-) -> Iterator[tuple[str, PythonModule]]:
-    package_name = package.__name__
+        for cls, record in module.records.items():
+            if records.get(cls) is not record:
+                manifest[get_qualified_name(cls)].append(module_name)
+
+    return dict(manifest)
+
+
+def generate_wiring(module: Module | None = None) -> str:
+    """
+    Function to generate the source code of a Python module with a provider function for each injectable of a
+    populated module, and a wrapper for each function decorated with `@inject`. Dependencies are passed with direct
+    calls and singletons are cached, so no reflection, event or lookup is needed at runtime. Injectables and functions
+    that can't be wired statically are listed at the end of the file.
+    """
+
+    # The public stub of `Module` doesn't declare the internals used by the generator.
+    return _generate_wiring(module or mod())  # type: ignore[arg-type]
+
+
+def check_wiring(path: str | PathLike[str], module: Module | None = None) -> bool:
+    """
+    Function to check that a file generated by `generate_wiring` still matches the module.
+    """
 
     try:
-        package_path = package.__path__
-    except AttributeError as exc:
-        raise TypeError(f"`{package_name}` isn't Python package.") from exc
+        with open(path, "r") as file:
+            source = file.read()
+    except FileNotFoundError:
+        return False
+
+    return source == generate_wiring(module)
+
+
+def __iter_module_names(*packages: PythonModule | str) -> Iterator[str]:
+    for package in packages:
+        if isinstance(package, str):
+            package = import_module(package)
 
-    for info in walk_packages(path=package_path, prefix=f"{package_name}."):
-        name = info.name
+        package_name = package.__name__
 
-        if info.ispkg or not predicate(name):
-            continue
+        try:
+            package_path = package.__path__
+        except AttributeError as exc:
+            raise TypeError(f"`{package_name}` isn't Python package.") from exc
 
-        yield name, import_module(name)
+        for info in walk_packages(path=package_path, prefix=f"{package_name}."):
+            if not info.ispkg:
+                yield info.name
@@ -0,0 +1,69 @@
+import gc
+from weakref import ref
+
+from injection._core.common.cache import WeakKeyCache
+from injection._core.common.type import get_signature
+
+
+class TestWeakKeyCache:
+    def test_weak_key_cache_with_success(self):
+        calls = []
+
+        @WeakKeyCache
+        def cached(function):
+            calls.append(function)
+            return function.__name__
+
+        def a(): ...
+
+        assert cached(a) == cached(a) == "a"
+        assert calls == [a]
+        assert cached.cache_info() == (1, 1, 1)
+
+        reference = ref(a)
+        del a
+        calls.clear()
+        gc.collect()
+        assert reference() is None
+        assert cached.cache_info().size == 0
+
+    def test_weak_key_cache_with_cache_clear(self):
+        @WeakKeyCache
+        def cached(function):
+            return function.__name__
+
+        def a(): ...
+
+        cached(a)
+        cached.cache_clear()
+        assert cached.cache_info() == (0, 0, 0)
+
+    def test_weak_key_cache_with_uncacheable_key(self):
+        calls = []
+
+        @WeakKeyCache
+        def cached(value):
+            calls.append(value)
+            return value * 2
+
+        assert cached(1) == cached(1) == 2
+        assert calls == [1, 1]
+        assert cached.cache_info() == (0, 0, 0)
+
+    def test_get_signature_with_annotation_referencing_owner(self):
+        class A:
+            def __init__(self, other=None): ...
+
+        A.__init__.__annotations__["other"] = A
+        assert get_signature(A.__init__).parameters["other"].annotation is A
+
+        reference = ref(A)
+        del A
+        get_signature.cache_clear()
+        gc.collect()
+        assert reference() is None
+
+    def test_get_signature_with_shared_signature(self):
+        def function(value: int): ...
+
+        assert get_signature(function) is get_signature(function)
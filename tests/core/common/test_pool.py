@@ -0,0 +1,105 @@
+import asyncio
+from time import sleep
+
+import pytest
+
+from injection._core.common.pool import ResourcePool
+from injection.exceptions import PoolTimeoutError
+
+
+class Resource:
+    def __init__(self):
+        self.is_closed = False
+
+    def close(self):
+        self.is_closed = True
+
+
+class TestResourcePool:
+    def test_resource_pool_with_success(self):
+        pool = ResourcePool()
+        resource = pool.acquire(Resource)
+        pool.release(resource)
+        assert pool.acquire(Resource) is resource
+
+        metrics = pool.metrics
+        assert metrics.size == 1
+        assert metrics.in_use == 1
+        assert metrics.misses == 1
+        assert metrics.hits == 1
+
+    def test_resource_pool_with_invalid_size_raise_value_error(self):
+        with pytest.raises(ValueError):
+            ResourcePool(max_size=0)
+
+    def test_resource_pool_with_timeout_raise_pool_timeout_error(self):
+        pool = ResourcePool(max_size=1, timeout=0.01)
+        pool.acquire(Resource)
+
+        with pytest.raises(PoolTimeoutError):
+            pool.acquire(Resource)
+
+        assert pool.metrics.waits == 1
+
+    def test_resource_pool_with_idle_timeout_evict_resource(self):
+        pool = ResourcePool(idle_timeout=0.01, close=Resource.close)
+        resource = pool.acquire(Resource)
+        pool.release(resource)
+        sleep(0.02)
+
+        assert pool.acquire(Resource) is not resource
+        assert resource.is_closed
+        assert pool.metrics.evicted == 1
+        assert pool.metrics.size == 1
+
+    def test_resource_pool_with_failing_factory_free_slot(self):
+        pool = ResourcePool(max_size=1)
+
+        def factory():
+            raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            pool.acquire(factory)
+
+        assert pool.metrics.size == 0
+        assert isinstance(pool.acquire(Resource), Resource)
+
+    def test_resource_pool_clear_close_idle_resources(self):
+        pool = ResourcePool(close=Resource.close)
+        resource = pool.acquire(Resource)
+
+        with pool.releasing(resource):
+            pass
+
+        pool.clear()
+        assert resource.is_closed
+        assert pool.metrics.size == 0
+
+    async def test_resource_pool_with_async_waiting(self):
+        pool = ResourcePool(max_size=1, timeout=5)
+
+        async def factory():
+            return Resource()
+
+        resource = await pool.aacquire(factory)
+        waiting = asyncio.create_task(pool.aacquire(factory))
+        await asyncio.sleep(0.01)
+        assert not waiting.done()
+
+        pool.release(resource)
+        assert await waiting is resource
+        assert pool.metrics.waits == 1
+
+    async def test_resource_pool_with_async_timeout_raise_pool_timeout_error(self):
+        pool = ResourcePool(max_size=1, timeout=0.01)
+
+        async def factory():
+            return Resource()
+
+        resource = await pool.aacquire(factory)
+
+        with pytest.raises(PoolTimeoutError):
+            await pool.aacquire(factory)
+
+        pool.release(resource)
+        assert await pool.aacquire(factory) is resource
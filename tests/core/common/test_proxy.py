@@ -0,0 +1,81 @@
+from typing import Annotated
+
+from injection._core.common.proxy import Lazy, LazyProxy, is_lazy
+
+
+class SomeClass:
+    def __init__(self):
+        self.value = 1
+
+
+class TestLazy:
+    def test_class_getitem_return_annotated(self):
+        assert Lazy[SomeClass] == Annotated[SomeClass, Lazy]
+
+    def test_is_lazy_with_lazy_return_true(self):
+        assert is_lazy(Lazy[SomeClass])
+        assert is_lazy(Annotated[SomeClass, "metadata", Lazy])
+
+    def test_is_lazy_with_other_annotation_return_false(self):
+        assert not is_lazy(SomeClass)
+        assert not is_lazy(Annotated[SomeClass, "metadata"])
+
+
+class TestLazyProxy:
+    def test_lazy_proxy_build_instance_once_on_first_access(self):
+        instances = []
+
+        def factory():
+            instance = SomeClass()
+            instances.append(instance)
+            return instance
+
+        proxy = LazyProxy(factory)
+        assert not instances
+
+        proxy.value = 2
+        assert proxy.value == 2
+        assert isinstance(proxy, SomeClass)
+        assert instances == [proxy]
+        assert instances[0].value == 2
+
+    def test_lazy_proxy_with_class_check_instance_without_building(self):
+        instances = []
+
+        def factory():
+            instance = SomeClass()
+            instances.append(instance)
+            return instance
+
+        proxy = LazyProxy(factory, SomeClass)
+        assert isinstance(proxy, SomeClass)
+        assert not instances
+
+        assert proxy.value == 1
+        assert instances
+
+    def test_lazy_proxy_forward_operators(self):
+        proxy = LazyProxy(lambda: [1, 2])
+        assert len(proxy) == 2
+        assert 1 in proxy
+        assert proxy[0] == 1
+        assert list(proxy) == [1, 2]
+        assert bool(proxy)
+
+    def test_lazy_proxy_forward_comparison_and_arithmetic_operators(self):
+        proxy = LazyProxy(lambda: 6)
+        assert proxy < 7
+        assert proxy >= 6
+        assert proxy + 1 == 7
+        assert 1 + proxy == 7
+        assert proxy * 2 == 12
+        assert 13 - proxy == 7
+        assert proxy / 4 == 1.5
+        assert proxy // 4 == 1
+        assert divmod(proxy, 4) == (1, 2)
+        assert 2**proxy == 64
+        assert proxy & 3 == 2
+        assert -proxy == -6
+        assert abs(LazyProxy(lambda: -1)) == 1
+        assert [0, 1, 2, 3, 4, 5, 6][proxy] == 6
+        assert sorted([LazyProxy(lambda: 2), LazyProxy(lambda: 1)]) == [1, 2]
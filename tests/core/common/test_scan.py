@@ -0,0 +1,30 @@
+import os
+
+from injection._core.common.scan import KeywordScanner
+
+
+class TestKeywordScanner:
+    def test_contains_keyword_with_keyword_across_chunks_return_true(self, tmp_path):
+        path = tmp_path / "module.py"
+        path.write_text("x = 1\nfrom injection import inject\n")
+        scanner = KeywordScanner(("from injection ",), chunk_size=4)
+
+        assert scanner.contains_keyword(path) is True
+
+    def test_contains_keyword_with_empty_file_return_false(self, tmp_path):
+        path = tmp_path / "module.py"
+        path.touch()
+        scanner = KeywordScanner(("from injection ",))
+
+        assert scanner.contains_keyword(path) is False
+
+    def test_scan_with_modified_file_scan_again(self, tmp_path):
+        path = tmp_path / "module.py"
+        path.write_text("x = 1\n")
+        scanner = KeywordScanner(("import injection",), cache_file=tmp_path / "c")
+
+        assert scanner.scan((str(path),)) == frozenset()
+
+        path.write_text("import injection\n")
+        os.utime(path, ns=(0, 0))
+        assert scanner.scan((str(path),)) == {str(path)}
@@ -1,3 +1,5 @@
+import pytest
+
 from injection import LazyInstance, injectable
 
 
@@ -31,3 +33,59 @@ class TestLazyInstance:
 
         instance = SomeClass()
         assert instance.dependency is NotImplemented
+
+    def test_lazy_instance_with_cache_return_same_instance(self):
+        @injectable
+        class Dependency: ...
+
+        class SomeClass:
+            dependency = LazyInstance(Dependency, cache=True)
+
+        instance = SomeClass()
+        other_instance = SomeClass()
+        assert instance.dependency is instance.dependency
+        assert instance.dependency is not other_instance.dependency
+
+    def test_lazy_instance_with_cache_and_reset_resolve_again(self):
+        @injectable
+        class Dependency: ...
+
+        class SomeClass:
+            dependency = LazyInstance(Dependency, cache=True)
+
+        instance = SomeClass()
+        dependency = instance.dependency
+        SomeClass.dependency.reset(instance)
+        assert isinstance(instance.dependency, Dependency)
+        assert instance.dependency is not dependency
+
+    def test_lazy_instance_with_slot_return_same_instance(self):
+        @injectable
+        class Dependency: ...
+
+        class SomeClass:
+            __slots__ = ("_dependency",)
+
+            dependency = LazyInstance(Dependency, slot="_dependency")
+
+        instance = SomeClass()
+        dependency = instance.dependency
+        assert isinstance(dependency, Dependency)
+        assert instance.dependency is dependency
+
+        SomeClass.dependency.reset(instance)
+        assert instance.dependency is not dependency
+
+    def test_lazy_instance_with_cache_and_slots_raise_type_error(self):
+        @injectable
+        class Dependency: ...
+
+        class SomeClass:
+            __slots__ = ()
+
+            dependency = LazyInstance(Dependency, cache=True)
+
+        instance = SomeClass()
+
+        with pytest.raises(TypeError):
+            instance.dependency
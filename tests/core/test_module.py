@@ -1,19 +1,36 @@
+import gc
+import os
+import sys
 from collections.abc import Iterator
+from types import ModuleType
 from typing import Annotated
 
 import pytest
 
 from injection import Module, define_scope
+from injection._core.module import InjectMetadata, Locator, get_inject_metadata
 from injection.exceptions import (
+    DependencyCycleError,
     ModuleError,
     ModuleLockError,
     ModuleNotUsedError,
+    NoInjectable,
+    UnresolvedDependencyError,
 )
+from tests.helpers import run_in_child_process
 
 
 class SomeClass: ...
 
 
+class CycleA:
+    def __init__(self, b: "CycleB"): ...
+
+
+class CycleB:
+    def __init__(self, a: CycleA): ...
+
+
 class TestModule:
     """
     __contains__
@@ -55,6 +72,445 @@ class TestModule:
         instance = module.get_instance(T)
         assert isinstance(instance, T)
 
+    """
+    prefork
+    """
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires `os.fork`.")
+    def test_prefork_with_success(self, module):
+        built = []
+
+        @module.singleton
+        class A:
+            def __init__(self):
+                built.append(self)
+
+        @module.singleton(fork_safe=False)
+        class B: ...
+
+        try:
+            report = module.prefork()
+        finally:
+            gc.unfreeze()
+
+        assert report.objects > 0
+        assert report.bytes > 0
+        assert len(built) == 1
+        assert module[B].is_locked is False
+
+        def child() -> bool:
+            return module.get_instance(A) is built[0] and len(built) == 1
+
+        assert run_in_child_process(child)
+
+    def test_prefork_with_classes(self, module):
+        @module.singleton
+        class A: ...
+
+        @module.singleton
+        class B: ...
+
+        try:
+            module.prefork(B)
+        finally:
+            gc.unfreeze()
+
+        assert module[A].is_locked is False
+        assert module[B].is_locked is True
+
+    """
+    defer_registration
+    """
+
+    def test_defer_registration_with_success(self, module):
+        module.defer_registration()
+
+        @module.injectable
+        def factory() -> SomeClass:
+            return SomeClass()
+
+        assert SomeClass in module
+        assert isinstance(module.get_instance(SomeClass), SomeClass)
+
+    def test_defer_registration_with_disabled_register_pending_injectables(
+        self,
+        module,
+    ):
+        module.defer_registration()
+
+        @module.scoped("test")
+        def dependency() -> Iterator[SomeClass]:
+            yield SomeClass()
+
+        module.defer_registration(False)
+        assert list(module.records) == [SomeClass]
+
+    def test_defer_registration_with_locked_module_raise_module_lock_error(
+        self,
+        module,
+    ):
+        module.singleton(SomeClass)
+        module.get_instance(SomeClass)
+        module.defer_registration()
+
+        class A: ...
+
+        with pytest.raises(ModuleLockError):
+            module.injectable(A)
+
+        assert A not in module
+
+    """
+    set_manifest
+    """
+
+    @pytest.fixture
+    def manifest_module(self, module, monkeypatch, tmp_path):
+        target = ModuleType("manifest_target")
+        target.module = module
+        monkeypatch.setitem(sys.modules, "manifest_target", target)
+        monkeypatch.syspath_prepend(tmp_path)
+        (tmp_path / "manifest_provider.py").write_text(
+            "from manifest_target import module\n"
+            "from tests.core.test_module import SomeClass\n"
+            "module.set_constant(SomeClass())\n"
+        )
+        module.set_manifest({"tests.core.test_module.SomeClass": ["manifest_provider"]})
+
+        try:
+            yield module
+        finally:
+            sys.modules.pop("manifest_provider", None)
+
+    def test_set_manifest_with_success(self, manifest_module):
+        assert "manifest_provider" not in sys.modules
+        assert isinstance(manifest_module.get_instance(SomeClass), SomeClass)
+        assert "manifest_provider" in sys.modules
+        assert manifest_module.get_instance(CycleA) is None
+
+    def test_set_manifest_with_locked_module_return_default(self, manifest_module):
+        @manifest_module.singleton
+        class A: ...
+
+        manifest_module.get_instance(A)
+
+        @manifest_module.inject
+        def function(some_class: SomeClass = None):
+            return some_class
+
+        assert SomeClass not in manifest_module
+        assert manifest_module.get_instance(SomeClass, default=None) is None
+        assert function() is None
+        assert "manifest_provider" not in sys.modules
+
+        with pytest.raises(NoInjectable) as exc_info:
+            manifest_module[SomeClass]
+
+        assert isinstance(exc_info.value.__cause__, ModuleLockError)
+
+    """
+    freeze
+    """
+
+    def test_freeze_with_success(self, module):
+        second_module = Module()
+        module.use(second_module)
+
+        @module.singleton
+        class A: ...
+
+        @module.inject
+        def function(a: A, /, *args, b: SomeClass = None, **kwargs):
+            return a, b
+
+        @module.inject
+        def other_function(x: int, a: A, *, s: SomeClass = None):
+            return x, a
+
+        module.freeze()
+
+        assert module.is_frozen is True
+        assert function()[0] is module.get_instance(A)
+        assert other_function(1) == (1, module.get_instance(A))
+        assert other_function(1, a="a") == (1, "a")
+        assert other_function(1, "a") == (1, "a")
+
+        with pytest.raises(ModuleLockError):
+            module.set_constant(SomeClass())
+
+        with pytest.raises(ModuleLockError):
+            second_module.set_constant(SomeClass())
+
+        with pytest.raises(ModuleLockError):
+            module.stop_using(second_module)
+
+    async def test_freeze_with_async_function(self, module):
+        @module.injectable
+        class A: ...
+
+        @module.inject
+        async def function(a: A):
+            return a
+
+        module.freeze()
+        assert isinstance(await function(), A)
+
+    def test_freeze_with_standardized_input(self, module, monkeypatch):
+        @module.injectable
+        class A: ...
+
+        injectable = module[A]
+        module.freeze()
+
+        def getitem(*args, **kwargs):
+            raise AssertionError("The snapshot must be used.")
+
+        monkeypatch.setattr(Locator, "__getitem__", getitem)
+        assert module[Annotated[A, "metadata"]] is injectable
+        assert module[A | None] is injectable
+
+    """
+    compile
+    """
+
+    def test_compile_with_success(self, module, caplog):
+        @module.injectable
+        class A: ...
+
+        @module.inject
+        def function(a: A, b: SomeClass, c: int = 0, *args: str): ...
+
+        module.compile()
+
+        warnings = [r for r in caplog.records if r.levelname == "WARNING"]
+        assert len(warnings) == 1
+        assert "`b: tests.core.test_module.SomeClass`" in warnings[0].message
+        assert function.__inject_metadata__.dependencies.are_resolved is True
+
+    def test_compile_with_strict_raise_unresolved_dependency_error(self, module):
+        @module.inject
+        def function(a: SomeClass): ...
+
+        with pytest.raises(UnresolvedDependencyError):
+            module.compile(strict=True)
+
+        module.set_constant(SomeClass())
+        module.compile(strict=True)
+
+    def test_compile_with_released_singleton_factory(self, module, monkeypatch):
+        @module.injectable
+        class A: ...
+
+        @module.singleton
+        class B:
+            def __init__(self, a: A):
+                self.a = a
+
+        module.get_instance(B)
+        module.compile(strict=True)
+        module.warmup()
+        module.unlock()
+
+        updated = []
+        monkeypatch.setattr(
+            InjectMetadata,
+            "update",
+            lambda metadata, module: updated.append(metadata) or metadata,
+        )
+        module.set_constant(SomeClass())
+        assert get_inject_metadata(module[B]) not in updated
+        monkeypatch.undo()
+
+        @module.injectable(on=A, mode="override")
+        class C(A): ...
+
+        assert isinstance(module.get_instance(B).a, C)
+
+    """
+    get_dependency_graph
+    """
+
+    def test_get_dependency_graph_with_success(self, module):
+        @module.injectable
+        class A: ...
+
+        @module.singleton
+        class B:
+            def __init__(self, a: A): ...
+
+        @module.injectable
+        class C:
+            def __init__(self, a: A, b: B): ...
+
+        @module.scoped("test")
+        class D:
+            def __init__(self, c: C): ...
+
+        module.set_constant(SomeClass())
+
+        graph = module.get_dependency_graph().check()
+        nodes = {node.classes: node for node in graph}
+
+        assert len(graph) == 5
+        assert nodes[(SomeClass,)].lifetime == "constant"
+        assert nodes[(B,)].lifetime == "singleton"
+        assert nodes[(C,)].lifetime == "transient"
+        assert nodes[(D,)].lifetime == "scoped"
+        assert graph.get_dependencies(nodes[(C,)]) == (nodes[(A,)], nodes[(B,)])
+        assert graph.static_order().index(nodes[(B,)]) < graph.static_order().index(
+            nodes[(C,)]
+        )
+
+        critical_path = graph.critical_path()
+        assert critical_path.nodes == (
+            nodes[(A,)],
+            nodes[(B,)],
+            nodes[(C,)],
+            nodes[(D,)],
+        )
+        assert critical_path.cost == 4
+
+        projection = graph.project(lambda node: node.lifetime != "transient")
+        assert projection[nodes[(D,)].injectable] == {nodes[(B,)].injectable}
+
+    def test_get_dependency_graph_without_resolving_dependencies(self, module):
+        @module.injectable
+        class A: ...
+
+        @module.injectable
+        class B:
+            def __init__(self, a: A): ...
+
+        metadata = get_inject_metadata(module[B])
+        graph = module.get_dependency_graph()
+
+        assert len(graph) == 2
+        assert metadata._InjectMetadata__dependencies.are_resolved is False
+
+    def test_get_dependency_graph_with_cycle_raise_dependency_cycle_error(
+        self,
+        module,
+    ):
+        module.injectable(CycleA)
+        module.injectable(CycleB)
+
+        graph = module.get_dependency_graph()
+        cycles = graph.find_cycles()
+
+        assert len(cycles) == 1
+        assert {node.classes for node in cycles[0]} == {(CycleA,), (CycleB,)}
+
+        with pytest.raises(DependencyCycleError):
+            graph.check()
+
+        with pytest.raises(DependencyCycleError):
+            graph.static_order()
+
+    """
+    warmup
+    """
+
+    def test_warmup_with_success(self, module):
+        built = []
+
+        @module.singleton
+        class A:
+            def __init__(self):
+                built.append(A)
+
+        @module.injectable
+        class B:
+            def __init__(self, a: A):
+                self.a = a
+                built.append(B)
+
+        @module.singleton
+        class C:
+            def __init__(self, b: B):
+                self.b = b
+                built.append(C)
+
+        @module.singleton
+        async def d_recipe() -> SomeClass:
+            return SomeClass()  # pragma: no cover
+
+        report = module.warmup(max_workers=2)
+
+        assert built == [A, B, C]
+        assert {entry.classes for entry in report.entries} == {(A,), (C,)}
+        assert all(entry.duration >= 0 for entry in report.entries)
+        assert module[SomeClass].is_locked is False
+        assert module.get_instance(C).b.a is module.get_instance(A)
+
+    def test_warmup_with_singleton_already_built(self, module):
+        @module.singleton
+        class A: ...
+
+        module.get_instance(A)
+        report = module.warmup()
+        assert report.entries == ()
+
+    def test_warmup_with_constant(self, module):
+        built = []
+
+        @module.constant
+        class A:
+            def __init__(self):
+                built.append(A)
+
+        report = module.warmup()
+        assert built == [A]
+        assert [entry.classes for entry in report.entries] == [(A,)]
+        assert module.warmup().entries == ()
+        assert not module.is_locked
+
+    def test_warmup_with_async_transient_dependency(self, module):
+        @module.injectable
+        async def a_recipe() -> SomeClass:
+            return SomeClass()  # pragma: no cover
+
+        @module.singleton
+        class B:
+            def __init__(self, a: SomeClass): ...
+
+        report = module.warmup()
+        assert report.entries == ()
+        assert module[B].is_locked is False
+
+    def test_warmup_in_scope_with_scoped_dependency(self, module):
+        @module.scoped("warmup-test")
+        class A: ...
+
+        @module.singleton
+        class B:
+            def __init__(self, a: A):
+                self.a = a
+
+        with define_scope("warmup-test"):
+            report = module.warmup()
+            assert module.get_instance(B).a is module.get_instance(A)
+
+        assert [entry.classes for entry in report.entries] == [(B,)]
+
+    """
+    awarmup
+    """
+
+    async def test_awarmup_with_success(self, module):
+        @module.singleton
+        async def a_recipe() -> SomeClass:
+            return SomeClass()
+
+        @module.singleton
+        class B:
+            def __init__(self, a: SomeClass):
+                self.a = a
+
+        report = await module.awarmup()
+
+        assert [entry.classes for entry in report.entries] == [(SomeClass,), (B,)]
+        assert module.get_instance(B).a is module.get_instance(SomeClass)
+
     """
     aget_instance
     """
@@ -151,6 +607,28 @@ class TestModule:
         lazy_instance = module.get_lazy_instance(SomeClass)
         assert ~lazy_instance is None
 
+    def test_get_lazy_instance_with_module_update_return_new_injectable_instance(
+        self,
+        module,
+    ):
+        class A: ...
+
+        class B(A): ...
+
+        lazy_instance = module.get_lazy_instance(A)
+        assert ~lazy_instance is None
+
+        module.injectable(A)
+        assert isinstance(~lazy_instance, A)
+
+        other_module = Module()
+        other_module.injectable(B, on=A)
+        module.use(other_module, priority="high")
+        assert isinstance(~lazy_instance, B)
+
+        module.stop_using(other_module)
+        assert type(~lazy_instance) is A
+
     """
     set_constant
     """
@@ -1,3 +1,4 @@
 from .event_helper import EventHistory
+from .fork_helper import run_in_child_process
 
-__all__ = ("EventHistory",)
+__all__ = ("EventHistory", "run_in_child_process")
@@ -0,0 +1,17 @@
+import os
+from collections.abc import Callable
+
+
+def run_in_child_process(function: Callable[[], bool]) -> bool:
+    pid = os.fork()
+
+    if pid == 0:  # pragma: no cover
+        code = 1
+
+        try:
+            code = 0 if function() else 1
+        finally:
+            os._exit(code)
+
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status) == 0
@@ -1,6 +1,6 @@
 import pytest
 
-from injection import constant, get_instance
+from injection import constant, get_instance, mod
 
 
 class TestConstant:
@@ -12,6 +12,16 @@ class TestConstant:
         instance_2 = get_instance(SomeInjectable)
         assert instance_1 is instance_2 is not None
 
+    def test_constant_with_unlock(self):
+        @constant
+        class SomeInjectable: ...
+
+        instance = get_instance(SomeInjectable)
+        assert mod()[SomeInjectable].is_locked is False
+
+        mod().unlock()
+        assert get_instance(SomeInjectable) is instance
+
     def test_constant_with_on(self):
         class A: ...
 
@@ -4,7 +4,7 @@ from typing import Annotated, Any, Optional, TypeVar, Union
 
 import pytest
 
-from injection import inject, injectable
+from injection import Lazy, Module, inject, injectable, mod
 
 T = TypeVar("T")
 
@@ -20,6 +20,21 @@ class SomeInjectable: ...
 class SomeClass: ...
 
 
+lazy_cycle_module = Module()
+
+
+@lazy_cycle_module.injectable
+class LazyCycleA:
+    def __init__(self, b: "Lazy[LazyCycleB]"):
+        self.b = b
+
+
+@lazy_cycle_module.injectable
+class LazyCycleB:
+    def __init__(self, a: LazyCycleA):
+        self.a = a
+
+
 class TestInject:
     @classmethod
     def assert_inject(cls, annotation: Any):
@@ -50,6 +65,50 @@ class TestInject:
     def test_inject_with_optional(self):
         self.assert_inject(Optional[SomeInjectable])
 
+    def test_inject_with_lazy(self):
+        self.assert_inject(Lazy[SomeInjectable])
+
+    def test_inject_with_lazy_build_instance_on_first_access(self):
+        calls = []
+
+        @injectable
+        class Dependency:
+            def __init__(self):
+                calls.append(self)
+
+            def method(self):
+                return self
+
+        @inject
+        def my_function(dependency: Annotated[Dependency, Lazy], use: bool = False):
+            if use:
+                assert dependency.method() is dependency.method()
+
+        my_function()
+        assert not calls
+
+        my_function(use=True)
+        assert len(calls) == 1
+
+    def test_inject_with_lazy_keep_dependency_in_graph(self):
+        @injectable
+        class Dependency: ...
+
+        @injectable
+        class Service:
+            def __init__(self, dependency: Lazy[Dependency]): ...
+
+        nodes = {node.injectable: node for node in mod().get_dependency_graph()}
+        service = nodes[mod()[Service]]
+        assert service.dependencies == ()
+        assert service.lazy_dependencies == (mod()[Dependency],)
+
+    def test_inject_with_lazy_break_dependency_cycle(self):
+        lazy_cycle_module.get_dependency_graph().check()
+        a = lazy_cycle_module.get_instance(LazyCycleA)
+        assert isinstance(a.b, LazyCycleB)
+        assert isinstance(a.b.a, LazyCycleA)
+
     def test_inject_with_no_parameter(self):
         @inject
         def my_function(): ...
@@ -208,6 +267,34 @@ class TestInject:
         with pytest.raises(TypeError):
             my_function()
 
+    def test_inject_with_wrapped_function_attributes(self):
+        def my_function(instance: SomeInjectable) -> SomeInjectable:
+            """Docstring."""
+            return instance
+
+        function = inject(my_function)
+        assert function.__wrapped__ is my_function
+        assert function.__name__ == my_function.__name__
+        assert function.__qualname__ == my_function.__qualname__
+        assert function.__module__ == my_function.__module__
+        assert function.__doc__ == "Docstring."
+        assert function.__annotations__ == my_function.__annotations__
+
+    def test_inject_with_attributes_set_on_injected_function(self):
+        def my_function(instance: SomeInjectable): ...
+
+        function = pytest.mark.skip(inject(my_function))
+        function.custom = 1
+        function.__name__ = "renamed"
+        function.__doc__ = "Docstring."
+
+        assert function.custom == 1
+        assert function.__name__ == "renamed"
+        assert function.__doc__ == "Docstring."
+        assert [mark.name for mark in function.pytestmark] == ["skip"]
+        assert my_function.__name__ == "my_function"
+        assert not hasattr(my_function, "custom")
+
     def test_inject_with_self_injectable(self):
         @injectable
         class A:
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 import pytest
 from pydantic import BaseModel
 
-from injection import aget_instance, get_instance, injectable
+from injection import Module, aget_instance, get_instance, inject, injectable, singleton
 
 
 class TestInjectable:
@@ -194,3 +194,68 @@ class TestInjectable:
 
         a = get_instance(A)
         assert isinstance(a, A)
+
+    def test_injectable_with_transient_chain_build_new_instances(self):
+        @injectable
+        class A: ...
+
+        @injectable
+        class B:
+            def __init__(self, a: A, other_a: A):
+                self.a = a
+                self.other_a = other_a
+
+        @singleton
+        class S: ...
+
+        @injectable
+        class C:
+            def __init__(self, b: B, s: S, /):
+                self.b = b
+                self.s = s
+
+        @injectable
+        class D:
+            def __init__(self, b: B, c: C, s: S):
+                self.b = b
+                self.c = c
+                self.s = s
+
+        @inject
+        def function(d: D):
+            return d
+
+        d1 = function()
+        d2 = function()
+        assert d1 is not d2
+        assert d1.b is not d2.b
+        assert d1.b.a is not d1.b.other_a
+        assert isinstance(d1.c.b.a, A)
+        assert d1.s is d1.c.s is d2.s
+
+    def test_injectable_with_transient_chain_and_module_update(self):
+        module = Module()
+        other_module = Module()
+
+        @module.injectable
+        class A: ...
+
+        @other_module.injectable(on=A)
+        class OtherA(A): ...
+
+        @module.injectable
+        class B:
+            def __init__(self, a: A):
+                self.a = a
+
+        @module.inject
+        def function(b: B):
+            return b
+
+        assert type(function().a) is A
+
+        module.use(other_module, priority="high")
+        assert type(function().a) is OtherA
+
+        module.stop_using(other_module)
+        assert type(function().a) is A
@@ -0,0 +1,150 @@
+import asyncio
+from functools import partial
+from threading import Event, Thread
+from typing import Annotated
+
+import pytest
+
+from injection import Key, KeyedInjectable, Lazy, Module
+from injection.exceptions import InjectionError
+
+
+class Settings: ...
+
+
+class Client:
+    def __init__(self, region: str, settings: Settings):
+        self.region = region
+        self.settings = settings
+        self.is_closed = False
+
+    def close(self):
+        self.is_closed = True
+
+
+@pytest.fixture
+def module():
+    module = Module()
+    module.injectable(Settings)
+    return module
+
+
+class TestKeyedInjectable:
+    def test_keyed_with_key_parameter(self, module):
+        module.injectable(Client, cls=KeyedInjectable)
+
+        client_1 = module.get_instance(Client, key="eu-west")
+        client_2 = module.get_instance(Client, key="eu-west")
+        client_3 = module.get_instance(Client, key="us-east")
+        assert client_1 is client_2
+        assert client_1 is not client_3
+        assert client_1.region == "eu-west"
+        assert client_3.region == "us-east"
+        assert isinstance(client_1.settings, Settings)
+
+    async def test_keyed_with_async_key_parameter(self, module):
+        module.injectable(Client, cls=KeyedInjectable)
+
+        client_1 = await module.aget_instance(Client, key="eu-west")
+        client_2 = await module.aget_instance(Client, key="eu-west")
+        assert client_1 is client_2
+
+    def test_keyed_with_annotated_key(self, module):
+        module.injectable(Client, cls=KeyedInjectable)
+
+        @module.inject
+        def function(
+            eu: Annotated[Client, Key("eu-west")],
+            us: Annotated[Client, Key("us-east"), Lazy],
+        ):
+            return eu, us
+
+        eu, us = function()
+        assert eu.region == "eu-west"
+        assert us.region == "us-east"
+        assert eu is module.get_instance(Client, key="eu-west")
+
+    def test_keyed_with_lru_eviction(self, module):
+        module.injectable(
+            Client,
+            cls=partial(KeyedInjectable, max_size=2, on_evict=Client.close),
+        )
+
+        client_1 = module.get_instance(Client, key=1)
+        client_2 = module.get_instance(Client, key=2)
+        module.get_instance(Client, key=1)
+        client_3 = module.get_instance(Client, key=3)
+
+        assert client_2.is_closed
+        assert not client_1.is_closed
+        assert not client_3.is_closed
+        assert module.get_instance(Client, key=1) is client_1
+        assert module.get_instance(Client, key=2) is not client_2
+
+    async def test_keyed_with_concurrent_async_resolutions_build_once(self):
+        module = Module()
+        calls = []
+
+        @module.injectable(cls=KeyedInjectable)
+        async def recipe(region: str) -> Client:
+            await asyncio.sleep(0.01)
+            client = Client(region, Settings())
+            calls.append(client)
+            return client
+
+        clients = await asyncio.gather(
+            *(module.aget_instance(Client, key="eu-west") for _ in range(10))
+        )
+        assert calls == [clients[0]]
+        assert all(client is calls[0] for client in clients)
+
+    def test_keyed_with_slow_factory_not_block_other_keys(self):
+        module = Module()
+        started = Event()
+        released = Event()
+
+        @module.injectable(cls=KeyedInjectable)
+        def recipe(region: int) -> Client:
+            if region == 1:
+                started.set()
+                assert released.wait(5)
+
+            return Client(region, Settings())
+
+        slow = Thread(target=module.get_instance, args=(Client,), kwargs={"key": 1})
+        slow.start()
+        clients = []
+
+        def fast():
+            clients.append(module.get_instance(Client, key=2))
+
+        try:
+            assert started.wait(5)
+            thread = Thread(target=fast)
+            thread.start()
+            thread.join(1)
+            assert len(clients) == 1
+        finally:
+            released.set()
+            slow.join()
+
+    def test_keyed_with_unlock_close_instances(self, module):
+        module.injectable(
+            Client,
+            cls=partial(KeyedInjectable, on_evict=Client.close),
+        )
+
+        client = module.get_instance(Client, key="eu-west")
+        module.unlock()
+        assert client.is_closed
+        assert module.get_instance(Client, key="eu-west") is not client
+
+    def test_keyed_without_key_raise_injection_error(self, module):
+        module.injectable(Client, cls=KeyedInjectable)
+
+        with pytest.raises(InjectionError):
+            module.get_instance(Client)
+
+    def test_key_parameter_with_other_injectable_raise_type_error(self, module):
+        with pytest.raises(TypeError):
+            module.get_instance(Settings, key="eu-west")
@@ -0,0 +1,185 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+from injection import Module, PooledInjectable
+from injection.exceptions import ScopeUndefinedError
+
+
+class Engine:
+    def __init__(self):
+        self.is_closed = False
+
+
+class Session:
+    def __init__(self, engine: Engine):
+        self.engine = engine
+
+
+class TestLifespan:
+    def test_lifespan_with_generator_singleton(self):
+        module = Module()
+
+        @module.singleton
+        def engine_factory() -> Iterator[Engine]:
+            engine = Engine()
+            yield engine
+            engine.is_closed = True
+
+        with module.lifespan() as report:
+            engine = module.get_instance(Engine)
+            assert module.get_instance(Engine) is engine
+            assert not engine.is_closed
+            assert len(report.entries) == 1
+
+        assert engine.is_closed
+
+        with module.lifespan():
+            assert module.get_instance(Engine) is not engine
+
+    def test_lifespan_close_in_reverse_dependency_order(self):
+        module = Module()
+        events = []
+
+        @module.singleton
+        def engine_factory() -> Iterator[Engine]:
+            yield Engine()
+            events.append("engine")
+
+        @module.singleton
+        def session_factory(engine: Engine) -> Iterator[Session]:
+            yield Session(engine)
+            events.append("session")
+
+        with module.lifespan():
+            session = module.get_instance(Session)
+
+        assert events == ["session", "engine"]
+        assert isinstance(session.engine, Engine)
+
+    def test_lifespan_with_unlock_raise_runtime_error(self):
+        module = Module()
+
+        @module.singleton
+        def engine_factory() -> Iterator[Engine]:
+            yield Engine()
+
+        with module.lifespan():
+            with pytest.raises(RuntimeError):
+                module.unlock()
+
+    def test_generator_singleton_without_lifespan_raise_scope_undefined_error(self):
+        module = Module()
+
+        @module.singleton
+        def engine_factory() -> Iterator[Engine]:
+            yield Engine()
+
+        with pytest.raises(ScopeUndefinedError):
+            module.get_instance(Engine)
+
+    async def test_alifespan_build_async_generator_singletons_concurrently(self):
+        module = Module()
+        events = []
+
+        @module.singleton
+        async def engine_factory() -> AsyncIterator[Engine]:
+            events.append("engine:start")
+            await asyncio.sleep(0.01)
+            events.append("engine:end")
+            yield Engine()
+            events.append("engine:close")
+
+        @module.singleton
+        async def session_factory() -> AsyncIterator[Session]:
+            events.append("session:start")
+            await asyncio.sleep(0.01)
+            events.append("session:end")
+            yield Session(Engine())
+            events.append("session:close")
+
+        async with module.alifespan() as report:
+            assert len(report.entries) == 2
+            assert set(events[:2]) == {"engine:start", "session:start"}
+            session = await module.aget_instance(Session)
+
+        assert isinstance(session, Session)
+        assert {"engine:close", "session:close"} <= set(events)
+
+    def test_lifespan_unlock_singletons_depending_on_generator_singleton(self):
+        module = Module()
+
+        @module.singleton
+        def engine_factory() -> Iterator[Engine]:
+            engine = Engine()
+            yield engine
+            engine.is_closed = True
+
+        @module.singleton
+        class Repository:
+            def __init__(self, session: Session):
+                self.session = session
+
+        module.singleton(Session)
+
+        with module.lifespan():
+            repository = module.get_instance(Repository)
+
+        assert repository.session.engine.is_closed
+
+        with module.lifespan():
+            new_repository = module.get_instance(Repository)
+            assert new_repository is not repository
+            assert not new_repository.session.engine.is_closed
+
+    async def test_alifespan_unlock_singletons_depending_on_generator_singleton(
+        self,
+    ):
+        module = Module()
+
+        @module.singleton
+        async def engine_factory() -> AsyncIterator[Engine]:
+            yield Engine()
+
+        module.singleton(Session)
+
+        async with module.alifespan():
+            session = await module.aget_instance(Session)
+
+        async with module.alifespan():
+            assert await module.aget_instance(Session) is not session
+
+    def test_lifespan_unlock_pooled_depending_on_generator_singleton(self):
+        module = Module()
+
+        @module.singleton
+        def engine_factory() -> Iterator[Engine]:
+            engine = Engine()
+            yield engine
+            engine.is_closed = True
+
+        module.injectable(Session, cls=PooledInjectable)
+
+        @module.inject
+        def function(session: Session):
+            return session
+
+        with module.lifespan():
+            session = function()
+
+        assert session.engine.is_closed
+
+        with module.lifespan():
+            new_session = function()
+            assert new_session is not session
+            assert not new_session.engine.is_closed
+
+    def test_generator_singleton_with_fork_unsafe_raise_value_error(self):
+        module = Module()
+
+        def engine_factory() -> Iterator[Engine]:
+            yield Engine()
+
+        with pytest.raises(ValueError):
+            module.singleton(engine_factory, fork_safe=False)
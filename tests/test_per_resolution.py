@@ -0,0 +1,74 @@
+from injection import aget_instance, get_instance, inject, injectable, per_resolution
+
+
+class TestPerResolution:
+    def test_per_resolution_with_success(self):
+        @per_resolution
+        class SomeInjectable: ...
+
+        instance_1 = get_instance(SomeInjectable)
+        instance_2 = get_instance(SomeInjectable)
+        assert isinstance(instance_1, SomeInjectable)
+        assert instance_1 is not instance_2
+
+    def test_per_resolution_with_shared_dependency(self):
+        @per_resolution
+        class UnitOfWork: ...
+
+        @injectable
+        class ServiceA:
+            def __init__(self, uow: UnitOfWork):
+                self.uow = uow
+
+        @injectable
+        class ServiceB:
+            def __init__(self, a: ServiceA, uow: UnitOfWork):
+                self.a = a
+                self.uow = uow
+
+        @inject
+        def function(a: ServiceA, b: ServiceB, uow: UnitOfWork):
+            return a, b, uow
+
+        a, b, uow = function()
+        assert a.uow is b.uow is b.a.uow is uow
+
+        _, _, other_uow = function()
+        assert other_uow is not uow
+
+    def test_per_resolution_with_injected_call_in_function_body(self):
+        @per_resolution
+        class UnitOfWork: ...
+
+        @inject
+        def nested(uow: UnitOfWork):
+            return uow
+
+        @inject
+        def function(uow: UnitOfWork):
+            return uow, nested()
+
+        uow, nested_uow = function()
+        assert uow is not nested_uow
+
+    async def test_per_resolution_with_async_recipe(self):
+        class UnitOfWork: ...
+
+        @per_resolution
+        async def recipe() -> UnitOfWork:
+            return UnitOfWork()
+
+        @injectable
+        class Service:
+            def __init__(self, uow: UnitOfWork):
+                self.uow = uow
+
+        @inject
+        async def function(service: Service, uow: UnitOfWork):
+            return service, uow
+
+        instance = await aget_instance(UnitOfWork)
+        assert isinstance(instance, UnitOfWork)
+
+        service, uow = await function()
+        assert service.uow is uow
@@ -0,0 +1,221 @@
+import asyncio
+from functools import partial
+from threading import Thread
+
+import pytest
+
+from injection import (
+    Module,
+    PooledInjectable,
+    define_scope,
+    get_instance,
+    injectable,
+    mod,
+)
+from injection.exceptions import PoolTimeoutError
+
+
+class Parser:
+    def __init__(self):
+        self.buffer = []
+
+    def reset(self):
+        self.buffer.clear()
+
+
+class TestPooledInjectable:
+    def test_pooled_with_success(self):
+        module = Module()
+        module.injectable(Parser, cls=partial(PooledInjectable, reset=Parser.reset))
+
+        @module.inject
+        def function(parser: Parser):
+            parser.buffer.append(1)
+            return parser
+
+        parser_1 = function()
+        parser_2 = function()
+        assert parser_1 is parser_2
+        assert parser_1.buffer == []
+
+        metrics = module.get_pool_metrics(Parser)
+        assert metrics.size == 1
+        assert metrics.idle == 1
+        assert metrics.in_use == 0
+        assert metrics.misses == 1
+        assert metrics.hits == 1
+
+    def test_pooled_with_several_dependencies_in_same_call(self):
+        module = Module()
+        module.injectable(Parser, cls=PooledInjectable)
+
+        @module.inject
+        def function(parser_1: Parser, parser_2: Parser):
+            assert module.get_pool_metrics(Parser).in_use == 2
+            return parser_1, parser_2
+
+        parser_1, parser_2 = function()
+        assert parser_1 is not parser_2
+        assert module.get_pool_metrics(Parser).idle == 2
+
+    def test_pooled_with_exception_return_instance_to_pool(self):
+        module = Module()
+        module.injectable(Parser, cls=PooledInjectable)
+
+        @module.inject
+        def function(parser: Parser):
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            function()
+
+        assert module.get_pool_metrics(Parser).idle == 1
+
+    def test_pooled_with_failing_reset_discard_instance(self):
+        module = Module()
+
+        def reset(parser: Parser):
+            raise RuntimeError
+
+        module.injectable(Parser, cls=partial(PooledInjectable, reset=reset))
+
+        @module.inject
+        def function(parser: Parser):
+            return parser
+
+        function()
+        metrics = module.get_pool_metrics(Parser)
+        assert metrics.size == 0
+        assert metrics.discarded == 1
+
+    def test_pooled_with_exhausted_pool_wait(self):
+        module = Module()
+        module.injectable(
+            Parser,
+            cls=partial(PooledInjectable, max_size=1, timeout=5),
+        )
+        results = []
+
+        @module.inject
+        def function(parser: Parser):
+            results.append(parser)
+
+        @module.inject
+        def blocking(parser: Parser):
+            thread = Thread(target=function)
+            thread.start()
+            thread.join(0.05)
+            assert not results
+            return parser, thread
+
+        parser, thread = blocking()
+        thread.join()
+        assert results == [parser]
+        assert module.get_pool_metrics(Parser).waits == 1
+
+    def test_pooled_with_timeout_raise_pool_timeout_error(self):
+        module = Module()
+        module.injectable(
+            Parser,
+            cls=partial(PooledInjectable, max_size=1, timeout=0.01),
+        )
+
+        @module.inject
+        def function(parser_1: Parser, parser_2: Parser): ...
+
+        with pytest.raises(PoolTimeoutError):
+            function()
+
+        assert module.get_pool_metrics(Parser).idle == 1
+
+    def test_pooled_with_scope_name(self):
+        module = Module()
+        module.injectable(
+            Parser,
+            cls=partial(PooledInjectable, scope_name="pool-test"),
+        )
+
+        with define_scope("pool-test"):
+            parser = module.get_instance(Parser)
+            assert module.get_pool_metrics(Parser).in_use == 1
+
+        assert module.get_pool_metrics(Parser).idle == 1
+        assert isinstance(parser, Parser)
+
+    def test_pooled_without_injected_call_hand_over_instance(self):
+        injectable(Parser, cls=PooledInjectable)
+        assert get_instance(Parser) is not get_instance(Parser)
+        assert mod().get_pool_metrics(Parser).size == 0
+
+    async def test_pooled_with_async_injected_function(self):
+        module = Module()
+        module.injectable(Parser, cls=partial(PooledInjectable, max_size=1))
+
+        @module.inject
+        async def function(parser: Parser):
+            await asyncio.sleep(0)
+            assert module.get_pool_metrics(Parser).in_use == 1
+            return parser
+
+        parser_1, parser_2 = await asyncio.gather(function(), function())
+        assert parser_1 is parser_2
+        assert module.get_pool_metrics(Parser).idle == 1
+
+    def test_pooled_with_generator_function_release_instance_once_exhausted(self):
+        module = Module()
+        module.injectable(Parser, cls=PooledInjectable)
+
+        @module.inject
+        def function(parser: Parser):
+            yield parser
+            yield parser
+
+        iterator = function()
+        assert next(iterator) is next(iterator)
+        assert module.get_pool_metrics(Parser).in_use == 1
+
+        assert list(iterator) == []
+        assert module.get_pool_metrics(Parser).idle == 1
+
+    async def test_pooled_with_async_generator_function_release_instance_on_close(
+        self,
+    ):
+        module = Module()
+        module.injectable(Parser, cls=PooledInjectable)
+
+        @module.inject
+        async def function(parser: Parser):
+            while True:
+                yield parser
+
+        iterator = function()
+        assert await anext(iterator) is await anext(iterator)
+        assert module.get_pool_metrics(Parser).in_use == 1
+
+        await iterator.aclose()
+        assert module.get_pool_metrics(Parser).idle == 1
+
+    def test_pooled_with_singleton_dependent_hand_over_instance(self):
+        module = Module()
+        module.injectable(Parser, cls=PooledInjectable)
+
+        @module.singleton
+        class Service:
+            def __init__(self, parser: Parser):
+                self.parser = parser
+
+        @module.inject
+        def function(service: Service, parser: Parser):
+            return service, parser
+
+        service, parser = function()
+        assert service.parser is not parser
+        assert module.get_pool_metrics(Parser).size == 1
+        assert function()[1] is parser
+
+    def test_get_pool_metrics_with_other_injectable_raise_type_error(self):
+        module = Module()
+        module.injectable(Parser)
+
+        with pytest.raises(TypeError):
+            module.get_pool_metrics(Parser)
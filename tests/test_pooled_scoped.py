@@ -0,0 +1,165 @@
+import asyncio
+from functools import partial
+from threading import Thread
+from time import sleep
+
+from injection import (
+    Module,
+    PooledScopedInjectable,
+    ResourcePool,
+    adefine_scope,
+    define_scope,
+)
+from injection.exceptions import PoolTimeoutError
+
+
+class Connection:
+    def __init__(self):
+        self.is_closed = False
+        self.queries = []
+
+    def close(self):
+        self.is_closed = True
+
+    def rollback(self):
+        self.queries.clear()
+
+
+class TestPooledScopedInjectable:
+    def test_pooled_scoped_with_success(self):
+        module = Module()
+        pool = ResourcePool(reset=Connection.rollback)
+        module.injectable(
+            Connection,
+            cls=partial(PooledScopedInjectable, scope_name="db", pool=pool),
+        )
+
+        with define_scope("db"):
+            connection_1 = module.get_instance(Connection)
+            assert module.get_instance(Connection) is connection_1
+            connection_1.queries.append("SELECT 1")
+            assert pool.metrics.in_use == 1
+
+        assert connection_1.queries == []
+        assert pool.metrics.idle == 1
+
+        with define_scope("db"):
+            connection_2 = module.get_instance(Connection)
+
+        assert connection_2 is connection_1
+        assert module.get_pool_metrics(Connection).hits == 1
+
+    def test_pooled_scoped_with_exhausted_pool_raise_pool_timeout_error(self):
+        module = Module()
+        pool = ResourcePool(max_size=1, timeout=0.01)
+        module.injectable(
+            Connection,
+            cls=partial(PooledScopedInjectable, scope_name="db", pool=pool),
+        )
+
+        errors = []
+
+        def handler():
+            with define_scope("db"):
+                try:
+                    module.get_instance(Connection)
+                except PoolTimeoutError as exc:
+                    errors.append(exc)
+
+        with define_scope("db"):
+            module.get_instance(Connection)
+            thread = Thread(target=handler)
+            thread.start()
+            thread.join()
+
+        assert len(errors) == 1
+        assert pool.metrics.idle == 1
+
+    async def test_pooled_scoped_with_concurrent_scopes(self):
+        module = Module()
+        pool = ResourcePool(max_size=1, timeout=5)
+        module.injectable(
+            Connection,
+            cls=partial(PooledScopedInjectable, scope_name="db", pool=pool),
+        )
+
+        async def handler():
+            async with adefine_scope("db"):
+                connection = await module.aget_instance(Connection)
+                await asyncio.sleep(0.01)
+                return connection
+
+        connection_1, connection_2 = await asyncio.gather(handler(), handler())
+        assert connection_1 is connection_2
+        assert pool.metrics.waits == 1
+        assert pool.metrics.size == 1
+
+    def test_pooled_scoped_with_idle_timeout_close_connection(self):
+        module = Module()
+        pool = ResourcePool(idle_timeout=0.01, close=Connection.close)
+        module.injectable(
+            Connection,
+            cls=partial(PooledScopedInjectable, scope_name="db", pool=pool),
+        )
+
+        with define_scope("db"):
+            connection_1 = module.get_instance(Connection)
+
+        sleep(0.02)
+
+        with define_scope("db"):
+            connection_2 = module.get_instance(Connection)
+
+        assert connection_2 is not connection_1
+        assert connection_1.is_closed
+        assert pool.metrics.evicted == 1
+
+    def test_pooled_scoped_lifetime_is_pooled(self):
+        module = Module()
+        module.injectable(
+            Connection,
+            cls=partial(PooledScopedInjectable, scope_name="db"),
+        )
+
+        nodes = {node.classes: node for node in module.get_dependency_graph()}
+        assert nodes[(Connection,)].lifetime == "pooled"
+
+
+class TestResourcePool:
+    def test_clear_count_evicted_resources(self):
+        pool = ResourcePool(close=Connection.close)
+        connection = pool.acquire(Connection)
+        pool.release(connection)
+
+        pool.clear()
+        assert connection.is_closed
+        assert pool.metrics.size == 0
+        assert pool.metrics.evicted == 1
+
+    async def test_aacquire_with_lost_race_keep_turn(self):
+        pool = ResourcePool(max_size=1)
+
+        async def create():
+            return Connection()
+
+        connection = pool.acquire(Connection)
+        first = asyncio.create_task(pool.aacquire(create))
+        await asyncio.sleep(0)
+
+        pool.release(connection)
+        stolen = pool.acquire(Connection)
+        second = asyncio.create_task(pool.aacquire(create))
+
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        pool.release(stolen)
+
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert first.done()
+        assert not second.done()
+
+        pool.release(await first)
+        assert await second is connection
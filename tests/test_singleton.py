@@ -1,9 +1,11 @@
+import os
 from dataclasses import dataclass
 
 import pytest
 from pydantic import BaseModel
 
-from injection import aget_instance, get_instance, singleton
+from injection import aget_instance, get_instance, inject, mod, singleton
+from tests.helpers import run_in_child_process
 
 
 class TestSingleton:
@@ -150,6 +152,42 @@ class TestSingleton:
         assert isinstance(a, A)
         assert isinstance(b, B)
 
+    def test_singleton_with_inject_and_unlock(self):
+        @singleton
+        class SomeInjectable: ...
+
+        @inject
+        def function(instance: SomeInjectable):
+            return instance
+
+        instance_1 = function()
+        assert function() is instance_1
+
+        mod().unlock()
+        instance_2 = function()
+        assert instance_2 is not instance_1
+        assert function() is instance_2
+
+    def test_singleton_with_inject_and_override_after_unlock(self):
+        class A: ...
+
+        @singleton
+        class B:
+            def __init__(self, a: A):
+                self.a = a
+
+        singleton(A)
+        instance_1 = get_instance(B)
+
+        mod().unlock()
+
+        @singleton(on=A, mode="override")
+        class C(A): ...
+
+        instance_2 = get_instance(B)
+        assert type(instance_1.a) is A
+        assert type(instance_2.a) is C
+
     def test_singleton_with_injectable_already_exist_raise_runtime_error(self):
         class A: ...
 
@@ -183,3 +221,20 @@ class TestSingleton:
 
         a = get_instance(A)
         assert isinstance(a, C)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires `os.fork`.")
+    def test_singleton_with_fork_unsafe(self):
+        @singleton
+        class Safe: ...
+
+        @singleton(fork_safe=False)
+        class Unsafe: ...
+
+        safe = get_instance(Safe)
+        unsafe = get_instance(Unsafe)
+
+        def child() -> bool:
+            return get_instance(Safe) is safe and get_instance(Unsafe) is not unsafe
+
+        assert run_in_child_process(child)
+        assert get_instance(Unsafe) is unsafe
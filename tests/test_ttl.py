@@ -0,0 +1,163 @@
+import asyncio
+import time
+from functools import partial
+from threading import Event
+
+import pytest
+
+from injection import Module, TTLInjectable
+
+
+class Credentials: ...
+
+
+class TestTTLInjectable:
+    def test_ttl_with_success(self):
+        module = Module()
+        module.injectable(Credentials, cls=partial(TTLInjectable, ttl=60))
+
+        instance_1 = module.get_instance(Credentials)
+        instance_2 = module.get_instance(Credentials)
+        assert instance_1 is instance_2
+        assert not module.is_locked
+
+    def test_ttl_with_expired_instance_rebuild_instance(self):
+        module = Module()
+        module.injectable(Credentials, cls=partial(TTLInjectable, ttl=0.01))
+
+        instance_1 = module.get_instance(Credentials)
+        time.sleep(0.02)
+        instance_2 = module.get_instance(Credentials)
+        assert instance_1 is not instance_2
+
+    def test_ttl_with_refresh_ahead_return_current_instance(self):
+        module = Module()
+        refreshed = Event()
+        calls = []
+
+        @module.injectable(cls=partial(TTLInjectable, ttl=10, refresh_ahead=9.99))
+        def recipe() -> Credentials:
+            if calls:
+                refreshed.wait(5)
+
+            instance = Credentials()
+            calls.append(instance)
+            return instance
+
+        instance_1 = module.get_instance(Credentials)
+        time.sleep(0.02)
+        assert module.get_instance(Credentials) is instance_1
+
+        refreshed.set()
+
+        for _ in range(100):
+            if len(calls) == 2:
+                break
+
+            time.sleep(0.01)
+
+        assert len(calls) == 2
+        assert module.get_instance(Credentials) is calls[1]
+
+    async def test_ttl_with_async_refresh_ahead(self):
+        module = Module()
+
+        @module.injectable(cls=partial(TTLInjectable, ttl=10, refresh_ahead=9.99))
+        async def recipe() -> Credentials:
+            return Credentials()
+
+        instance_1 = await module.aget_instance(Credentials)
+        await asyncio.sleep(0.02)
+        assert await module.aget_instance(Credentials) is instance_1
+
+        await asyncio.sleep(0.01)
+        instance_2 = await module.aget_instance(Credentials)
+        assert instance_2 is not instance_1
+
+    def test_ttl_with_unlock_rebuild_instance(self):
+        module = Module()
+        module.injectable(Credentials, cls=partial(TTLInjectable, ttl=60))
+
+        instance_1 = module.get_instance(Credentials)
+        module.unlock()
+        assert module.get_instance(Credentials) is not instance_1
+
+    def test_ttl_with_invalid_refresh_ahead_raise_value_error(self):
+        module = Module()
+
+        with pytest.raises(ValueError):
+            module.injectable(
+                Credentials,
+                cls=partial(TTLInjectable, ttl=1, refresh_ahead=2),
+            )
+
+    async def test_ttl_with_concurrent_expired_instance_build_once(self):
+        module = Module()
+        calls = []
+
+        @module.injectable(cls=partial(TTLInjectable, ttl=60))
+        async def recipe() -> Credentials:
+            await asyncio.sleep(0.01)
+            instance = Credentials()
+            calls.append(instance)
+            return instance
+
+        instances = await asyncio.gather(
+            *(module.aget_instance(Credentials) for _ in range(10))
+        )
+        assert calls == [instances[0]]
+        assert all(instance is calls[0] for instance in instances)
+
+    async def test_ttl_with_failing_refresh_log_and_back_off(self, caplog):
+        module = Module()
+        calls = []
+
+        @module.injectable(
+            cls=partial(TTLInjectable, ttl=10, refresh_ahead=9.99, backoff=60),
+        )
+        async def recipe() -> Credentials:
+            calls.append(None)
+
+            if len(calls) > 1:
+                raise RuntimeError
+
+            return Credentials()
+
+        instance = await module.aget_instance(Credentials)
+        await asyncio.sleep(0.02)
+
+        for _ in range(3):
+            assert await module.aget_instance(Credentials) is instance
+            await asyncio.sleep(0.01)
+
+        assert len(calls) == 2
+        assert "Failed to refresh" in caplog.text
+
+    async def test_ttl_with_unlock_during_refresh_ignore_stale_instance(self):
+        module = Module()
+        refreshed = asyncio.Event()
+        calls = []
+
+        @module.injectable(cls=partial(TTLInjectable, ttl=10, refresh_ahead=9.99))
+        async def recipe() -> Credentials:
+            if len(calls) == 1:
+                calls.append(None)
+                await refreshed.wait()
+
+            instance = Credentials()
+            calls.append(instance)
+            return instance
+
+        instance_1 = await module.aget_instance(Credentials)
+        await asyncio.sleep(0.02)
+        assert await module.aget_instance(Credentials) is instance_1
+        await asyncio.sleep(0)
+
+        module.unlock()
+        instance_2 = await module.aget_instance(Credentials)
+        assert instance_2 is not instance_1
+
+        refreshed.set()
+        await asyncio.sleep(0.01)
+        assert len(calls) == 4
+        assert await module.aget_instance(Credentials) is instance_2
@@ -0,0 +1,5 @@
+from injection import mod
+
+
+@mod("test_make_manifest").injectable
+class SomeProvider: ...
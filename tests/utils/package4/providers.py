@@ -0,0 +1,36 @@
+from functools import partial
+
+from injection import PooledInjectable, TTLInjectable, mod
+
+module = mod("test_generate_wiring")
+
+
+@module.singleton
+class Database: ...
+
+
+@module.injectable
+class Repository:
+    def __init__(self, database: Database, page_size: int = 10):
+        self.database = database
+
+
+@module.scoped("test")
+class Session: ...
+
+
+@module.per_resolution
+class UnitOfWork: ...
+
+
+@module.injectable(cls=PooledInjectable)
+class Parser: ...
+
+
+@module.injectable(cls=partial(TTLInjectable, ttl=60))
+class Credentials: ...
+
+
+@module.inject
+def find_page(page: int, repository: Repository, *, database: Database):
+    return page, repository, database
@@ -1,3 +1,4 @@
+import json
 import sys
 
 from injection.utils import load_modules_with_keywords
@@ -12,3 +13,18 @@ class TestLoadModulesWithKeywords:
         assert "tests.utils.package2.sub_package.injectable" in loaded_modules
         assert "tests.utils.package2.sub_package.injectable" in sys.modules
         assert "tests.utils.package2.module" not in sys.modules
+
+    def test_load_modules_with_keywords_with_cache_file(self, tmp_path):
+        from tests.utils import package2
+
+        cache_file = tmp_path / "cache.json"
+
+        for _ in range(2):
+            loaded_modules = load_modules_with_keywords(package2, cache_file=cache_file)
+            assert list(loaded_modules) == [
+                "tests.utils.package2.sub_package.injectable"
+            ]
+
+        data = json.loads(cache_file.read_text())
+        assert len(data["files"]) == 2
+        assert sum(entry[2] for entry in data["files"].values()) == 1
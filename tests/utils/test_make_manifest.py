@@ -0,0 +1,14 @@
+from injection import mod
+from injection.utils import make_manifest
+
+
+class TestMakeManifest:
+    def test_make_manifest_with_success(self):
+        from tests.utils import package3
+
+        manifest = make_manifest(package3, module=mod("test_make_manifest"))
+        assert manifest == {
+            "tests.utils.package3.providers.SomeProvider": [
+                "tests.utils.package3.providers",
+            ],
+        }
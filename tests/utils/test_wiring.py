@@ -0,0 +1,66 @@
+import sys
+
+from injection import Module
+from injection.utils import check_wiring, generate_wiring
+from tests.utils.package4.providers import Database, Repository, find_page, module
+
+
+class TestGenerateWiring:
+    def test_generate_wiring_with_success(self, monkeypatch, tmp_path):
+        source = generate_wiring(module)
+        skipped = source.split("# Not wired:\n")[1].splitlines()
+        assert "# scoped: tests.utils.package4.providers.Session" in skipped
+        assert "# per_resolution: tests.utils.package4.providers.UnitOfWork" in skipped
+        assert "# pooled: tests.utils.package4.providers.Parser" in skipped
+        assert "# ttl: tests.utils.package4.providers.Credentials" in skipped
+
+        monkeypatch.syspath_prepend(tmp_path)
+        (tmp_path / "generated_wiring.py").write_text(source)
+
+        try:
+            import generated_wiring
+
+            repository = generated_wiring.get_instance(Repository)
+            assert isinstance(repository, Repository)
+            assert repository.database is generated_wiring.get_instance(Database)
+
+            function = generated_wiring.get_function(find_page)
+            page, repository, database = function(1)
+            assert page == 1
+            assert isinstance(repository, Repository)
+            assert database is generated_wiring.get_instance(Database)
+            assert function(2, repository)[1] is repository
+        finally:
+            sys.modules.pop("generated_wiring", None)
+
+    def test_generate_wiring_with_dependency_without_class(self):
+        first_module = Module()
+        second_module = Module()
+        module = Module()
+        module.use(first_module)
+        module.use(second_module)
+
+        @first_module.injectable
+        @second_module.injectable
+        class A: ...
+
+        @second_module.injectable
+        class B:
+            def __init__(self, a: A): ...
+
+        second_module.get_instance(B)
+        source = generate_wiring(module)
+        assert source.count(f"# transient: {A.__module__}.{A.__qualname__}\n") == 2
+        assert " object at " not in source
+
+
+class TestCheckWiring:
+    def test_check_wiring_with_success(self, tmp_path):
+        path = tmp_path / "wiring.py"
+        assert check_wiring(path, module) is False
+
+        path.write_text(generate_wiring(module))
+        assert check_wiring(path, module) is True
+
+        path.write_text("")
+        assert check_wiring(path, module) is False